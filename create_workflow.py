@@ -1,13 +1,16 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.patches import Circle
-import matplotlib.colors as mcolors
+import hashlib
+import importlib.util
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape
 
-# Thiết lập trang với phong cách Apple
-plt.figure(figsize=(12, 6))
-plt.style.use('default')
-ax = plt.subplot(111)
-ax.set_facecolor('#ffffff')
+# Đường dẫn đầu ra (Output paths)
+svg_path = Path('assets/images/workflow_refined.svg')
+png_path = Path('assets/images/workflow_refined.png')
+key_path = Path('assets/images/workflow_refined.svg.key')
+png_key_path = Path('assets/images/workflow_refined.png.key')
 
 # Định nghĩa màu theo phong cách Apple
 apple_colors = [
@@ -33,52 +36,97 @@ steps = [
     'Xuất kết quả\nExport Results'
 ]
 
-# Vẽ quy trình theo chiều dọc
+# Bố cục theo chiều dọc (Vertical layout), đơn vị là pixel của viewBox
+width = 1200
+radius = 30
+x_position = 480
+y_start = 140
+y_step = 80
 num_steps = len(steps)
-y_positions = np.linspace(0.2, 0.8, num_steps)
-x_position = 0.5
+y_positions = [y_start + i * y_step for i in range(num_steps)]
+height = y_positions[-1] + radius + 70
 
-# Thêm tiêu đề
-plt.text(0.5, 0.95, 'Quy trình phân tích tiềm năng gió', fontsize=18, weight='bold', ha='center', va='center')
-plt.text(0.5, 0.9, 'Wind Potential Analysis Workflow', fontsize=16, alpha=0.8, ha='center', va='center')
+font = "-apple-system, 'SF Pro Display', 'Helvetica Neue', Arial, sans-serif"
 
-# Vẽ các node và liên kết
-for i, (step, color, y) in enumerate(zip(steps, apple_colors, y_positions)):
-    # Vẽ node
-    circle = Circle((x_position, y), 0.05, color=color, alpha=0.85)
-    ax.add_patch(circle)
-    
-    # Bóng mờ nhẹ (subtle shadow) cho hiệu ứng 3D
-    shadow = Circle((x_position+0.0015, y-0.0015), 0.05, color='#00000020', alpha=0.2, zorder=1)
-    ax.add_patch(shadow)
-    
-    # Đường viền sáng (highlight) ở phía trên
-    highlight = Circle((x_position, y), 0.05, color=color, alpha=0.3, fill=False, linewidth=2)
-    ax.add_patch(highlight)
-    
-    # Thêm số thứ tự
-    plt.text(x_position, y, str(i+1), color='white', ha='center', va='center', fontsize=14, weight='bold')
-    
-    # Thêm tên bước
-    plt.text(x_position + 0.07, y, step.split('\n')[0], ha='left', va='center', fontsize=11, weight='bold')
-    plt.text(x_position + 0.07, y - 0.02, step.split('\n')[1], ha='left', va='center', fontsize=10, color='#666666')
-    
-    # Vẽ đường nối giữa các node
-    if i < num_steps - 1:
-        plt.plot([x_position, x_position], [y-0.05, y_positions[i+1]+0.05], 
-                color='#D1D1D6', linewidth=2, linestyle='-', alpha=0.8)
+# Bỏ qua nếu nội dung không thay đổi kể từ lần tạo trước
+# (Skip if nothing changed since the last generation)
+# Khóa gồm cả mã nguồn script để thay đổi cách vẽ cũng tạo lại hình (Key includes this script's source too)
+key = hashlib.blake2b(repr((steps, apple_colors, width, radius, x_position, y_positions, font)).encode('utf-8')
+                      + Path(__file__).read_bytes(), digest_size=8).hexdigest()
+def _is_current(path, path_key):
+    # File đầu ra tồn tại và được tạo từ đúng khóa này (The output exists and was built from this key)
+    return path.exists() and path_key.exists() and path_key.read_text().strip() == key
+
+# PNG có khóa riêng: chỉ coi là mới khi đã thực sự xuất được (The PNG has its own key: only current once actually exported)
+can_export_png = importlib.util.find_spec('cairosvg') is not None or shutil.which('rsvg-convert') is not None
+if _is_current(svg_path, key_path) and (_is_current(png_path, png_key_path) or not can_export_png):
+    print(f'Workflow không thay đổi, giữ nguyên: {svg_path}')
+    print(f'Workflow unchanged, keeping: {svg_path}')
+    sys.exit(0)
+
+# Ghi trực tiếp SVG thay vì vẽ bằng matplotlib (Emit SVG directly instead of rendering with matplotlib)
+parts = [
+    f'<svg viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+    f'xmlns="http://www.w3.org/2000/svg" font-family="{font}">',
+    f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+    # Thêm tiêu đề
+    f'<text x="{width / 2}" y="50" font-size="30" font-weight="bold" text-anchor="middle">'
+    'Quy trình phân tích tiềm năng gió</text>',
+    f'<text x="{width / 2}" y="88" font-size="24" fill-opacity="0.8" text-anchor="middle">'
+    'Wind Potential Analysis Workflow</text>',
+]
+
+# Vẽ đường nối giữa các node trước để nằm dưới các node, gộp thành một path duy nhất
+# (Draw all connectors first as a single path so they sit below the nodes)
+connectors = ' '.join(f'M{x_position} {y + radius}V{y_next - radius}'
+                      for y, y_next in zip(y_positions, y_positions[1:]))
+parts.append(f'<path d="{connectors}" stroke="#D1D1D6" stroke-width="3" stroke-opacity="0.8" fill="none"/>')
+
+# Vẽ các node và nhãn theo nhóm, thuộc tính chung khai báo một lần trên <g>
+# (Emit nodes and labels as groups so shared attributes are declared once per <g>)
+labels = [[escape(s) for s in step.split('\n')] for step in steps]
+parts.append('<g fill="#000" fill-opacity="0.12">')  # Bóng mờ nhẹ (subtle shadow) cho hiệu ứng 3D
+parts.extend(f'<circle cx="{x_position + 2}" cy="{y + 2}" r="{radius}"/>' for y in y_positions)
+parts.append('</g>')
+parts.append('<g fill-opacity="0.85">')
+parts.extend(f'<circle cx="{x_position}" cy="{y}" r="{radius}" fill="{color}"/>'
+             for color, y in zip(apple_colors, y_positions))
+parts.append('</g>')
+# Thêm số thứ tự
+parts.append('<g font-size="22" font-weight="bold" fill="#ffffff" text-anchor="middle">')
+parts.extend(f'<text x="{x_position}" y="{y}" dy="0.35em">{i + 1}</text>' for i, y in enumerate(y_positions))
+parts.append('</g>')
+# Thêm tên bước
+parts.append('<g font-size="18" font-weight="bold">')
+parts.extend(f'<text x="{x_position + 50}" y="{y - 4}">{vi}</text>' for (vi, _), y in zip(labels, y_positions))
+parts.append('</g>')
+parts.append('<g font-size="16" fill="#666666">')
+parts.extend(f'<text x="{x_position + 50}" y="{y + 18}">{en}</text>' for (_, en), y in zip(labels, y_positions))
+parts.append('</g>')
 
 # Thêm giải thích
-ax.text(0.05, 0.05, '© VietnamWind', fontsize=10, color='#8E8E93')
+parts.append(f'<text x="40" y="{height - 25}" font-size="16" fill="#8E8E93">© VietnamWind</text>')
+parts.append('</svg>')
+
+svg = '\n'.join(parts)
+
+# Lưu hình ảnh SVG
+svg_path.parent.mkdir(parents=True, exist_ok=True)
+svg_path.write_text(svg, encoding='utf-8')
+key_path.write_text(key + '\n')
+print(f'Đã tạo workflow mới theo phong cách Apple UI/UX: {svg_path}')
 
-# Thiết lập kích thước và tỷ lệ
-ax.set_xlim(0.15, 0.9)
-ax.set_ylim(0, 1)
-ax.set_aspect('equal')
-ax.axis('off')
+# Chuyển sang PNG nếu có công cụ (Rasterize to PNG if a converter is available)
+if importlib.util.find_spec('cairosvg') is not None:
+    import cairosvg
+    cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=str(png_path), scale=2)
+elif shutil.which('rsvg-convert'):
+    subprocess.run(['rsvg-convert', '--zoom', '2', '-o', str(png_path), str(svg_path)], check=True)
+else:
+    print('Không tìm thấy cairosvg hoặc rsvg-convert, bỏ qua xuất PNG.')
+    print('cairosvg or rsvg-convert not found, skipping PNG export.')
+    sys.exit(0)
 
-# Lưu hình ảnh
-plt.tight_layout()
-plt.savefig('assets/images/workflow_refined.png', dpi=300, bbox_inches='tight')
-plt.close()
-print('Đã tạo workflow mới theo phong cách Apple UI/UX.')
+# Chỉ ghi khóa PNG sau khi đã xuất thành công (Only write the PNG key after a successful export)
+png_key_path.write_text(key + '\n')
+print(f'Đã xuất PNG / PNG exported: {png_path}')
@@ -6,29 +6,127 @@ Demo cho công cụ phân tích tiềm năng gió tại Việt Nam
 (Demo for the Vietnam Wind Potential Analysis Tool)
 
 Các thư viện cần thiết:
-- NumPy, Pandas, GeoPandas, Matplotlib, Rasterio, Rasterstats, Fiona, Scipy
+- NumPy, Pandas, GeoPandas, Matplotlib, Rasterio, Fiona, Scipy
 - mpld3 (cho tính năng tương tác): pip install mpld3
 
 Required libraries:
-- NumPy, Pandas, GeoPandas, Matplotlib, Rasterio, Rasterstats, Fiona, Scipy
+- NumPy, Pandas, GeoPandas, Matplotlib, Rasterio, Fiona, Scipy
 - mpld3 (for interactive features): pip install mpld3
 """
 
 import os
 import sys
+import argparse
+import functools
+import hashlib
+import importlib.util
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Cấu hình bộ đệm GDAL trước lần mở raster đầu tiên
+# (Configure GDAL caching before the first raster is opened)
+os.environ.setdefault('GDAL_CACHEMAX', '512')
+os.environ.setdefault('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR')
+
 # Thêm thư mục hiện tại vào đường dẫn để có thể import
 # (Add current directory to path to be able to import)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Sửa lỗi import - Import trực tiếp từ file vietnamwind.py
-from vietnamwind import WindPotentialAnalyzer
-
 # Đường dẫn dữ liệu
 # (Data paths)
 DATA_DIR = Path('data')
 RESULTS_DIR = Path('results')
+WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m.tif'
+# Bản dạng tile có overview do prepare_data.py tạo (Tiled copy with overviews written by prepare_data.py)
+TILED_WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m_tiled.tif'
+# Bản uint8 do 'prepare_data.py --quantize' tạo (uint8 copy written by 'prepare_data.py --quantize')
+QUANTIZED_WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m_u8.tif'
+
+@functools.lru_cache(maxsize=4)
+def _load_analyzer(boundary_file, wind_file, province_file=None):
+    """
+    Đọc dữ liệu một lần cho mỗi tiến trình và tái sử dụng
+    (Load data once per process and reuse it)
+    """
+    # Import trễ để menu và kiểm tra file không phải tải toàn bộ thư viện GIS
+    # (Deferred import so the menu and file checks don't load the whole GIS stack)
+    from vietnamwind import WindPotentialAnalyzer
+    
+    analyzer = WindPotentialAnalyzer()
+    analyzer.load_data(boundary_file, wind_file)
+    if province_file is not None:
+        analyzer.load_provinces(province_file)
+    return analyzer
+
+def _wind_file():
+    """
+    Ưu tiên file gió đã được chuẩn bị: bản uint8, rồi bản dạng tile, cuối cùng là file gốc
+    (Prefer a prepared wind file: the uint8 copy, then the tiled copy, then the original)
+    """
+    for wind_file in (QUANTIZED_WIND_FILE, TILED_WIND_FILE):
+        if wind_file.exists():
+            return wind_file
+    return WIND_FILE
+
+def _get_analyzer(with_provinces=False):
+    """
+    Lấy đối tượng phân tích đã tải dữ liệu, xóa trạng thái của lần chạy trước
+    (Get a pre-loaded analyzer with the state of any previous run cleared)
+    
+    Parameters:
+    -----------
+    with_provinces : bool, optional
+        Có tải dữ liệu tỉnh/thành phố hay không
+        (Whether to also load province data)
+    """
+    province_file = DATA_DIR / 'vietnam_provinces.geojson' if with_provinces else None
+    analyzer = _load_analyzer(DATA_DIR / 'vietnam.geojson', _wind_file(), province_file)
+    analyzer.selected_region = None
+    analyzer.voronoi_polygons = None
+    return analyzer
+
+def _compute_wind_statistics(analyzer, cache_name, num_points=100):
+    """
+    Tạo đa giác Voronoi và thống kê gió, dùng lại bộ đệm Feather nếu các file dữ liệu không đổi
+    (Create Voronoi polygons and wind statistics, reusing a Feather cache while the data files are unchanged)
+    
+    Parameters:
+    -----------
+    analyzer : WindPotentialAnalyzer
+        Đối tượng phân tích đã chọn vùng (Analyzer with the region already selected)
+    cache_name : str
+        Tên vùng dùng trong tên file bộ đệm (Region name used in the cache file name)
+    num_points : int, optional
+        Số điểm Voronoi (Number of Voronoi points)
+    """
+    import geopandas as gpd
+    from vietnamwind import read_cache_file, write_cache_file
+    
+    # Khóa theo vùng, số điểm và thời điểm sửa file gió, ranh giới và tỉnh/thành phố
+    # (Key on region, point count and the wind, boundary and province files' modification times)
+    input_files = [Path(analyzer.demdata.name), DATA_DIR / 'vietnam.geojson', DATA_DIR / 'vietnam_provinces.geojson']
+    mtimes = [f.stat().st_mtime_ns for f in input_files if f.exists()]
+    key = hashlib.blake2b(repr(mtimes).encode('utf-8'), digest_size=8).hexdigest()
+    cache_file = RESULTS_DIR / '.cache' / f'{cache_name}_{num_points}_{key}.feather'
+    
+    # File hỏng (ví dụ ghi dở) bị xóa và tính lại (A corrupt file (e.g. a partial write) is dropped and recomputed)
+    cached = read_cache_file(cache_file, gpd.read_feather)
+    if cached is not None:
+        analyzer.voronoi_polygons = cached
+        print(f"Dùng lại kết quả đã lưu: {cache_file}")
+        print(f"Reusing cached results: {cache_file}")
+        return analyzer
+    
+    # Tạo các đa giác Voronoi (Create Voronoi polygons)
+    analyzer.create_voronoi_polygons(num_points=num_points, cache_dir=RESULTS_DIR / '.cache')
+    
+    # Tính toán thống kê gió (Calculate wind statistics)
+    analyzer.calculate_wind_statistics()
+    
+    # Ghi nguyên tử, cần pyarrow để ghi Feather (Written atomically, pyarrow is required to write Feather)
+    write_cache_file(cache_file, analyzer.voronoi_polygons.to_feather)
+    return analyzer
 
 def check_input_files():
     """
@@ -36,10 +134,19 @@ def check_input_files():
     (Check if input data files exist)
     """
     boundary_file = DATA_DIR / 'vietnam.geojson'
-    wind_file = DATA_DIR / 'VNM_wind-speed_100m.tif'
+    wind_file = WIND_FILE
     province_file = DATA_DIR / 'vietnam_provinces.geojson'
     
-    if not boundary_file.exists() or not wind_file.exists():
+    # Liệt kê thư mục dữ liệu một lần thay vì stat từng file
+    # (List the data directory once instead of stat-ing each file)
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            data_files = {entry.name for entry in entries}
+    except FileNotFoundError:
+        data_files = set()
+    
+    has_wind_file = any(f.name in data_files for f in (wind_file, TILED_WIND_FILE, QUANTIZED_WIND_FILE))
+    if boundary_file.name not in data_files or not has_wind_file:
         print("Lỗi: Không tìm thấy file dữ liệu đầu vào. / Error: Input data files not found.")
         print("Kiểm tra lại đường dẫn: / Check paths:", boundary_file, "và/and", wind_file)
         print("\nBạn cần tải dữ liệu từ Global Wind Atlas: / You need to download data from Global Wind Atlas:")
@@ -54,10 +161,14 @@ def check_input_files():
         
         return False
     
-    # Kiểm tra thư viện mpld3 cho tính năng tương tác
-    try:
-        import mpld3
-    except ImportError:
+    # Gợi ý chuẩn bị bản dạng tile để đọc nhanh hơn (Suggest preparing the faster tiled copy)
+    if TILED_WIND_FILE.name not in data_files:
+        print("\nChú ý: Chưa có file gió dạng tile. Chạy 'python prepare_data.py' để đọc dữ liệu nhanh hơn.")
+        print("Note: Tiled wind file not found. Run 'python prepare_data.py' for faster raster reads.")
+    
+    # Kiểm tra thư viện mpld3 cho tính năng tương tác (không import để tránh tải matplotlib)
+    # (Check for mpld3 without importing it, to avoid loading matplotlib)
+    if importlib.util.find_spec('mpld3') is None:
         print("\nChú ý: Thư viện mpld3 chưa được cài đặt. Tính năng tương tác hover sẽ không hoạt động.")
         print("Note: mpld3 library is not installed. Interactive hover feature will not work.")
         print("Bạn có thể cài đặt bằng lệnh: / You can install it with: pip install mpld3")
@@ -74,20 +185,14 @@ def analyze_entire_vietnam():
     # Tạo thư mục kết quả nếu chưa tồn tại (Create results directory if it doesn't exist)
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Tạo đối tượng phân tích tiềm năng gió (Create wind potential analyzer object)
-    analyzer = WindPotentialAnalyzer()
-    
-    # Đọc dữ liệu (Read data)
-    analyzer.load_data(DATA_DIR / 'vietnam.geojson', DATA_DIR / 'VNM_wind-speed_100m.tif')
+    # Lấy đối tượng phân tích đã đọc dữ liệu (Get analyzer with data already loaded)
+    analyzer = _get_analyzer()
     
     # Tạo biểu đồ dữ liệu gió và ranh giới (Create wind data and boundary plot)
     analyzer.visualize_wind_data(save_path=RESULTS_DIR / 'vietnam_wind_data.png')
     
-    # Tạo các đa giác Voronoi (Create Voronoi polygons)
-    analyzer.create_voronoi_polygons(num_points=100)  # Giảm còn 100 điểm để tăng tốc độ phân tích
-    
-    # Tính toán thống kê gió (Calculate wind statistics)
-    analyzer.calculate_wind_statistics()
+    # Tạo các đa giác Voronoi và tính thống kê gió (Create Voronoi polygons and calculate wind statistics)
+    _compute_wind_statistics(analyzer, 'vietnam', num_points=100)  # Giảm còn 100 điểm để tăng tốc độ phân tích
     
     # Lưu kết quả (Save results)
     analyzer.save_results(output_dir=RESULTS_DIR)
@@ -128,12 +233,6 @@ def analyze_specific_region(region_name):
     # Tạo thư mục kết quả nếu chưa tồn tại (Create results directory if it doesn't exist)
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Tạo đối tượng phân tích tiềm năng gió (Create wind potential analyzer object)
-    analyzer = WindPotentialAnalyzer()
-    
-    # Đọc dữ liệu (Read data)
-    analyzer.load_data(DATA_DIR / 'vietnam.geojson', DATA_DIR / 'VNM_wind-speed_100m.tif')
-    
     # Đọc dữ liệu tỉnh/thành phố (Read province data)
     province_file = DATA_DIR / 'vietnam_provinces.geojson'
     if not province_file.exists():
@@ -141,7 +240,8 @@ def analyze_specific_region(region_name):
         print(f"Error: Province boundary file not found: {province_file}")
         return
         
-    analyzer.load_provinces(province_file)
+    # Lấy đối tượng phân tích đã đọc dữ liệu (Get analyzer with data already loaded)
+    analyzer = _get_analyzer(with_provinces=True)
     
     try:
         # Chọn vùng cụ thể (Select specific region)
@@ -151,11 +251,8 @@ def analyze_specific_region(region_name):
         region_suffix = region_name.lower().replace(' ', '_')
         analyzer.visualize_wind_data(save_path=RESULTS_DIR / f'vietnam_wind_data_{region_suffix}.png')
         
-        # Tạo các đa giác Voronoi (Create Voronoi polygons)
-        analyzer.create_voronoi_polygons(num_points=100)  # Giảm còn 100 điểm để tăng tốc độ phân tích
-        
-        # Tính toán thống kê gió (Calculate wind statistics)
-        analyzer.calculate_wind_statistics()
+        # Tạo các đa giác Voronoi và tính thống kê gió (Create Voronoi polygons and calculate wind statistics)
+        _compute_wind_statistics(analyzer, region_suffix, num_points=100)  # Giảm còn 100 điểm để tăng tốc độ phân tích
         
         # Lưu kết quả (Save results)
         analyzer.save_results(output_dir=RESULTS_DIR)
@@ -189,9 +286,6 @@ def list_available_regions():
     Liệt kê các tỉnh/thành phố có sẵn để phân tích
     (List available provinces/cities for analysis)
     """
-    # Tạo đối tượng phân tích tiềm năng gió (Create wind potential analyzer object)
-    analyzer = WindPotentialAnalyzer()
-    
     # Đọc dữ liệu tỉnh/thành phố (Read province data)
     province_file = DATA_DIR / 'vietnam_provinces.geojson'
     if not province_file.exists():
@@ -199,7 +293,9 @@ def list_available_regions():
         print(f"Error: Province boundary file not found: {province_file}")
         return []
         
-    analyzer.load_provinces(province_file)
+    # Dùng chung dữ liệu đã tải với các bước phân tích sau
+    # (Share loaded data with the analysis steps that follow)
+    analyzer = _get_analyzer(with_provinces=True)
     regions = analyzer.list_available_regions()
     
     print("\nCác tỉnh/thành phố có sẵn để phân tích / Available provinces/cities for analysis:")
@@ -208,15 +304,232 @@ def list_available_regions():
         
     return regions
 
+def create_interactive_map(region_name=None, num_points=100, simplify_tolerance=0.005, force=False, backend='mpld3'):
+    """
+    Tạo bản đồ tương tác có thể hover chuột cho toàn Việt Nam hoặc một tỉnh/thành phố
+    (Create an interactive hover map for the entire Vietnam or a single province/city)
+    
+    Parameters:
+    -----------
+    region_name : str, optional
+        Tên tỉnh/thành phố, None để tạo bản đồ cho toàn Việt Nam
+        (Province/city name, None for the entire Vietnam)
+    num_points : int, optional
+        Số điểm Voronoi (Number of Voronoi points)
+    simplify_tolerance : float, optional
+        Dung sai đơn giản hóa đa giác khi vẽ (Polygon simplification tolerance for drawing)
+    force : bool, optional
+        Tạo lại bản đồ kể cả khi đã có trong bộ đệm (Rebuild the map even if it is cached)
+    backend : str, optional
+        'mpld3', 'folium' (bản đồ web Leaflet) hoặc 'imagemap' (ảnh PNG kèm bản đồ ảnh HTML)
+        ('mpld3', 'folium' (Leaflet web map) or 'imagemap' (PNG with an HTML image map))
+    """
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    region_suffix = region_name.lower().replace(' ', '_') if region_name is not None else ""
+    output_path = RESULTS_DIR / f'vietnam_wind_interactive{region_suffix}.html'
+    
+    # Khóa bộ đệm theo tham số và thời điểm sửa các file đầu vào
+    # (Cache key over the parameters and the input files' modification times)
+    province_file = DATA_DIR / 'vietnam_provinces.geojson'
+    input_files = [DATA_DIR / 'vietnam.geojson', _wind_file(), province_file]
+    mtimes = [f.stat().st_mtime_ns for f in input_files if f.exists()]
+    key = hashlib.blake2b(repr((region_name, num_points, simplify_tolerance, backend, mtimes)).encode('utf-8'),
+                          digest_size=8).hexdigest()
+    cache_file = RESULTS_DIR / '.cache' / f'interactive_{key}.html'
+    
+    # GeoJSON riêng mà bản đồ folium lớn tải bằng fetch() (Sidecar GeoJSON fetched by large folium maps)
+    sidecar_file, cached_sidecar = output_path.with_suffix('.geojson'), cache_file.with_suffix('.geojson')
+    
+    if cache_file.exists() and not force:
+        shutil.copyfile(cache_file, output_path)
+        if cached_sidecar.exists():
+            shutil.copyfile(cached_sidecar, sidecar_file)
+        print(f"\nDùng lại bản đồ tương tác đã lưu: {output_path}")
+        print(f"Reusing cached interactive map: {output_path}")
+        return output_path
+    
+    # Dữ liệu đã được tải nếu đã liệt kê các tỉnh/thành phố
+    # (Data is already loaded if provinces were listed)
+    analyzer = _get_analyzer(with_provinces=province_file.exists())
+    
+    if region_name is not None:
+        try:
+            analyzer.select_region(region_name)
+        except ValueError as e:
+            print(f"Lỗi: {e}")
+            print(f"Error: {e}")
+            return None
+    
+    # Tạo các đa giác Voronoi (Create Voronoi polygons)
+    analyzer.create_voronoi_polygons(num_points=num_points, cache_dir=RESULTS_DIR / '.cache')
+        
+    # Tính toán thống kê gió (Calculate wind statistics)
+    analyzer.calculate_wind_statistics()
+    
+    # Tạo biểu đồ tương tác (Create interactive plot)
+    try:
+        html = analyzer.create_interactive_visualization(
+            html_output=output_path, simplify_tolerance=simplify_tolerance, backend=backend
+        )
+        print(f"\nĐã tạo bản đồ tương tác tại: {output_path}")
+        print(f"Created interactive map at: {output_path}")
+        
+        # Hướng dẫn sử dụng (Usage instructions)
+        print("\nHướng dẫn / Instructions:")
+        print("- Mở file HTML trong trình duyệt để xem bản đồ tương tác")
+        print("- Di chuyển chuột trên các vùng để xem thông tin tốc độ gió")
+        print("- Open the HTML file in a browser to view the interactive map")
+        print("- Hover over areas to see wind speed information")
+    except Exception as e:
+        print(f"Không thể tạo biểu đồ tương tác: {e}")
+        print(f"Cannot create interactive plot: {e}")
+        return None
+    
+    # Lưu vào bộ đệm cho lần chạy sau (Store in the cache for the next run)
+    if html is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output_path, cache_file)
+        if backend == 'folium' and sidecar_file.exists():
+            shutil.copyfile(sidecar_file, cached_sidecar)
+    return output_path
+
+def _init_batch_worker():
+    """
+    Khởi tạo tiến trình con: mỗi tiến trình chỉ dùng một luồng GDAL để tránh tranh chấp CPU
+    (Initialize worker process: one GDAL thread per worker to avoid CPU oversubscription)
+    """
+    os.environ['GDAL_NUM_THREADS'] = '1'
+
+def _analyze_region_worker(region_name):
+    """
+    Phân tích một tỉnh/thành phố trong tiến trình con
+    (Analyze one province/city inside a worker process)
+    """
+    analyze_specific_region(region_name)
+    
+    # Giải phóng các biểu đồ đã tạo cho vùng này (Release figures created for this region)
+    import matplotlib.pyplot as plt
+    plt.close('all')
+    
+    return region_name
+
+def analyze_regions_batch(regions_file, jobs=None):
+    """
+    Phân tích song song nhiều tỉnh/thành phố được liệt kê trong một file
+    (Analyze several provinces/cities listed in a file in parallel)
+    
+    Parameters:
+    -----------
+    regions_file : str
+        File văn bản, mỗi dòng một tên tỉnh/thành phố (dòng bắt đầu bằng # bị bỏ qua)
+        (Text file with one province/city name per line, lines starting with # are skipped)
+    jobs : int, optional
+        Số tiến trình song song, mặc định là một nửa số lõi CPU
+        (Number of parallel processes, defaults to half the CPU cores)
+    """
+    with open(regions_file, 'r', encoding='utf-8') as f:
+        regions = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    
+    if not regions:
+        print(f"Không có tỉnh/thành phố nào trong file: {regions_file}")
+        print(f"No provinces/cities found in file: {regions_file}")
+        return []
+    
+    return analyze_regions_parallel(regions, jobs=jobs)
+
+def analyze_regions_parallel(regions, jobs=None):
+    """
+    Phân tích song song nhiều tỉnh/thành phố
+    (Analyze several provinces/cities in parallel)
+    
+    Parameters:
+    -----------
+    regions : list of str
+        Tên các tỉnh/thành phố (Province/city names)
+    jobs : int, optional
+        Số tiến trình song song, mặc định là một nửa số lõi CPU
+        (Number of parallel processes, defaults to half the CPU cores)
+    """
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+    
+    print(f"\n=== Phân tích {len(regions)} tỉnh/thành phố với {jobs} tiến trình / Analyzing {len(regions)} provinces with {jobs} processes ===\n")
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker) as executor:
+        completed = list(executor.map(_analyze_region_worker, regions))
+    
+    print(f"\nĐã phân tích xong {len(completed)} tỉnh/thành phố / Finished analyzing {len(completed)} provinces")
+    return completed
+
+def parse_args():
+    """
+    Phân tích tham số dòng lệnh
+    (Parse command line arguments)
+    """
+    parser = argparse.ArgumentParser(description='Demo phân tích tiềm năng gió tại Việt Nam / Vietnam Wind Potential Analysis Demo')
+    
+    parser.add_argument('--batch', type=str,
+                        help='File chứa danh sách tỉnh/thành phố (mỗi dòng một tên) để phân tích song song / File listing provinces (one per line) to analyze in parallel')
+    
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Số tiến trình song song cho --batch và lệnh region (mặc định: một nửa số lõi CPU) / Number of parallel processes for --batch and the region command (default: half the CPU cores)')
+    
+    # Các lệnh con để chạy không cần tương tác; bỏ trống để hiện menu
+    # (Subcommands for non-interactive runs; omit to show the menu)
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('all', help='Phân tích toàn bộ Việt Nam / Analyze entire Vietnam')
+    
+    region_parser = subparsers.add_parser('region', help='Phân tích một hoặc nhiều tỉnh/thành phố / Analyze one or more provinces/cities')
+    region_parser.add_argument('names', nargs='+',
+                               help='Tên tỉnh/thành phố, nhiều tên được phân tích song song / Province/city names, several names run in parallel')
+    
+    subparsers.add_parser('list', help='Liệt kê các tỉnh/thành phố có sẵn / List available provinces/cities')
+    
+    interactive_parser = subparsers.add_parser('interactive', help='Tạo bản đồ tương tác có thể hover chuột / Create interactive map with hover')
+    interactive_parser.add_argument('--region', type=str, default=None,
+                                    help='Tên tỉnh/thành phố (mặc định: toàn Việt Nam) / Province/city name (default: entire Vietnam)')
+    interactive_parser.add_argument('--backend', choices=['mpld3', 'folium', 'imagemap'], default='mpld3',
+                                    help='Thư viện tạo bản đồ (mặc định: mpld3) / Map backend (default: mpld3)')
+    interactive_parser.add_argument('--force', action='store_true',
+                                    help='Tạo lại bản đồ, bỏ qua bộ đệm / Rebuild the map, ignoring the cache')
+    
+    return parser.parse_args()
+
 def main():
     """
     Hàm chính để chạy demo
     (Main function to run demo)
     """
+    args = parse_args()
+    
     # Kiểm tra dữ liệu đầu vào (Check input data)
     if not check_input_files():
         return
     
+    # Chế độ phân tích hàng loạt (Batch analysis mode)
+    if args.batch:
+        analyze_regions_batch(args.batch, jobs=args.jobs)
+        return
+    
+    # Chạy lệnh con nếu có (Run the subcommand if one was given)
+    if args.command == 'all':
+        analyze_entire_vietnam()
+        return
+    if args.command == 'region':
+        if len(args.names) == 1:
+            analyze_specific_region(args.names[0])
+        else:
+            analyze_regions_parallel(args.names, jobs=args.jobs)
+        return
+    if args.command == 'list':
+        list_available_regions()
+        return
+    if args.command == 'interactive':
+        create_interactive_map(args.region, force=args.force, backend=args.backend)
+        return
+    
     print("\n===== Demo phân tích tiềm năng gió tại Việt Nam =====")
     print("===== Vietnam Wind Potential Analysis Demo =====\n")
     
@@ -255,50 +568,10 @@ def main():
         print("2. Tạo bản đồ tương tác cho một tỉnh/thành phố / Create interactive map for a specific province/city")
         sub_choice = input("\nNhập lựa chọn của bạn / Enter your choice (1-2): ")
         
-        analyzer = WindPotentialAnalyzer()
-        analyzer.load_data(DATA_DIR / 'vietnam.geojson', DATA_DIR / 'VNM_wind-speed_100m.tif')
-        
+        region_name = None
         if sub_choice == '2':
-            # Đọc dữ liệu tỉnh/thành phố (Read province data)
-            province_file = DATA_DIR / 'vietnam_provinces.geojson'
-            if not province_file.exists():
-                print(f"Lỗi: Không tìm thấy file ranh giới tỉnh/thành phố: {province_file}")
-                print(f"Error: Province boundary file not found: {province_file}")
-                return
-                
-            analyzer.load_provinces(province_file)
             region_name = input("\nNhập tên tỉnh/thành phố (ví dụ: Hà Nội) / Enter province/city name (e.g., Ha Noi): ")
-            analyzer.select_region(region_name)
-            region_suffix = region_name.lower().replace(' ', '_')
-            
-            # Tạo các đa giác Voronoi (Create Voronoi polygons)
-            analyzer.create_voronoi_polygons(num_points=100)
-        else:
-            # Tạo các đa giác Voronoi cho toàn bộ Việt Nam (Create Voronoi polygons for entire Vietnam)
-            analyzer.create_voronoi_polygons(num_points=100)
-            region_suffix = ""
-            
-        # Tính toán thống kê gió (Calculate wind statistics)
-        analyzer.calculate_wind_statistics()
-        
-        # Tạo biểu đồ tương tác (Create interactive plot)
-        try:
-            output_path = RESULTS_DIR / f'vietnam_wind_interactive{region_suffix}.html'
-            analyzer.create_interactive_visualization(
-                html_output=output_path
-            )
-            print(f"\nĐã tạo bản đồ tương tác tại: {output_path}")
-            print(f"Created interactive map at: {output_path}")
-            
-            # Hướng dẫn sử dụng (Usage instructions)
-            print("\nHướng dẫn / Instructions:")
-            print("- Mở file HTML trong trình duyệt để xem bản đồ tương tác")
-            print("- Di chuyển chuột trên các vùng để xem thông tin tốc độ gió")
-            print("- Open the HTML file in a browser to view the interactive map")
-            print("- Hover over areas to see wind speed information")
-        except Exception as e:
-            print(f"Không thể tạo biểu đồ tương tác: {e}")
-            print(f"Cannot create interactive plot: {e}")
+        create_interactive_map(region_name)
     elif choice == '0':
         print("Thoát chương trình / Exiting program")
     else:
@@ -13,17 +13,35 @@ each cell to view information about wind speed and wind energy potential in that
 Thư viện cần thiết / Required libraries:
 - NumPy, Pandas, GeoPandas, Matplotlib
 - Folium (cho tương tác web / for web interaction)
-- Rasterio, Rasterstats (cho xử lý dữ liệu raster / for raster data processing)
+- Rasterio (cho xử lý dữ liệu raster / for raster data processing)
+- exactextract (tùy chọn, thống kê vùng nhanh hơn / optional, faster zonal statistics)
 - Networkx (cho biểu đồ quy trình / for workflow charts)
 """
 
 import os
 import sys
+import hashlib
+import gzip
+import importlib.util
+import shutil
 from pathlib import Path
 import argparse
+from functools import lru_cache
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
+from pyproj import CRS, Transformer
+
+# Cấu hình bộ đệm GDAL trước lần mở raster đầu tiên
+# Configure GDAL caching before the first raster is opened
+os.environ.setdefault('GDAL_CACHEMAX', '512')
+os.environ.setdefault('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR')
+
+# Module này chỉ lưu hình ra file: chọn backend Agg (không GUI) trước khi vietnamwind nạp pyplot,
+# trừ khi MPLBACKEND đã được đặt; các tiến trình con cũng kế thừa
+# This module only saves figures to files: pick the non-GUI Agg backend before vietnamwind imports pyplot,
+# unless MPLBACKEND is already set; worker processes inherit it too
+os.environ.setdefault('MPLBACKEND', 'Agg')
 
 # Thêm thư mục hiện tại vào đường dẫn để có thể import
 # Add current directory to path to be able to import
@@ -31,36 +49,487 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import trực tiếp từ file vietnamwind.py
 # Import directly from vietnamwind.py
-from vietnamwind import WindPotentialAnalyzer
+from vietnamwind import WindPotentialAnalyzer, read_cache_file, write_cache_file
+# Chọn file gió giống demo.py: bản uint8, bản dạng tile rồi file gốc
+# (Pick the wind file the same way demo.py does: uint8 copy, tiled copy, then the original)
+from demo import _wind_file
 
 # Đường dẫn dữ liệu / Data paths
 DATA_DIR = Path('data')
 RESULTS_DIR = Path('results')
 ASSETS_DIR = Path('assets/images')
+PROVINCE_FILE = DATA_DIR / 'vietnam_provinces.geojson'
+# Bản sao đã đơn giản hóa (~200 m, 5 chữ số thập phân) dùng cho bản đồ web
+# Simplified copy (~200 m, 5 decimals) used for the web maps
+SIMPLIFIED_PROVINCE_FILE = DATA_DIR / 'vietnam_provinces_simplified.geojson'
 
-# Thử import các thư viện tùy chọn / Try to import optional libraries
-try:
-    import folium
-    from folium.plugins import (MarkerCluster, HeatMap, Geocoder, MeasureControl, 
-                               Draw, MiniMap, Fullscreen)
-    FOLIUM_AVAILABLE = True
-except ImportError:
-    FOLIUM_AVAILABLE = False
+# Hệ tọa độ của Folium, tạo một lần để so sánh CRS không phải phân tích chuỗi mỗi lần
+# (Folium's coordinate system, built once so CRS comparisons do not re-parse a string each time)
+WGS84 = CRS.from_epsg(4326)
+
+# Tiêu đề bản đồ theo phong cách Apple (tối giản, thanh lịch), {region} là tên khu vực
+# (Map title with Apple-like style (minimalist, elegant), {region} is the region name)
+MAP_TITLE_TEMPLATE = '''
+    <div style="position: fixed; 
+                top: 20px; left: 50%;
+                transform: translateX(-50%);
+                z-index: 9998; font-size: 18px;
+                font-weight: 500; background-color: rgba(255, 255, 255, 0.85);
+                color: #333; padding: 12px 20px;
+                border-radius: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+                font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
+                backdrop-filter: blur(5px);
+                -webkit-backdrop-filter: blur(5px);">
+        <span style="font-weight: 600; display: inline-block; margin-right: 8px;">📍</span>
+        Bản đồ tiềm năng gió {region}
+    </div>
+'''
+
+# Bảng chú thích riêng bên góc phải dưới (Custom legend in the bottom right corner)
+MAP_LEGEND_HTML = '''
+    <div style="position: fixed; 
+                bottom: 30px; right: 30px;
+                z-index: 9999; font-size: 14px;
+                font-weight: 400; background-color: rgba(255, 255, 255, 0.85);
+                color: #333; padding: 15px 20px;
+                border-radius: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+                font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
+                max-width: 280px;
+                backdrop-filter: blur(5px);
+                -webkit-backdrop-filter: blur(5px);">
+        <h4 style="margin-top: 0; margin-bottom: 10px; font-weight: 600; font-size: 16px;">Chú thích / Legend</h4>
+        <div style="display: flex; align-items: center; margin-bottom: 8px;">
+            <div style="background: linear-gradient(to right, #0d0887, #5402a3, #8a0da4, #b91b8a, #db2f5e, #ed683f, #fa9b29, #fcce25); 
+                        width: 150px; height: 15px; margin-right: 10px; border-radius: 3px;"></div>
+            <div>Tốc độ gió tăng dần →</div>
+        </div>
+        <div style="margin-top: 12px; font-size: 13px; opacity: 0.8;">
+            Di chuyển chuột để xem thông tin chi tiết.<br>
+            Hover for detailed information.
+        </div>
+    </div>
+'''
+
+# Di chuyển thanh tìm kiếm sang bên trái trên cùng để tránh chồng lấp
+# (Move the search bar to the top left to avoid overlap)
+MAP_CONTROLS_CSS = '''
+    <style>
+        .leaflet-control-geocoder {
+            left: 20px !important;
+            top: 20px !important;
+        }
+        .leaflet-control-layers {
+            margin-top: 50px !important;
+        }
+        .leaflet-control-zoom {
+            margin-right: 15px !important;
+        }
+        .leaflet-control-fullscreen {
+            margin-top: 10px !important;
+        }
+        .leaflet-touch .leaflet-bar {
+            border-radius: 8px !important;
+            border: 1px solid rgba(0,0,0,0.1) !important;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
+        }
+        .leaflet-touch .leaflet-control-layers {
+            border-radius: 10px !important;
+            border: 1px solid rgba(0,0,0,0.1) !important;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
+        }
+        .leaflet-control-layers-expanded {
+            background-color: rgba(255,255,255,0.9) !important;
+            backdrop-filter: blur(5px) !important;
+            -webkit-backdrop-filter: blur(5px) !important;
+            padding: 12px !important;
+            border-radius: 12px !important;
+        }
+        .leaflet-control-geocoder-form input {
+            border-radius: 10px !important;
+            padding: 8px 12px !important;
+            font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif !important;
+        }
+    </style>
+'''
+
+# Meta tags và tiêu đề trang cho <head> (Meta tags and page title for <head>)
+MAP_HEAD_TEMPLATE = '''
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
+    <meta name="description" content="Bản đồ tiềm năng gió Việt Nam - Vietnam Wind Potential Map">
+    <meta name="apple-mobile-web-app-capable" content="yes">
+    <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
+    <title>Bản đồ tiềm năng gió - {region_vi} / Wind Potential Map - {region_en}</title>
+'''
+
+# CSS responsive cho <head> (Responsive CSS for <head>)
+MAP_HEAD_CSS = '''
+    <style>
+        body {
+            margin: 0;
+            padding: 0;
+            font-family: -apple-system, SF Pro Display, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+        }
+        #map {
+            position: absolute;
+            top: 0;
+            bottom: 0;
+            right: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+        }
+        .legend {
+            padding: 12px 15px;
+            font: 14px -apple-system, SF Pro Display, sans-serif;
+            background: rgba(255, 255, 255, 0.9);
+            box-shadow: 0 5px 25px rgba(0, 0, 0, 0.15);
+            border-radius: 12px;
+            line-height: 1.5em;
+            backdrop-filter: blur(5px);
+            -webkit-backdrop-filter: blur(5px);
+        }
+        .legend h4 {
+            margin-top: 0;
+            font-weight: 600;
+        }
+        .leaflet-popup-content {
+            max-width: 300px;
+            max-height: 300px;
+            overflow: auto;
+        }
+        .leaflet-popup-content-wrapper {
+            border-radius: 12px;
+            background-color: rgba(255, 255, 255, 0.85);
+            backdrop-filter: blur(5px);
+            -webkit-backdrop-filter: blur(5px);
+        }
+        .leaflet-popup-tip {
+            background-color: rgba(255, 255, 255, 0.85);
+        }
+        .leaflet-container {
+            font-family: -apple-system, SF Pro Display, sans-serif;
+        }
+        
+        /* Làm nổi bật ô gió khi hover bằng CSS, không cần trình xử lý sự kiện JavaScript cho từng ô */
+        /* Highlight wind cells on hover in CSS, no per-cell JavaScript event handlers */
+        .wind-cell {
+            transition: stroke-width 0.15s ease;
+        }
+        .wind-cell:hover {
+            stroke: #fff;
+            stroke-width: 3;
+            cursor: pointer;
+        }
+        
+        /* Theo phong cách Apple */
+        /* Apple-style design */
+        .leaflet-control-zoom a, .leaflet-control-fullscreen a {
+            border-radius: 8px !important;
+            background-color: rgba(255, 255, 255, 0.85) !important;
+            color: #333 !important;
+            transition: all 0.2s ease;
+        }
+        .leaflet-control-zoom a:hover, .leaflet-control-fullscreen a:hover {
+            background-color: rgba(255, 255, 255, 0.95) !important;
+            transform: translateY(-1px);
+        }
+        .leaflet-bar {
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1) !important;
+        }
+        @media (max-width: 768px) {
+            .leaflet-control-geocoder {
+                width: calc(100% - 40px) !important;
+                left: 20px !important;
+                top: 20px !important;
+            }
+        }
+    </style>
+'''
+
+# JavaScript cải thiện trải nghiệm người dùng (JavaScript to improve the user experience)
+MAP_SCRIPT = '''
+    <script>
+    // Thêm tính năng tương tác nâng cao
+    // Add enhanced interactive features
+    document.addEventListener('DOMContentLoaded', function() {
+        // Làm mượt chuyển động zoom
+        // Smooth zoom animation
+        var map = document.querySelector('.leaflet-map-pane').__leaflet_map__;
+        if (map) {
+            map.options.zoomAnimation = true;
+            map.options.fadeAnimation = true;
+            map.options.markerZoomAnimation = true;
+        }
+    });
+    </script>
+'''
+
+# Tải GeoJSON riêng bằng fetch, tô màu theo thuộc tính "fill" đã tính sẵn; {geojson} và {map} được thay khi tạo
+# (Load the separate GeoJSON with fetch, colored by the precomputed "fill" property; {geojson} and {map} are filled in)
+MAP_SIDECAR_LOADER_TEMPLATE = (
+    "{{% macro script(this, kwargs) %}}"
+    "fetch('{geojson}').then(r => r.json()).then(data => L.geoJSON(data, {{"
+    "style: f => ({{fillColor: f.properties.fill, color: 'black', weight: 1, opacity: 0.2, fillOpacity: 0.7, "
+    "className: 'wind-cell'}}), "
+    "onEachFeature: (f, layer) => layer.bindTooltip("
+    "'Tốc độ gió trung bình / Mean wind speed: ' + f.properties.wind_mean + ' m/s<br>"
+    "Độ lệch chuẩn / Standard deviation: ' + f.properties.wind_std + ' m/s<br>"
+    "Tên / Name: ' + f.properties.name)"
+    "}}).addTo({map}));"
+    "{{% endmacro %}}"
+)
+
+# Chỉ kiểm tra folium có sẵn, nạp khi thực sự tạo bản đồ để các lệnh khác khởi động nhanh
+# Only check that folium is available, import it when a map is actually built so other commands start fast
+FOLIUM_AVAILABLE = importlib.util.find_spec('folium') is not None
+if not FOLIUM_AVAILABLE:
     print("Thư viện folium không khả dụng. Để sử dụng bản đồ tương tác web, hãy cài đặt bằng lệnh: pip install folium")
     print("Folium library not available. To use web interactive maps, install with command: pip install folium")
 
-# Thêm import cho biểu đồ workflow
-# Add imports for workflow chart
+# orjson mã hóa JSON trong C nhanh hơn json của thư viện chuẩn, không bắt buộc
+# orjson encodes JSON in C faster than the standard library json, optional
 try:
-    import networkx as nx
-    from matplotlib.patches import FancyArrowPatch
-    NETWORKX_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    NETWORKX_AVAILABLE = False
+    import json
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj):
+    """
+    Mã hóa JSON bằng orjson nếu có, nếu không dùng json / Encode JSON with orjson when available, else json
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj)
+
+def _loads(text):
+    """
+    Giải mã JSON bằng orjson nếu có, nếu không dùng json / Decode JSON with orjson when available, else json
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# networkx chỉ được import khi vẽ biểu đồ workflow; ở đây chỉ kiểm tra có cài đặt hay không
+# networkx is only imported when a workflow chart is drawn; here we only check that it is installed
+NETWORKX_AVAILABLE = importlib.util.find_spec('networkx') is not None
+if not NETWORKX_AVAILABLE:
     print("Thư viện networkx không khả dụng. Để tạo biểu đồ workflow, hãy cài đặt bằng lệnh: pip install networkx")
     print("Networkx library not available. To create workflow charts, install with command: pip install networkx")
 
-def create_interactive_map(region_name=None, num_points=100, save_html=True):
+def _pyplot():
+    """
+    Nạp pyplot chỉ khi vẽ biểu đồ workflow (backend đã được chọn qua MPLBACKEND khi nạp module)
+    Import pyplot only when a workflow chart is drawn (the backend is chosen through MPLBACKEND at module import)
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
+def _write_gzip(path):
+    """
+    Ghi bản nén gzip bên cạnh file (path + '.gz') để máy chủ tĩnh phục vụ trực tiếp
+    Write a gzip-compressed sibling (path + '.gz') that static hosts can serve as-is
+    """
+    path = Path(path)
+    gz_path = path.with_name(path.name + '.gz')
+    with open(path, 'rb') as source, gzip.open(gz_path, 'wb', compresslevel=9) as target:
+        shutil.copyfileobj(source, target)
+    print(f"Đã nén / Compressed: {path.name} {path.stat().st_size / 1024:.0f} KB -> {gz_path.name} {gz_path.stat().st_size / 1024:.0f} KB")
+    return gz_path
+
+def _fast_geojson(gdf):
+    """
+    Chuyển GeoDataFrame sang chuỗi GeoJSON, hình học được mã hóa trong GEOS bằng shapely.to_geojson
+    Convert a GeoDataFrame to a GeoJSON string, encoding geometries in GEOS with shapely.to_geojson
+    
+    Parameters:
+    -----------
+    gdf : GeoDataFrame
+        Dữ liệu cần chuyển, chỉ số dòng được dùng làm "id" của feature
+        Data to convert, the row index becomes each feature's "id"
+        
+    Returns:
+    --------
+    str
+        FeatureCollection dạng JSON / FeatureCollection as JSON
+    """
+    import shapely
+    
+    # Hình học rỗng (None) được bỏ qua ngay khi ghép chuỗi / Missing (None) geometries are skipped while joining
+    geometries = shapely.to_geojson(gdf.geometry.to_numpy())
+    properties = gdf.drop(columns=gdf.geometry.name)
+    properties = properties.astype(object).where(properties.notna(), None)
+    features = ','.join(
+        f'{{"id":{_dumps(str(idx))},"type":"Feature","properties":{_dumps(props)},"geometry":{geometry}}}'
+        for idx, props, geometry in zip(gdf.index, properties.to_dict(orient='records'), geometries)
+        if geometry is not None
+    )
+    return f'{{"type":"FeatureCollection","features":[{features}]}}'
+
+def _load_provinces(province_file=None):
+    """
+    Lấy ranh giới tỉnh/thành phố từ bộ đệm, đọc lại file chỉ khi file thay đổi
+    Get province boundaries from the cache, re-reading the file only when it changes
+    
+    Parameters:
+    -----------
+    province_file : str or Path, optional
+        File ranh giới tỉnh/thành phố, mặc định là data/vietnam_provinces.geojson (ranh giới gốc dùng để phân tích)
+        Province boundary file, defaults to data/vietnam_provinces.geojson (exact boundaries used for analysis)
+    
+    Returns:
+    --------
+    WindPotentialAnalyzer
+        Đối tượng phân tích chỉ có dữ liệu tỉnh/thành phố
+        Analyzer holding only the province data
+    """
+    province_file = Path(province_file or PROVINCE_FILE)
+    return _load_provinces_cached(str(province_file), province_file.stat().st_mtime_ns)
+
+@lru_cache(maxsize=4)
+def _load_provinces_cached(province_file, mtime):
+    """
+    Đọc ranh giới tỉnh/thành phố một lần cho mỗi cặp (đường dẫn, thời gian sửa đổi)
+    Read province boundaries once per (path, modification time) pair
+    """
+    analyzer = WindPotentialAnalyzer()
+    analyzer.load_provinces(province_file)
+    return analyzer
+
+def _simplified_provinces_fresh():
+    """
+    Bản sao đơn giản hóa có tồn tại và mới hơn file ranh giới gốc không
+    Whether the simplified copy exists and is newer than the original boundary file
+    """
+    return (SIMPLIFIED_PROVINCE_FILE.exists() and PROVINCE_FILE.exists() and
+            SIMPLIFIED_PROVINCE_FILE.stat().st_mtime >= PROVINCE_FILE.stat().st_mtime)
+
+def _display_boundary(analyzer):
+    """
+    Ranh giới để vẽ lên bản đồ: lấy tỉnh/thành phố đã chọn từ bản sao đơn giản hóa nếu còn mới,
+    còn việc cắt và thống kê vẫn dùng ranh giới gốc
+    Boundary to draw on the map: the selected province from the simplified copy while it is fresh,
+    masking and statistics still use the exact boundaries
+    """
+    if analyzer.selected_region is None:
+        return analyzer.catchments
+    if _simplified_provinces_fresh():
+        simplified = _load_provinces(SIMPLIFIED_PROVINCE_FILE).province_data
+        match = simplified[simplified['name'].isin(analyzer.selected_region['name'])]
+        if len(match) > 0:
+            return match
+    return analyzer.selected_region
+
+def prepare_simplified_provinces(tolerance=200):
+    """
+    Ghi bản sao đơn giản hóa của ranh giới tỉnh/thành phố, bỏ qua nếu bản sao còn mới hơn file gốc
+    Write a simplified copy of the province boundaries, skipping it while the copy is newer than the source
+    
+    Parameters:
+    -----------
+    tolerance : float, default=200
+        Dung sai đơn giản hóa theo mét (Web Mercator)
+        Simplification tolerance in meters (Web Mercator)
+        
+    Returns:
+    --------
+    Path
+        Đường dẫn đến file đã đơn giản hóa
+        Path to the simplified file
+    """
+    if _simplified_provinces_fresh():
+        return SIMPLIFIED_PROVINCE_FILE
+    
+    print("Tạo bản sao đơn giản hóa của ranh giới tỉnh/thành phố...")
+    print("Creating a simplified copy of the province boundaries...")
+    
+    from vietnamwind import read_vector_file
+    provinces = read_vector_file(PROVINCE_FILE)
+    if provinces.crs is None:
+        provinces = provinces.set_crs(WGS84)
+    
+    # Đơn giản hóa theo mét rồi chuyển về hệ tọa độ gốc / Simplify in meters, then back to the source CRS
+    simplified = provinces.geometry.to_crs(3857).simplify(tolerance, preserve_topology=True).to_crs(provinces.crs)
+    provinces = provinces.set_geometry(simplified)
+    
+    # Ghi tọa độ với 5 chữ số thập phân (~1 m) / Write coordinates with 5 decimals (~1 m)
+    provinces.to_file(SIMPLIFIED_PROVINCE_FILE, driver='GeoJSON', COORDINATE_PRECISION=5)
+    
+    print(f"Đã lưu / Saved: {SIMPLIFIED_PROVINCE_FILE}")
+    return SIMPLIFIED_PROVINCE_FILE
+
+def _build_analyzer(region_name=None, num_points=100):
+    """
+    Lấy analyzer đã có các ô Voronoi và thống kê gió, chỉ tính lại khi các file dữ liệu thay đổi
+    Get an analyzer with Voronoi cells and wind statistics, recomputed only when the data files change
+    
+    Parameters:
+    -----------
+    region_name : str, optional
+        Tên tỉnh/thành phố, None cho toàn bộ Việt Nam
+        Province/city name, None for the entire Vietnam
+    num_points : int, default=100
+        Số lượng điểm để tạo các đa giác Voronoi
+        Number of points to create Voronoi polygons
+        
+    Returns:
+    --------
+    WindPotentialAnalyzer
+        Analyzer dùng chung, các hàm vẽ chỉ được đọc không được sửa
+        Shared analyzer, renderers must only read it
+    """
+    wind_file = _wind_file()
+    data_files = (DATA_DIR / 'vietnam.geojson', wind_file, PROVINCE_FILE)
+    mtimes = tuple(f.stat().st_mtime_ns for f in data_files if f.exists())
+    return _build_analyzer_cached(region_name, num_points, wind_file, mtimes)
+
+@lru_cache(maxsize=4)
+def _build_analyzer_cached(region_name, num_points, wind_file, mtimes):
+    """
+    Chạy đọc dữ liệu, chọn vùng, Voronoi và thống kê gió một lần cho mỗi bộ tham số
+    Run data loading, region selection, Voronoi and wind statistics once per set of arguments
+    """
+    # Tạo đối tượng phân tích tiềm năng gió
+    # Create wind potential analyzer object
+    analyzer = WindPotentialAnalyzer()
+    
+    # Đọc dữ liệu / Read data
+    analyzer.load_data(DATA_DIR / 'vietnam.geojson', wind_file)
+    
+    # Xử lý cho một tỉnh/thành phố cụ thể, ValueError nếu không tìm thấy
+    # Process for a specific province/city, ValueError if it is not found
+    if region_name:
+        # Sao chép từ bộ đệm để không đọc lại file (Copy from the cache instead of re-reading the file)
+        analyzer.province_data = _load_provinces().province_data.copy()
+        analyzer.select_region(region_name)
+    
+    # Dùng lại các ô Voronoi và thống kê gió đã lưu nếu vùng, số điểm và các file dữ liệu không đổi
+    # Reuse cached Voronoi cells and wind statistics while the region, point count and data files are unchanged
+    cache_key = hashlib.blake2b(repr((region_name, num_points, wind_file.name, mtimes)).encode('utf-8'), digest_size=8).hexdigest()
+    cache_file = RESULTS_DIR / '.cache' / f'wind_statistics_{cache_key}.parquet'
+    
+    # File hỏng (ví dụ ghi dở) bị xóa và tính lại (A corrupt file (e.g. a partial write) is dropped and recomputed)
+    import geopandas as gpd
+    analyzer.voronoi_polygons = read_cache_file(cache_file, gpd.read_parquet)
+    
+    if analyzer.voronoi_polygons is not None:
+        print(f"Dùng lại kết quả đã lưu / Reusing cached results: {cache_file}")
+    else:
+        # Tạo các đa giác Voronoi / Create Voronoi polygons
+        analyzer.create_voronoi_polygons(num_points=num_points, cache_dir=RESULTS_DIR / '.cache')
+        
+        # Tính toán thống kê gió / Calculate wind statistics
+        analyzer.calculate_wind_statistics()
+        
+        # Ghi nguyên tử; cần pyarrow và thư mục ghi được / Written atomically; pyarrow and a writable directory are required
+        write_cache_file(cache_file, lambda tmp: analyzer.voronoi_polygons.to_parquet(tmp, compression='zstd'))
+    
+    return analyzer
+
+def create_interactive_map(region_name=None, num_points=100, save_html=True, simplify_tolerance=0.001,
+                           max_inline_cells=1000, analyzer=None):
     """
     Tạo bản đồ tương tác web cho một khu vực cụ thể hoặc toàn bộ Việt Nam
     Create web interactive map for a specific region or entire Vietnam
@@ -76,6 +545,15 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
     save_html : bool, default=True
         Lưu bản đồ dưới dạng file HTML
         Save map as HTML file
+    simplify_tolerance : float, default=0.001
+        Dung sai đơn giản hóa đa giác (độ) trước khi nhúng vào HTML, 0 hoặc None để giữ nguyên
+        Polygon simplification tolerance (degrees) before embedding in the HTML, 0 or None to keep as is
+    max_inline_cells : int, default=1000
+        Nếu số ô vượt quá giá trị này, GeoJSON được ghi ra file .geojson riêng cạnh file HTML
+        Above this many cells, the GeoJSON is written to a separate .geojson file next to the HTML
+    analyzer : WindPotentialAnalyzer, optional
+        Analyzer đã có thống kê gió cho region_name; nếu None sẽ lấy từ _build_analyzer
+        Analyzer that already holds wind statistics for region_name; if None, taken from _build_analyzer
         
     Returns:
     --------
@@ -88,6 +566,14 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
         print("Folium library not available. Please install with command: pip install folium")
         return None
         
+    # Nạp folium và các plugin khi cần (Import folium and its plugins on demand)
+    import folium
+    from folium.plugins import Geocoder, MeasureControl, Draw, MiniMap, Fullscreen
+    from branca.colormap import StepColormap
+    from branca.utilities import color_brewer
+    from branca.element import MacroElement
+    from jinja2 import Template
+    
     print(f"\n=== Tạo bản đồ tương tác web cho {region_name or 'toàn bộ Việt Nam'} ===")
     print(f"=== Creating web interactive map for {region_name or 'entire Vietnam'} ===\n")
     
@@ -95,45 +581,32 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
     # Create results directory if it doesn't exist
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Tạo đối tượng phân tích tiềm năng gió
-    # Create wind potential analyzer object
-    analyzer = WindPotentialAnalyzer()
-    
-    # Đọc dữ liệu / Read data
-    analyzer.load_data(DATA_DIR / 'vietnam.geojson', DATA_DIR / 'VNM_wind-speed_100m.tif')
-    
     # Xử lý cho một tỉnh/thành phố cụ thể
     # Process for a specific province/city
-    region_suffix = ""
-    if region_name:
-        province_file = DATA_DIR / 'vietnam_provinces.geojson'
-        if not province_file.exists():
-            print(f"Lỗi: Không tìm thấy file ranh giới tỉnh/thành phố: {province_file}")
-            print(f"Error: Province boundary file not found: {province_file}")
-            return None
-            
-        analyzer.load_provinces(province_file)
+    region_suffix = f"_{region_name.lower().replace(' ', '_')}" if region_name else ""
+    if region_name and analyzer is None and not PROVINCE_FILE.exists():
+        print(f"Lỗi: Không tìm thấy file ranh giới tỉnh/thành phố: {PROVINCE_FILE}")
+        print(f"Error: Province boundary file not found: {PROVINCE_FILE}")
+        return None
+    
+    # Dùng analyzer đã chuẩn bị hoặc lấy từ bộ đệm (Use the prepared analyzer or get one from the cache)
+    if analyzer is None:
         try:
-            analyzer.select_region(region_name)
-            region_suffix = f"_{region_name.lower().replace(' ', '_')}"
+            analyzer = _build_analyzer(region_name, num_points)
         except ValueError as e:
             print(f"Lỗi/Error: {e}")
             return None
     
-    # Tạo các đa giác Voronoi / Create Voronoi polygons
-    analyzer.create_voronoi_polygons(num_points=num_points)
-    
-    # Tính toán thống kê gió / Calculate wind statistics
-    analyzer.calculate_wind_statistics()
-    
     try:
         # Lấy dữ liệu Voronoi từ analyzer / Get Voronoi data from analyzer
         if hasattr(analyzer, 'voronoi_polygons') and analyzer.voronoi_polygons is not None:
             gdf = analyzer.voronoi_polygons
             
-            # Làm sạch dữ liệu - loại bỏ các đa giác có geometry là None
-            # Clean data - remove polygons with None geometry
-            gdf = gdf[gdf.geometry.notna()].copy()
+            # Làm sạch dữ liệu - loại bỏ các đa giác có geometry là None; chỉ lấy các cột cần cho bản đồ
+            # và không sao chép vì phía sau chỉ đọc dữ liệu
+            # Clean data - remove polygons with None geometry; keep only the columns the map needs
+            # and skip the copy since everything downstream only reads
+            gdf = gdf.loc[gdf.geometry.notna().to_numpy(), [gdf.geometry.name, 'wind_mean', 'wind_std', 'name']]
             
             if len(gdf) == 0:
                 print("Không có dữ liệu Voronoi hợp lệ sau khi làm sạch")
@@ -142,18 +615,43 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
             
             # Chuyển đổi CRS cho Folium (cần EPSG:4326 - WGS84)
             # Convert CRS for Folium (needs EPSG:4326 - WGS84)
-            if gdf.crs and gdf.crs != "EPSG:4326":
-                gdf = gdf.to_crs("EPSG:4326")
+            if gdf.crs is not None and not gdf.crs.equals(WGS84):
+                gdf = gdf.to_crs(WGS84)
+            
+            # Đơn giản hóa hình học một lần cho cả mảng để HTML nhỏ hơn và trình duyệt vẽ nhanh hơn
+            # Simplify all geometries in one vectorized call so the HTML is smaller and the browser draws faster
+            if simplify_tolerance:
+                gdf = gdf.set_geometry(gdf.geometry.simplify(simplify_tolerance, preserve_topology=True))
                 
             # Lấy tâm của vùng để đặt ở giữa bản đồ
             # Get center of region to place in middle of map
             boundary = analyzer.selected_region if analyzer.selected_region is not None else analyzer.catchments
-            if boundary.crs and boundary.crs != "EPSG:4326":
-                boundary = boundary.to_crs("EPSG:4326")
-                
-            # Tính toán tâm / Calculate center
-            centroid = boundary.geometry.unary_union.centroid
-            center = [centroid.y, centroid.x]
+            
+            # Tâm khung bao trong hệ tọa độ gốc, không cần hợp các đa giác; chỉ chuyển một điểm sang WGS84
+            # Bounding-box center in the source CRS, no polygon union needed; only that point is transformed to WGS84
+            minx, miny, maxx, maxy = boundary.total_bounds
+            if np.all(np.isfinite([minx, miny, maxx, maxy])):
+                center_x, center_y = (minx + maxx) / 2, (miny + maxy) / 2
+            else:
+                # Trọng tâm theo diện tích của các tâm riêng lẻ, không hợp các đa giác
+                # Area-weighted mean of the individual centroids, no polygon union
+                import shapely
+                geoms = boundary.geometry.values
+                areas = shapely.area(geoms)
+                has_area = areas > 0
+                centroids = shapely.centroid(geoms[has_area])
+                center_x = np.average(shapely.get_x(centroids), weights=areas[has_area])
+                center_y = np.average(shapely.get_y(centroids), weights=areas[has_area])
+            
+            # Lớp ranh giới chỉ cần cột hình học, lấy từ bản đơn giản hóa nếu có
+            # The boundary layer only needs the geometry column, taken from the simplified copy when available
+            boundary = _display_boundary(analyzer)
+            boundary = boundary[[boundary.geometry.name]]
+            if boundary.crs is not None and not boundary.crs.equals(WGS84):
+                center_x, center_y = Transformer.from_crs(boundary.crs, WGS84, always_xy=True).transform(
+                    center_x, center_y)
+                boundary = boundary.to_crs(WGS84)
+            center = [center_y, center_x]
             
             # Tạo bản đồ Folium với nhiều tùy chọn nền / Create Folium map with multiple base layers
             m = folium.Map(
@@ -192,49 +690,88 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
                 control=True
             ).add_to(m)
             
-            # Thêm lớp choropleth từ dữ liệu Voronoi với màu sắc đẹp và tương phản cao
-            # Add choropleth layer from Voronoi data with nice colors and high contrast
-            choropleth = folium.Choropleth(
-                geo_data=gdf.__geo_interface__,
-                name="Tốc độ gió / Wind Speed",
-                data=gdf,
-                columns=[gdf.index, "wind_mean"],
-                key_on="feature.id",
-                fill_color="plasma",  # Sử dụng plasma - bảng màu khoa học tốt / Using plasma - good scientific colormap
-                fill_opacity=0.7,
-                line_opacity=0.2,
-                highlight=True,  # Thêm highlight khi hover 
-                legend_name="Tốc độ gió trung bình (m/s)"
-            ).add_to(m)
+            # Ngưỡng phân lớp theo phân vị tính một lần bằng NumPy (8 lớp, bỏ ngưỡng trùng nhau);
+            # dữ liệu quá đồng nhất (dưới 3 lớp) dùng 6 khoảng đều như mặc định của Folium
+            # Quantile class breaks computed once in NumPy (8 classes, duplicate edges dropped);
+            # near-constant data (fewer than 3 classes) uses 6 equal intervals like Folium's default
+            wind_mean = gdf['wind_mean'].to_numpy(dtype=float)
+            wind_values = wind_mean[np.isfinite(wind_mean)]
+            if len(wind_values) == 0:
+                wind_values = np.zeros(1)
+            bins = np.unique(np.quantile(wind_values, np.linspace(0, 1, 9)))
+            if len(bins) < 4:
+                bins = np.histogram_bin_edges(wind_values, bins=6)
             
-            # Thêm tooltip tốt hơn khi di chuột qua / Add better tooltip on hover
-            choropleth.geojson.add_child(
-                folium.features.GeoJsonTooltip(
-                    fields=["wind_mean", "wind_std", "name"],
-                    aliases=[
-                        "Tốc độ gió trung bình / Mean wind speed (m/s)", 
-                        "Độ lệch chuẩn / Standard deviation (m/s)", 
-                        "Tên / Name"
-                    ],
-                    localize=True,
-                    sticky=False,
-                    style="""
-                        background-color: rgba(255, 255, 255, 0.8);
-                        border: 1px solid rgba(0, 0, 0, 0.2);
-                        border-radius: 12px;
-                        box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-                        font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
-                        font-size: 14px;
-                        padding: 15px;
-                        backdrop-filter: blur(5px);
-                        -webkit-backdrop-filter: blur(5px);
-                    """
-                )
-            )
+            # Màu của từng ô tính trước bằng np.digitize, ô không có dữ liệu tô màu trắng
+            # Each cell's colour is precomputed with np.digitize, cells without data are white
+            colors = color_brewer("plasma", n=len(bins) - 1)  # plasma - bảng màu khoa học tốt / good scientific colormap
+            class_ids = np.clip(np.digitize(wind_mean, bins) - 1, 0, len(colors) - 1)
+            fill_colors = np.where(np.isfinite(wind_mean), np.array(colors)[class_ids], "white")
+            fill_by_id = dict(zip(gdf.index.astype(str), fill_colors.tolist()))
+            
+            # Làm tròn 2 chữ số thập phân cho tooltip để GeoJSON ngắn hơn / Round to 2 decimals for the tooltip to shorten the GeoJSON
+            cells = gdf.round({'wind_mean': 2, 'wind_std': 2})
+            html_path = RESULTS_DIR / f'vietnam_wind_folium{region_suffix}.html'
+            sidecar_path = html_path.with_suffix('.geojson') if save_html and len(cells) > max_inline_cells else None
+            
+            if sidecar_path is not None:
+                # Ghi GeoJSON ra file riêng (tọa độ 5 chữ số thập phân), trình duyệt tải sau khi trang đã hiển thị
+                # Write the GeoJSON to a separate file (5-decimal coordinates), loaded by the browser after the page shows
+                cells = cells.assign(fill=fill_colors).set_geometry(cells.geometry.set_precision(1e-5))
+                sidecar_path.write_text(_fast_geojson(cells), encoding='utf-8')
+                loader = MacroElement()
+                loader._template = Template(MAP_SIDECAR_LOADER_TEMPLATE.format(
+                    geojson=sidecar_path.name, map=m.get_name()))
+                m.add_child(loader)
+                print(f"Đã ghi GeoJSON riêng (cần mở qua máy chủ HTTP): {sidecar_path}")
+                print(f"Wrote separate GeoJSON (serve over HTTP to view): {sidecar_path}")
+            else:
+                # Thêm một lớp GeoJson duy nhất từ dữ liệu Voronoi với màu sắc đẹp và tương phản cao; GeoJSON được
+                # giải mã trong C để Folium không phải tự phân tích chuỗi bằng json của thư viện chuẩn
+                # Add a single GeoJson layer from Voronoi data with nice colors and high contrast; the GeoJSON is
+                # decoded in C so Folium does not parse the string itself with the standard library json
+                folium.GeoJson(
+                    _loads(_fast_geojson(cells)),
+                    name="Tốc độ gió / Wind Speed",
+                    style_function=lambda feature: {
+                        "fillColor": fill_by_id.get(feature["id"], "white"),
+                        "color": "black",
+                        "weight": 1,
+                        "opacity": 0.2,
+                        "fillOpacity": 0.7,
+                        "className": "wind-cell"  # Highlight khi hover bằng CSS / Hover highlight via CSS
+                    },
+                    # Thêm tooltip tốt hơn khi di chuột qua / Add better tooltip on hover
+                    tooltip=folium.features.GeoJsonTooltip(
+                        fields=["wind_mean", "wind_std", "name"],
+                        aliases=[
+                            "Tốc độ gió trung bình / Mean wind speed (m/s)", 
+                            "Độ lệch chuẩn / Standard deviation (m/s)", 
+                            "Tên / Name"
+                        ],
+                        localize=True,
+                        sticky=False,
+                        style="""
+                            background-color: rgba(255, 255, 255, 0.8);
+                            border: 1px solid rgba(0, 0, 0, 0.2);
+                            border-radius: 12px;
+                            box-shadow: 0 4px 20px rgba(0,0,0,0.15);
+                            font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
+                            font-size: 14px;
+                            padding: 15px;
+                            backdrop-filter: blur(5px);
+                            -webkit-backdrop-filter: blur(5px);
+                        """
+                    )
+                ).add_to(m)
+            
+            # Thang màu theo bậc làm chú thích / Step colormap as the legend
+            StepColormap(colors, index=bins.tolist(), vmin=bins[0], vmax=bins[-1],
+                         caption="Tốc độ gió trung bình (m/s)").add_to(m)
             
             # Thêm ranh giới khu vực với style tốt hơn / Add region boundary with better style
             folium.GeoJson(
-                boundary.__geo_interface__,
+                _loads(_fast_geojson(boundary)),
                 name="Ranh giới / Boundary",
                 tooltip="Ranh giới khu vực / Region boundary",
                 style_function=lambda x: {
@@ -253,50 +790,12 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
             MiniMap(toggle_display=True, position='bottomright').add_to(m)
             Fullscreen(position='topright').add_to(m)
             
-            # Thêm tiêu đề bản đồ theo phong cách Apple (tối giản, thanh lịch) 
+            # Thêm tiêu đề bản đồ theo phong cách Apple (tối giản, thanh lịch)
             # Add map title with Apple-like style (minimalist, elegant)
-            title_html = f'''
-                <div style="position: fixed; 
-                            top: 20px; left: 50%;
-                            transform: translateX(-50%);
-                            z-index: 9998; font-size: 18px;
-                            font-weight: 500; background-color: rgba(255, 255, 255, 0.85);
-                            color: #333; padding: 12px 20px;
-                            border-radius: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                            font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
-                            backdrop-filter: blur(5px);
-                            -webkit-backdrop-filter: blur(5px);">
-                    <span style="font-weight: 600; display: inline-block; margin-right: 8px;">📍</span>
-                    Bản đồ tiềm năng gió {region_name or "Việt Nam"}
-                </div>
-            '''
-            m.get_root().html.add_child(folium.Element(title_html))
+            m.get_root().html.add_child(folium.Element(MAP_TITLE_TEMPLATE.format(region=region_name or "Việt Nam")))
             
             # Thêm bảng chú thích riêng bên góc phải dưới / Add custom legend to bottom right
-            legend_html = '''
-                <div style="position: fixed; 
-                            bottom: 30px; right: 30px;
-                            z-index: 9999; font-size: 14px;
-                            font-weight: 400; background-color: rgba(255, 255, 255, 0.85);
-                            color: #333; padding: 15px 20px;
-                            border-radius: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                            font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif;
-                            max-width: 280px;
-                            backdrop-filter: blur(5px);
-                            -webkit-backdrop-filter: blur(5px);">
-                    <h4 style="margin-top: 0; margin-bottom: 10px; font-weight: 600; font-size: 16px;">Chú thích / Legend</h4>
-                    <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                        <div style="background: linear-gradient(to right, #0d0887, #5402a3, #8a0da4, #b91b8a, #db2f5e, #ed683f, #fa9b29, #fcce25); 
-                                    width: 150px; height: 15px; margin-right: 10px; border-radius: 3px;"></div>
-                        <div>Tốc độ gió tăng dần →</div>
-                    </div>
-                    <div style="margin-top: 12px; font-size: 13px; opacity: 0.8;">
-                        Di chuyển chuột để xem thông tin chi tiết.<br>
-                        Hover for detailed information.
-                    </div>
-                </div>
-            '''
-            m.get_root().html.add_child(folium.Element(legend_html))
+            m.get_root().html.add_child(folium.Element(MAP_LEGEND_HTML))
             
             # Thêm công cụ điều khiển lớp với vị trí và kiểu dáng tốt hơn
             # Add layer control with better position and style
@@ -304,195 +803,40 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
             
             # Di chuyển thanh tìm kiếm sang bên trái trên cùng để tránh chồng lấp
             # Move search bar to top left to avoid overlap
-            m.get_root().html.add_child(folium.Element('''
-                <style>
-                    .leaflet-control-geocoder {
-                        left: 20px !important;
-                        top: 20px !important;
-                    }
-                    .leaflet-control-layers {
-                        margin-top: 50px !important;
-                    }
-                    .leaflet-control-zoom {
-                        margin-right: 15px !important;
-                    }
-                    .leaflet-control-fullscreen {
-                        margin-top: 10px !important;
-                    }
-                    .leaflet-touch .leaflet-bar {
-                        border-radius: 8px !important;
-                        border: 1px solid rgba(0,0,0,0.1) !important;
-                        box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
-                    }
-                    .leaflet-touch .leaflet-control-layers {
-                        border-radius: 10px !important;
-                        border: 1px solid rgba(0,0,0,0.1) !important;
-                        box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
-                    }
-                    .leaflet-control-layers-expanded {
-                        background-color: rgba(255,255,255,0.9) !important;
-                        backdrop-filter: blur(5px) !important;
-                        -webkit-backdrop-filter: blur(5px) !important;
-                        padding: 12px !important;
-                        border-radius: 12px !important;
-                    }
-                    .leaflet-control-geocoder-form input {
-                        border-radius: 10px !important;
-                        padding: 8px 12px !important;
-                        font-family: -apple-system, SF Pro Display, Helvetica Neue, sans-serif !important;
-                    }
-                </style>
-            '''))
+            m.get_root().html.add_child(folium.Element(MAP_CONTROLS_CSS))
+            
+            # Thêm meta tags và responsive settings vào <head> trước khi lưu
+            # Add meta tags and responsive settings to <head> before saving
+            m.get_root().header.add_child(folium.Element(
+                MAP_HEAD_TEMPLATE.format(region_vi=region_name or "Việt Nam", region_en=region_name or "Vietnam") + MAP_HEAD_CSS))
+            
+            # Thêm JavaScript để cải thiện trải nghiệm người dùng
+            # Add JavaScript to improve user experience
+            m.get_root().html.add_child(folium.Element(MAP_SCRIPT))
             
             # Lưu bản đồ với nhiều tùy chọn / Save map with multiple options
             if save_html:
-                # Cải thiện tệp HTML với CSS và JavaScript bổ sung
-                # Improve HTML file with additional CSS and JavaScript
-                html_path = RESULTS_DIR / f'vietnam_wind_folium{region_suffix}.html'
-                
-                # Lưu bản đồ dưới dạng HTML tương tác / Save map as interactive HTML
+                # Lưu bản đồ dạng HTML một lần, CSS và JavaScript đã được chèn sẵn
+                # Save the map as HTML once, the CSS and JavaScript are already injected
                 m.save(str(html_path))
                 
-                # Cải thiện tệp HTML sau khi lưu
-                # Enhance HTML file after saving
-                with open(html_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Thêm meta tags và responsive settings
-                # Add meta tags and responsive settings
-                enhanced_html = html_content.replace(
-                    '<head>',
-                    '''<head>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-                    <meta name="description" content="Bản đồ tiềm năng gió Việt Nam - Vietnam Wind Potential Map">
-                    <meta name="apple-mobile-web-app-capable" content="yes">
-                    <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
-                    <title>Bản đồ tiềm năng gió - ''' + (region_name or "Việt Nam") + ''' / Wind Potential Map - ''' + (region_name or "Vietnam") + '''</title>
-                    <style>
-                        body {
-                            margin: 0;
-                            padding: 0;
-                            font-family: -apple-system, SF Pro Display, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-                        }
-                        #map {
-                            position: absolute;
-                            top: 0;
-                            bottom: 0;
-                            right: 0;
-                            left: 0;
-                            width: 100%;
-                            height: 100%;
-                        }
-                        .legend {
-                            padding: 12px 15px;
-                            font: 14px -apple-system, SF Pro Display, sans-serif;
-                            background: rgba(255, 255, 255, 0.9);
-                            box-shadow: 0 5px 25px rgba(0, 0, 0, 0.15);
-                            border-radius: 12px;
-                            line-height: 1.5em;
-                            backdrop-filter: blur(5px);
-                            -webkit-backdrop-filter: blur(5px);
-                        }
-                        .legend h4 {
-                            margin-top: 0;
-                            font-weight: 600;
-                        }
-                        .leaflet-popup-content {
-                            max-width: 300px;
-                            max-height: 300px;
-                            overflow: auto;
-                        }
-                        .leaflet-popup-content-wrapper {
-                            border-radius: 12px;
-                            background-color: rgba(255, 255, 255, 0.85);
-                            backdrop-filter: blur(5px);
-                            -webkit-backdrop-filter: blur(5px);
-                        }
-                        .leaflet-popup-tip {
-                            background-color: rgba(255, 255, 255, 0.85);
-                        }
-                        .leaflet-container {
-                            font-family: -apple-system, SF Pro Display, sans-serif;
-                        }
-                        
-                        /* Theo phong cách Apple */
-                        /* Apple-style design */
-                        .leaflet-control-zoom a, .leaflet-control-fullscreen a {
-                            border-radius: 8px !important;
-                            background-color: rgba(255, 255, 255, 0.85) !important;
-                            color: #333 !important;
-                            transition: all 0.2s ease;
-                        }
-                        .leaflet-control-zoom a:hover, .leaflet-control-fullscreen a:hover {
-                            background-color: rgba(255, 255, 255, 0.95) !important;
-                            transform: translateY(-1px);
-                        }
-                        .leaflet-bar {
-                            box-shadow: 0 4px 15px rgba(0,0,0,0.1) !important;
-                        }
-                        @media (max-width: 768px) {
-                            .leaflet-control-geocoder {
-                                width: calc(100% - 40px) !important;
-                                left: 20px !important;
-                                top: 20px !important;
-                            }
-                        }
-                    </style>
-                    '''
-                )
-                
-                # Thêm JavaScript để cải thiện trải nghiệm người dùng
-                # Add JavaScript to improve user experience
-                enhanced_html = enhanced_html.replace(
-                    '</body>',
-                    '''
-                    <script>
-                    // Thêm tính năng tương tác nâng cao
-                    // Add enhanced interactive features
-                    document.addEventListener('DOMContentLoaded', function() {
-                        // Thêm tính năng làm nổi bật khi hover
-                        // Add highlight feature on hover
-                        let layers = document.querySelectorAll('.leaflet-overlay-pane path');
-                        layers.forEach(function(layer) {
-                            layer.addEventListener('mouseover', function(e) {
-                                e.target.setAttribute('stroke-width', '3');
-                                e.target.setAttribute('stroke', '#fff');
-                                e.target.style.transition = 'all 0.2s ease';
-                                e.target.style.zIndex = '1000';
-                                e.target.style.cursor = 'pointer';
-                            });
-                            layer.addEventListener('mouseout', function(e) {
-                                e.target.setAttribute('stroke-width', '1');
-                                e.target.setAttribute('stroke', '#999');
-                                e.target.style.zIndex = 'auto';
-                            });
-                        });
-                        
-                        // Làm mượt chuyển động zoom
-                        // Smooth zoom animation
-                        var map = document.querySelector('.leaflet-map-pane').__leaflet_map__;
-                        if (map) {
-                            map.options.zoomAnimation = true;
-                            map.options.fadeAnimation = true;
-                            map.options.markerZoomAnimation = true;
-                        }
-                    });
-                    </script>
-                    </body>
-                    '''
-                )
+                # Ghi thêm bản .gz cho HTML (và GeoJSON đi kèm) / Also write .gz copies of the HTML (and sidecar GeoJSON)
+                for path in (html_path, sidecar_path):
+                    if path is not None:
+                        _write_gzip(path)
                 
-                # Lưu tệp HTML đã cải thiện
-                # Save the enhanced HTML file
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(enhanced_html)
-                
-                # Tạo bản sao cho thư mục gốc để dễ truy cập
-                # Create a copy in the root directory for easy access
+                # Tạo liên kết cứng ở thư mục gốc để dễ truy cập, sao chép nếu hệ thống file không hỗ trợ
+                # Create a hard link in the root directory for easy access, copying if the filesystem does not support it
                 root_path = Path(f'vietnam_wind_folium{region_suffix}.html')
-                with open(root_path, 'w', encoding='utf-8') as f:
-                    f.write(enhanced_html)
+                linked = [(html_path, root_path)]
+                if sidecar_path is not None:
+                    linked.append((sidecar_path, Path(sidecar_path.name)))
+                for source, target in linked:
+                    target.unlink(missing_ok=True)
+                    try:
+                        os.link(source, target)
+                    except OSError:
+                        shutil.copyfile(source, target)
                 
                 print(f"Đã lưu bản đồ tương tác web tại / Web interactive map saved at: {html_path}")
                 print(f"Đã tạo bản sao tại thư mục gốc: {root_path}")
@@ -513,7 +857,154 @@ def create_interactive_map(region_name=None, num_points=100, save_html=True):
     
     return None
 
-def create_workflow_chart(save_path=None):
+def _init_map_worker():
+    """
+    Khởi tạo tiến trình con: một luồng GDAL mỗi tiến trình và đọc sẵn ranh giới tỉnh/thành phố một lần
+    Initialize a worker process: one GDAL thread per worker and the province boundaries read once up front
+    """
+    os.environ['GDAL_NUM_THREADS'] = '1'
+    _load_provinces()
+
+def _create_map_worker(region_name, num_points):
+    """
+    Tạo bản đồ tương tác web cho một tỉnh/thành phố trong tiến trình con
+    Create the web interactive map for one province/city inside a worker process
+    """
+    return create_interactive_map(region_name=region_name, num_points=num_points, save_html=True)
+
+def create_maps_for_regions(regions, num_points=100, jobs=None):
+    """
+    Tạo song song bản đồ tương tác web cho nhiều tỉnh/thành phố
+    Create web interactive maps for several provinces/cities in parallel
+    
+    Parameters:
+    -----------
+    regions : list of str
+        Tên các tỉnh/thành phố
+        Province/city names
+    num_points : int, default=100
+        Số lượng điểm để tạo các đa giác Voronoi
+        Number of points to create Voronoi polygons
+    jobs : int, optional
+        Số tiến trình song song, mặc định là một nửa số lõi CPU
+        Number of parallel processes, defaults to half the CPU cores
+        
+    Returns:
+    --------
+    list
+        Đường dẫn đến các file HTML theo thứ tự của regions (None nếu thất bại)
+        Paths to the HTML files in the order of regions (None on failure)
+    """
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+    
+    print(f"\n=== Tạo bản đồ cho {len(regions)} tỉnh/thành phố với {jobs} tiến trình / Creating maps for {len(regions)} provinces with {jobs} processes ===\n")
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_map_worker) as executor:
+        html_paths = list(executor.map(_create_map_worker, regions, [num_points] * len(regions)))
+    
+    print(f"\nĐã tạo xong {sum(path is not None for path in html_paths)}/{len(regions)} bản đồ / Finished {sum(path is not None for path in html_paths)}/{len(regions)} maps")
+    return html_paths
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    """
+    Một bước trong biểu đồ quy trình (Một nguồn duy nhất cho nút, màu, nhóm và mô tả)
+    One step of a workflow chart (single source for node, color, group and description)
+    """
+    id: str
+    label: str
+    color: str
+    group: str
+    description: str = ""
+
+# Màu chú thích cho từng nhóm quy trình / Legend color for each process group
+WORKFLOW_GROUP_COLORS = {
+    "Chuẩn bị dữ liệu / Data Preparation": "#42c5f5",
+    "Tạo bản đồ / Map Creation": "#f59e42",
+    "Hoàn thiện / Finalization": "#9e42f5"
+}
+
+# Các bước tạo bản đồ tương tác (Option 4), nối tiếp nhau theo thứ tự
+# Steps of the interactive map workflow (Option 4), chained in order
+INTERACTIVE_MAP_WORKFLOW = (
+    WorkflowStep("start", "Bắt đầu\nStart", "#4287f5",  # Xanh dương / Blue
+                 "Chuẩn bị dữ liệu / Data Preparation"),
+    WorkflowStep("load_data", "Tải dữ liệu ranh giới và gió\nLoad boundary and wind data", "#42c5f5",  # Xanh dương nhạt / Light blue
+                 "Chuẩn bị dữ liệu / Data Preparation", "Đọc dữ liệu ranh giới và dữ liệu tốc độ gió từ file"),
+    WorkflowStep("region_select", "Chọn khu vực (Cả nước hoặc tỉnh)\nSelect region (Country/Province)", "#42f5e3",  # Xanh lá nhạt / Light green
+                 "Chuẩn bị dữ liệu / Data Preparation", "Lựa chọn phân tích toàn quốc hoặc tỉnh cụ thể"),
+    WorkflowStep("voronoi", "Tạo đa giác Voronoi\nCreate Voronoi Polygons", "#42f59e",  # Xanh lục / Green
+                 "Chuẩn bị dữ liệu / Data Preparation", "Tạo các ô Voronoi để phân tích dữ liệu"),
+    WorkflowStep("statistics", "Tính toán thống kê gió\nCalculate Wind Statistics", "#f5d442",  # Vàng / Yellow
+                 "Chuẩn bị dữ liệu / Data Preparation", "Tính toán tốc độ gió trung bình cho từng ô"),
+    WorkflowStep("folium_map", "Khởi tạo bản đồ Folium\nInitialize Folium Map", "#f59e42",  # Cam / Orange
+                 "Tạo bản đồ / Map Creation", "Khởi tạo bản đồ với tọa độ trung tâm"),
+    WorkflowStep("basemaps", "Thêm các lớp bản đồ nền\nAdd Basemap Layers", "#f57d42",  # Cam đậm / Dark orange
+                 "Tạo bản đồ / Map Creation", "Thêm nhiều lớp bản đồ nền (sáng, tối, vệ tinh)"),
+    WorkflowStep("choropleth", "Thêm lớp choropleth\nAdd Choropleth Layer", "#f55d42",  # Đỏ cam / Red-orange
+                 "Tạo bản đồ / Map Creation", "Tạo lớp màu sắc hiển thị tốc độ gió"),
+    WorkflowStep("tooltips", "Thêm tooltips tương tác\nAdd Interactive Tooltips", "#f54242",  # Đỏ / Red
+                 "Tạo bản đồ / Map Creation", "Thêm hiển thị thông tin khi di chuột qua"),
+    WorkflowStep("controls", "Thêm các công cụ điều khiển\nAdd Control Tools", "#f542aa",  # Hồng / Pink
+                 "Tạo bản đồ / Map Creation", "Thêm công cụ tìm kiếm, đo khoảng cách, vẽ"),
+    WorkflowStep("style", "Thêm CSS cải thiện giao diện\nAdd CSS Enhancements", "#d642f5",  # Tím / Purple
+                 "Hoàn thiện / Finalization", "Tùy chỉnh giao diện theo phong cách hiện đại"),
+    WorkflowStep("responsive", "Thêm tính năng responsive\nAdd Responsive Features", "#9e42f5",  # Tím nhạt / Light purple
+                 "Hoàn thiện / Finalization", "Đảm bảo bản đồ hiển thị tốt trên mọi thiết bị"),
+    WorkflowStep("save_html", "Lưu bản đồ dưới dạng HTML\nSave Map as HTML", "#7142f5",  # Tím xanh / Blue-purple
+                 "Hoàn thiện / Finalization", "Lưu bản đồ thành file HTML tương tác"),
+    WorkflowStep("end", "Hoàn thành\nComplete", "#4287f5",  # Xanh dương / Blue
+                 "Hoàn thiện / Finalization"),
+)
+
+def _chart_key_path(path):
+    """
+    File khóa đi kèm biểu đồ (Key file next to the chart)
+    """
+    path = Path(path)
+    return path.with_name(path.name + '.key')
+
+def _chart_key():
+    """
+    Khóa nội dung của mã vẽ biểu đồ: băm mã nguồn module này, không phụ thuộc thời gian sửa file
+    Content key of the chart-drawing code: a hash of this module's source, independent of file mtimes
+    """
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+def _is_chart_current(path):
+    """
+    Kiểm tra biểu đồ đã có và được vẽ bởi đúng phiên bản mã nguồn này hay không
+    Check whether a chart exists and was drawn by this exact version of the source code
+    """
+    path, key_path = Path(path), _chart_key_path(path)
+    return path.exists() and key_path.exists() and key_path.read_text().strip() == _chart_key()
+
+def _layered_layout(G):
+    """
+    Bố cục theo tầng (kiểu Sugiyama): mỗi thế hệ tô-pô là một hàng, các bước song song nằm cạnh nhau
+    Layered (Sugiyama-style) layout: each topological generation is a row, parallel steps sit side by side
+    """
+    import networkx as nx
+    pos = {}
+    for depth, layer in enumerate(nx.topological_generations(G)):
+        for index, node in enumerate(sorted(layer, key=list(G.nodes).index)):
+            pos[node] = (index - (len(layer) - 1) / 2, -depth)
+    return pos
+
+def _save_chart(plt, save_path):
+    """
+    Lưu biểu đồ: SVG dạng vector, PNG ở 150 dpi (đủ cho màn hình) với nén tối ưu
+    Save the chart: SVG as vectors, PNG at 150 dpi (enough for screens) with optimized compression
+    """
+    if Path(save_path).suffix.lower() == '.svg':
+        # Giữ chữ dạng văn bản thay vì đường cong (Keep text as text instead of glyph paths)
+        with plt.rc_context({'svg.fonttype': 'none'}):
+            plt.savefig(save_path, format='svg', bbox_inches='tight')
+    else:
+        plt.savefig(save_path, dpi=150, bbox_inches='tight', pil_kwargs={'optimize': True, 'compress_level': 6})
+
+def create_workflow_chart(save_path=None, force=False, fmt='png'):
     """
     Tạo biểu đồ minh họa quy trình phân tích tiềm năng gió
     Create workflow chart illustrating wind potential analysis process
@@ -523,6 +1014,12 @@ def create_workflow_chart(save_path=None):
     save_path : str or Path, optional
         Đường dẫn để lưu biểu đồ. Nếu None, sẽ lưu vào thư mục assets/images
         Path to save the chart. If None, will save to assets/images directory
+    force : bool, default=False
+        Vẽ lại kể cả khi biểu đồ đã lưu khớp với mã nguồn hiện tại
+        Redraw even if the saved chart matches the current source code
+    fmt : str, default='png'
+        Định dạng khi save_path là None ('png' hoặc 'svg' dạng vector)
+        Format used when save_path is None ('png' or vector 'svg')
         
     Returns:
     --------
@@ -533,6 +1030,14 @@ def create_workflow_chart(save_path=None):
     print("\n=== Tạo biểu đồ quy trình phân tích tiềm năng gió ===")
     print("=== Creating wind potential analysis workflow chart ===\n")
     
+    # Biểu đồ là ảnh tĩnh, chỉ vẽ lại khi mã nguồn thay đổi
+    # The chart is a static image, only redraw it when the source code changes
+    if save_path is None:
+        save_path = ASSETS_DIR / f'workflow.{fmt}'
+    if not force and _is_chart_current(save_path):
+        print(f"Biểu đồ đã có, bỏ qua / Chart is up to date, skipping: {save_path}")
+        return str(save_path)
+    
     if not NETWORKX_AVAILABLE:
         print("Thư viện networkx không khả dụng. Không thể tạo biểu đồ workflow.")
         print("Networkx library not available. Cannot create workflow chart.")
@@ -544,6 +1049,10 @@ def create_workflow_chart(save_path=None):
     # Create assets directory if it doesn't exist
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
     
+    # Nạp networkx và pyplot khi cần (Import networkx and pyplot on demand)
+    import networkx as nx
+    plt = _pyplot()
+    
     # Tạo đồ thị / Create graph
     G = nx.DiGraph()
     
@@ -560,8 +1069,7 @@ def create_workflow_chart(save_path=None):
     ]
     
     # Thêm nút và nhãn / Add nodes and labels
-    for node_id, label in nodes:
-        G.add_node(node_id, label=label)
+    G.add_nodes_from((node_id, {"label": label}) for node_id, label in nodes)
     
     # Thêm cạnh / Add edges
     edges = [
@@ -575,20 +1083,10 @@ def create_workflow_chart(save_path=None):
     ]
     
     # Thêm cạnh vào đồ thị / Add edges to graph
-    for src, dst in edges:
-        G.add_edge(src, dst)
-    
-    # Tạo layout cho đồ thị / Create layout for graph
-    pos = {
-        "data": (0, 0),
-        "load": (0, -1),
-        "region": (0, -2),
-        "voronoi": (0, -3),
-        "wind_stats": (0, -4),
-        "visualize": (0, -5),
-        "interactive_map": (0, -6),
-        "export": (0, -7)
-    }
+    G.add_edges_from(edges)
+    
+    # Tạo layout theo tầng / Create layered layout
+    pos = _layered_layout(G)
     
     # Tạo hình với kích thước lớn hơn / Create figure with larger size
     plt.figure(figsize=(12, 14))
@@ -605,17 +1103,17 @@ def create_workflow_chart(save_path=None):
         "export": "#b642f5"  # Tím / Purple
     }
     
-    # Vẽ nút / Draw nodes
-    for node, (x, y) in pos.items():
-        nx.draw_networkx_nodes(
-            G, {node: (x, y)}, 
-            nodelist=[node], 
-            node_color=node_colors[node],
-            node_size=3000, 
-            alpha=0.8,
-            edgecolors='black',
-            linewidths=1
-        )
+    # Vẽ tất cả các nút trong một lần gọi / Draw all nodes in a single call
+    nodelist = list(pos)
+    nx.draw_networkx_nodes(
+        G, pos, 
+        nodelist=nodelist, 
+        node_color=[node_colors[node] for node in nodelist],
+        node_size=3000, 
+        alpha=0.8,
+        edgecolors='black',
+        linewidths=1
+    )
     
     # Vẽ cạnh với mũi tên và màu sắc tốt hơn / Draw edges with arrows and better colors
     nx.draw_networkx_edges(
@@ -628,7 +1126,7 @@ def create_workflow_chart(save_path=None):
     )
     
     # Thêm nhãn / Add labels
-    custom_labels = {node: data['label'] for node, data in G.nodes(data=True)}
+    custom_labels = dict(nodes)
     nx.draw_networkx_labels(G, pos, labels=custom_labels, font_size=12, font_family='sans-serif', font_weight='bold')
     
     # Thêm tiêu đề / Add title
@@ -651,11 +1149,9 @@ def create_workflow_chart(save_path=None):
     plt.figtext(0.5, 0.01, "VietnamWind Analysis Tool", 
                 ha="center", fontsize=12, alpha=0.5)
     
-    # Lưu biểu đồ / Save chart
-    if save_path is None:
-        save_path = ASSETS_DIR / 'workflow.png'
-    
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    # Lưu biểu đồ theo định dạng của đuôi file / Save chart in the format given by the file suffix
+    _save_chart(plt, save_path)
+    _chart_key_path(save_path).write_text(_chart_key() + '\n')
     print(f"Đã lưu biểu đồ quy trình tại / Workflow chart saved at: {save_path}")
     
     # Đóng hình / Close figure
@@ -668,20 +1164,15 @@ def list_available_regions():
     Liệt kê các tỉnh/thành phố có sẵn để phân tích
     List available provinces/cities for analysis
     """
-    # Tạo đối tượng phân tích tiềm năng gió
-    # Create wind potential analyzer object
-    analyzer = WindPotentialAnalyzer()
-    
-    # Đọc dữ liệu tỉnh/thành phố
-    # Read province data
-    province_file = DATA_DIR / 'vietnam_provinces.geojson'
+    # Đọc dữ liệu tỉnh/thành phố (dùng lại nếu đã đọc)
+    # Read province data (reused if already read)
+    province_file = PROVINCE_FILE
     if not province_file.exists():
         print(f"Lỗi: Không tìm thấy file ranh giới tỉnh/thành phố: {province_file}")
         print(f"Error: Province boundary file not found: {province_file}")
         return []
         
-    analyzer.load_provinces(province_file)
-    regions = analyzer.list_available_regions()
+    regions = _load_provinces().list_available_regions()
     
     print("\nCác tỉnh/thành phố có sẵn để phân tích / Available provinces/cities for analysis:")
     for region in regions:
@@ -696,23 +1187,31 @@ def check_required_files():
     """
     required_files = [
         DATA_DIR / 'vietnam.geojson',
-        DATA_DIR / 'VNM_wind-speed_100m.tif',
-        DATA_DIR / 'vietnam_provinces.geojson'
+        _wind_file(),
+        PROVINCE_FILE
     ]
     
-    missing_files = [str(f) for f in required_files if not f.exists()]
-    
-    if missing_files:
+    # Trường hợp thường gặp là đủ file: all() dừng ở file thiếu đầu tiên, danh sách chỉ tạo khi báo lỗi
+    # The common case is that every file exists: all() stops at the first missing one, the list is built only to report
+    if not all(f.exists() for f in required_files):
         print("Lỗi: Không tìm thấy các file dữ liệu sau:")
         print("Error: The following data files were not found:")
-        for f in missing_files:
-            print(f"  - {f}")
+        for f in required_files:
+            if not f.exists():
+                print(f"  - {f}")
         print("\nBạn cần tải dữ liệu từ Global Wind Atlas: https://globalwindatlas.info/area/Vietnam")
         print("You need to download data from Global Wind Atlas: https://globalwindatlas.info/area/Vietnam")
         print("Và đặt vào thư mục data/ với cấu trúc như đã mô tả trong README.md")
         print("And place them in the data/ directory with the structure described in README.md")
         return False
     
+    # Tạo bản sao đơn giản hóa của ranh giới tỉnh/thành phố một lần, dùng file gốc nếu không ghi được
+    # Create the simplified province copy once, falling back to the full file if it cannot be written
+    try:
+        prepare_simplified_provinces()
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Không thể đơn giản hóa ranh giới tỉnh/thành phố / Could not simplify province boundaries: {e}")
+    
     # Kiểm tra thư viện Folium / Check Folium library
     if not FOLIUM_AVAILABLE:
         print("\nChú ý: Thư viện folium chưa được cài đặt.")
@@ -722,7 +1221,7 @@ def check_required_files():
     
     return True
 
-def create_interactive_map_workflow(save_path=None):
+def create_interactive_map_workflow(save_path=None, force=False, fmt='png'):
     """
     Tạo biểu đồ quy trình cho việc tạo bản đồ tương tác (option 4 từ menu demo)
     Create workflow chart for interactive map creation (option 4 from demo menu)
@@ -732,6 +1231,12 @@ def create_interactive_map_workflow(save_path=None):
     save_path : str or Path, optional
         Đường dẫn để lưu biểu đồ. Nếu None, sẽ lưu vào thư mục assets/images
         Path to save the chart. If None, will save to assets/images directory
+    force : bool, default=False
+        Vẽ lại kể cả khi biểu đồ đã lưu khớp với mã nguồn hiện tại
+        Redraw even if the saved chart matches the current source code
+    fmt : str, default='png'
+        Định dạng khi save_path là None ('png' hoặc 'svg' dạng vector)
+        Format used when save_path is None ('png' or vector 'svg')
         
     Returns:
     --------
@@ -742,6 +1247,14 @@ def create_interactive_map_workflow(save_path=None):
     print("\n=== Tạo biểu đồ quy trình cho bản đồ tương tác (Option 4) ===")
     print("=== Creating workflow chart for interactive map (Option 4) ===\n")
     
+    # Biểu đồ là ảnh tĩnh, chỉ vẽ lại khi mã nguồn thay đổi
+    # The chart is a static image, only redraw it when the source code changes
+    if save_path is None:
+        save_path = ASSETS_DIR / f'interactive_map_workflow.{fmt}'
+    if not force and _is_chart_current(save_path):
+        print(f"Biểu đồ đã có, bỏ qua / Chart is up to date, skipping: {save_path}")
+        return str(save_path)
+    
     if not NETWORKX_AVAILABLE:
         print("Thư viện networkx không khả dụng. Không thể tạo biểu đồ workflow.")
         print("Networkx library not available. Cannot create workflow chart.")
@@ -753,138 +1266,55 @@ def create_interactive_map_workflow(save_path=None):
     # Create assets directory if it doesn't exist
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Tạo đồ thị / Create graph
-    G = nx.DiGraph()
-    
-    # Các bước trong quy trình tạo bản đồ tương tác / Steps in interactive map workflow
-    nodes = [
-        ("start", "Bắt đầu\nStart"),
-        ("load_data", "Tải dữ liệu ranh giới và gió\nLoad boundary and wind data"),
-        ("region_select", "Chọn khu vực (Cả nước hoặc tỉnh)\nSelect region (Country/Province)"),
-        ("voronoi", "Tạo đa giác Voronoi\nCreate Voronoi Polygons"),
-        ("statistics", "Tính toán thống kê gió\nCalculate Wind Statistics"),
-        ("folium_map", "Khởi tạo bản đồ Folium\nInitialize Folium Map"),
-        ("basemaps", "Thêm các lớp bản đồ nền\nAdd Basemap Layers"),
-        ("choropleth", "Thêm lớp choropleth\nAdd Choropleth Layer"),
-        ("tooltips", "Thêm tooltips tương tác\nAdd Interactive Tooltips"),
-        ("controls", "Thêm các công cụ điều khiển\nAdd Control Tools"),
-        ("style", "Thêm CSS cải thiện giao diện\nAdd CSS Enhancements"),
-        ("responsive", "Thêm tính năng responsive\nAdd Responsive Features"),
-        ("save_html", "Lưu bản đồ dưới dạng HTML\nSave Map as HTML"),
-        ("end", "Hoàn thành\nComplete")
-    ]
-    
-    # Thêm nút và nhãn / Add nodes and labels
-    for node_id, label in nodes:
-        G.add_node(node_id, label=label)
-    
-    # Thêm cạnh / Add edges
-    edges = [
-        ("start", "load_data"),
-        ("load_data", "region_select"),
-        ("region_select", "voronoi"),
-        ("voronoi", "statistics"),
-        ("statistics", "folium_map"),
-        ("folium_map", "basemaps"),
-        ("basemaps", "choropleth"),
-        ("choropleth", "tooltips"),
-        ("tooltips", "controls"),
-        ("controls", "style"),
-        ("style", "responsive"),
-        ("responsive", "save_html"),
-        ("save_html", "end")
-    ]
+    # Nạp networkx và pyplot khi cần (Import networkx and pyplot on demand)
+    import networkx as nx
+    plt = _pyplot()
     
-    # Thêm cạnh vào đồ thị / Add edges to graph
-    for src, dst in edges:
-        G.add_edge(src, dst)
-    
-    # Tạo layout cho đồ thị / Create layout for graph
-    pos = {
-        "start": (0, 0),
-        "load_data": (0, -1),
-        "region_select": (0, -2),
-        "voronoi": (0, -3),
-        "statistics": (0, -4),
-        "folium_map": (0, -5),
-        "basemaps": (1, -5.5),
-        "choropleth": (1, -6.5),
-        "tooltips": (1, -7.5),
-        "controls": (1, -8.5),
-        "style": (0, -9),
-        "responsive": (0, -10),
-        "save_html": (0, -11),
-        "end": (0, -12)
-    }
+    # Đồ thị, màu và nhãn đều suy ra từ một danh sách bước duy nhất, vị trí tính theo tầng
+    # Graph, colors and labels are derived from a single list of steps, positions are layered
+    G = nx.DiGraph()
+    G.add_nodes_from((step.id, {"label": step.label}) for step in INTERACTIVE_MAP_WORKFLOW)
+    G.add_edges_from(zip([step.id for step in INTERACTIVE_MAP_WORKFLOW[:-1]],
+                         [step.id for step in INTERACTIVE_MAP_WORKFLOW[1:]]))
+    pos = _layered_layout(G)
     
     # Tạo hình với kích thước lớn hơn / Create figure with larger size
     plt.figure(figsize=(14, 16))
     
-    # Vẽ nút với màu sắc chuyên nghiệp / Draw nodes with professional colors
-    node_colors = {
-        "start": "#4287f5",     # Xanh dương / Blue
-        "load_data": "#42c5f5", # Xanh dương nhạt / Light blue
-        "region_select": "#42f5e3", # Xanh lá nhạt / Light green
-        "voronoi": "#42f59e",   # Xanh lục / Green
-        "statistics": "#f5d442", # Vàng / Yellow
-        "folium_map": "#f59e42", # Cam / Orange
-        "basemaps": "#f57d42",  # Cam đậm / Dark orange
-        "choropleth": "#f55d42", # Đỏ cam / Red-orange
-        "tooltips": "#f54242",  # Đỏ / Red
-        "controls": "#f542aa",  # Hồng / Pink
-        "style": "#d642f5",     # Tím / Purple
-        "responsive": "#9e42f5", # Tím nhạt / Light purple
-        "save_html": "#7142f5", # Tím xanh / Blue-purple
-        "end": "#4287f5"        # Xanh dương / Blue
-    }
-    
-    # Vẽ nút / Draw nodes
-    for node, (x, y) in pos.items():
-        nx.draw_networkx_nodes(
-            G, {node: (x, y)}, 
-            nodelist=[node], 
-            node_color=node_colors[node],
-            node_size=3000, 
-            alpha=0.8,
-            edgecolors='black',
-            linewidths=1
-        )
+    # Vẽ tất cả các nút trong một lần gọi / Draw all nodes in a single call
+    nx.draw_networkx_nodes(
+        G, pos, 
+        nodelist=[step.id for step in INTERACTIVE_MAP_WORKFLOW], 
+        node_color=[step.color for step in INTERACTIVE_MAP_WORKFLOW],
+        node_size=3000, 
+        alpha=0.8,
+        edgecolors='black',
+        linewidths=1
+    )
     
-    # Vẽ cạnh với mũi tên và màu sắc tốt hơn / Draw edges with arrows and better colors
-    edge_arrows = {}
-    for u, v in G.edges():
-        arrow = FancyArrowPatch(
-            posA=pos[u], posB=pos[v],
-            arrowstyle='-|>',
-            color='gray',
-            connectionstyle='arc3,rad=0.1',
-            lw=2
-        )
-        edge_arrows[(u, v)] = arrow
-        plt.gca().add_patch(arrow)
+    # Vẽ tất cả các cạnh với mũi tên trong một lần gọi / Draw all edges with arrows in a single call
+    nx.draw_networkx_edges(
+        G, pos, 
+        width=2, 
+        edge_color='gray',
+        arrows=True,
+        arrowsize=20,
+        arrowstyle='-|>',
+        connectionstyle='arc3,rad=0.1',
+        node_size=3000
+    )
     
     # Thêm nhãn / Add labels
-    custom_labels = {node: data['label'] for node, data in G.nodes(data=True)}
+    custom_labels = {step.id: step.label for step in INTERACTIVE_MAP_WORKFLOW}
     nx.draw_networkx_labels(G, pos, labels=custom_labels, font_size=12, font_family='sans-serif', font_weight='bold')
     
     # Thêm tiêu đề / Add title
     plt.title("Quy trình tạo bản đồ tương tác (Option 4)\nInteractive Map Workflow (Option 4)", 
               fontsize=20, fontweight='bold', pad=30)
     
-    # Phân loại các nhóm quy trình chính / Categorize main process groups
-    process_groups = {
-        "Chuẩn bị dữ liệu / Data Preparation": ["start", "load_data", "region_select", "voronoi", "statistics"],
-        "Tạo bản đồ / Map Creation": ["folium_map", "basemaps", "choropleth", "tooltips", "controls"],
-        "Hoàn thiện / Finalization": ["style", "responsive", "save_html", "end"]
-    }
-    
     # Tạo chú thích cho các nhóm quy trình / Create legend for process groups
     legend_elements = []
-    group_colors = {
-        "Chuẩn bị dữ liệu / Data Preparation": "#42c5f5",
-        "Tạo bản đồ / Map Creation": "#f59e42",
-        "Hoàn thiện / Finalization": "#9e42f5"
-    }
+    group_colors = WORKFLOW_GROUP_COLORS
     
     for group_name, color in group_colors.items():
         legend_elements.append(plt.Line2D([0], [0], marker='o', color='w', markerfacecolor=color, 
@@ -893,27 +1323,16 @@ def create_interactive_map_workflow(save_path=None):
     plt.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, 1.05),
                ncol=3, fontsize=12, frameon=True, fancybox=True, shadow=True)
     
-    # Thêm mô tả cho từng bước / Add descriptions for each step
-    descriptions = {
-        "load_data": "Đọc dữ liệu ranh giới và dữ liệu tốc độ gió từ file",
-        "region_select": "Lựa chọn phân tích toàn quốc hoặc tỉnh cụ thể",
-        "voronoi": "Tạo các ô Voronoi để phân tích dữ liệu",
-        "statistics": "Tính toán tốc độ gió trung bình cho từng ô",
-        "folium_map": "Khởi tạo bản đồ với tọa độ trung tâm",
-        "basemaps": "Thêm nhiều lớp bản đồ nền (sáng, tối, vệ tinh)",
-        "choropleth": "Tạo lớp màu sắc hiển thị tốc độ gió",
-        "tooltips": "Thêm hiển thị thông tin khi di chuột qua",
-        "controls": "Thêm công cụ tìm kiếm, đo khoảng cách, vẽ",
-        "style": "Tùy chỉnh giao diện theo phong cách hiện đại",
-        "responsive": "Đảm bảo bản đồ hiển thị tốt trên mọi thiết bị",
-        "save_html": "Lưu bản đồ thành file HTML tương tác"
-    }
-    
     # Thêm mô tả vào biểu đồ / Add descriptions to chart
-    for node, description in descriptions.items():
-        x, y = pos[node]
-        plt.text(x + 1.5, y, description, fontsize=10, ha='left', va='center',
-                 bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.5'))
+    for step in INTERACTIVE_MAP_WORKFLOW:
+        if step.description:
+            x, y = pos[step.id]
+            plt.text(x + 1.5, y, step.description, fontsize=10, ha='left', va='center',
+                     bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.5'))
+    
+    # Chừa chỗ bên phải cho phần mô tả / Leave room on the right for the descriptions
+    xs = [x for x, _ in pos.values()]
+    plt.xlim(min(xs) - 1, max(xs) + 3)
     
     # Bỏ trục / Turn off axis
     plt.axis('off')
@@ -922,11 +1341,9 @@ def create_interactive_map_workflow(save_path=None):
     plt.figtext(0.5, 0.01, "VietnamWind Analysis Tool - Option 4 Workflow", 
                 ha="center", fontsize=12, alpha=0.5)
     
-    # Lưu biểu đồ / Save chart
-    if save_path is None:
-        save_path = ASSETS_DIR / 'interactive_map_workflow.png'
-    
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    # Lưu biểu đồ theo định dạng của đuôi file / Save chart in the format given by the file suffix
+    _save_chart(plt, save_path)
+    _chart_key_path(save_path).write_text(_chart_key() + '\n')
     print(f"Đã lưu biểu đồ quy trình tại / Workflow chart saved at: {save_path}")
     
     # Đóng hình / Close figure
@@ -942,9 +1359,15 @@ def main():
     # Tạo parser dòng lệnh / Create command line parser
     parser = argparse.ArgumentParser(description='Tạo bản đồ tương tác phân tích tiềm năng gió Việt Nam / Create interactive map for Vietnam wind potential analysis')
     
-    parser.add_argument('--region', type=str, default=None, 
-                        help='Tên tỉnh/thành phố, ví dụ: "Gia Lai". Mặc định sẽ phân tích toàn bộ Việt Nam. / Province name, e.g., "Gia Lai". Default analyzes entire Vietnam.')
-    parser.add_argument('--points', type=int, default=100, 
+    parser.add_argument('--region', type=str, default=os.environ.get('VW_REGION') or None, 
+                        help='Tên tỉnh/thành phố, ví dụ: "Gia Lai". Mặc định lấy từ VW_REGION hoặc toàn bộ Việt Nam. / Province name, e.g., "Gia Lai". Defaults to VW_REGION or the entire Vietnam.')
+    parser.add_argument('--regions', type=str, nargs='+', default=None,
+                        help='Tạo song song bản đồ cho nhiều tỉnh/thành phố / Create maps for several provinces/cities in parallel')
+    parser.add_argument('--regions-all', action='store_true',
+                        help='Tạo song song bản đồ cho tất cả tỉnh/thành phố / Create maps for every province/city in parallel')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Số tiến trình cho --regions/--regions-all, mặc định một nửa số lõi CPU / Processes for --regions/--regions-all, defaults to half the CPU cores')
+    parser.add_argument('--points', type=int, default=int(os.environ.get('VW_POINTS') or 100), 
                         help='Số lượng điểm để tạo các đa giác Voronoi. Mặc định: 100 / Number of points to create Voronoi polygons. Default: 100')
     parser.add_argument('--list-regions', action='store_true', 
                         help='Liệt kê các tỉnh/thành phố có sẵn để phân tích rồi thoát / List available provinces/cities for analysis then exit')
@@ -952,6 +1375,10 @@ def main():
                         help='Tạo biểu đồ quy trình phân tích tiềm năng gió / Create wind potential analysis workflow chart')
     parser.add_argument('--option4-workflow', action='store_true',
                         help='Tạo biểu đồ quy trình cho tạo bản đồ tương tác (Option 4) / Create workflow chart for interactive map (Option 4)')
+    parser.add_argument('--force', action='store_true',
+                        help='Vẽ lại biểu đồ quy trình kể cả khi đã có / Redraw workflow charts even if they are up to date')
+    parser.add_argument('--svg', action='store_true',
+                        help='Lưu biểu đồ quy trình dạng SVG (vector, nhỏ hơn PNG) / Save workflow charts as SVG (vector, smaller than PNG)')
     
     args = parser.parse_args()
     
@@ -966,12 +1393,19 @@ def main():
     
     # Tạo biểu đồ quy trình nếu được yêu cầu / Create workflow chart if requested
     if args.workflow:
-        create_workflow_chart()
+        create_workflow_chart(force=args.force, fmt='svg' if args.svg else 'png')
         return
         
     # Tạo biểu đồ quy trình Option 4 nếu được yêu cầu / Create Option 4 workflow chart if requested
     if args.option4_workflow:
-        create_interactive_map_workflow()
+        create_interactive_map_workflow(force=args.force, fmt='svg' if args.svg else 'png')
+        return
+    
+    # Tạo song song bản đồ cho nhiều tỉnh/thành phố / Create maps for several provinces/cities in parallel
+    if args.regions_all:
+        args.regions = _load_provinces().list_available_regions()
+    if args.regions:
+        create_maps_for_regions(args.regions, num_points=args.points, jobs=args.jobs)
         return
     
     # Tạo bản đồ tương tác / Create interactive map
@@ -981,10 +1415,22 @@ def main():
         save_html=True
     )
 
+def _prompt(message, env_var):
+    """
+    Đọc câu trả lời từ biến môi trường nếu có, nếu không hỏi người dùng
+    Read the answer from an environment variable if set, otherwise ask the user
+    """
+    value = os.environ.get(env_var)
+    if value is not None:
+        print(f"{message}{value}  ({env_var})")
+        return value
+    return input(message)
+
 if __name__ == "__main__":
     # Khi chạy như một script độc lập / When running as a standalone script
-    if len(sys.argv) > 1:
-        # Chạy với các tham số dòng lệnh / Run with command line parameters
+    if len(sys.argv) > 1 or not sys.stdin.isatty():
+        # Chạy với các tham số dòng lệnh, hoặc không có terminal (cron, pipeline, chạy song song)
+        # Run with command line parameters, or without a terminal (cron, pipelines, parallel runs)
         main()
     else:
         # Chạy chế độ tương tác nếu không có tham số / Run interactive mode if no parameters
@@ -995,7 +1441,7 @@ if __name__ == "__main__":
         print("1. Tạo bản đồ tương tác / Create interactive map")
         print("2. Tạo biểu đồ quy trình chung / Create general workflow chart")
         print("3. Tạo biểu đồ quy trình option 4 / Create option 4 workflow chart")
-        function_choice = input("Lựa chọn / Choice (1/2/3): ")
+        function_choice = _prompt("Lựa chọn / Choice (1/2/3): ", 'VW_FUNCTION')
         
         if function_choice == "2":
             create_workflow_chart()
@@ -1004,7 +1450,7 @@ if __name__ == "__main__":
             create_interactive_map_workflow()
             sys.exit(0)
             
-        choice = input("Bạn muốn phân tích toàn bộ Việt Nam hay một tỉnh/thành phố cụ thể? / Do you want to analyze entire Vietnam or a specific province?\n"
+        choice = '2' if os.environ.get('VW_REGION') else input("Bạn muốn phân tích toàn bộ Việt Nam hay một tỉnh/thành phố cụ thể? / Do you want to analyze entire Vietnam or a specific province?\n"
                      "1. Toàn bộ Việt Nam / Entire Vietnam\n"
                      "2. Tỉnh/thành phố cụ thể / Specific province\n"
                      "Lựa chọn / Choice (1/2): ")
@@ -1015,9 +1461,9 @@ if __name__ == "__main__":
             if not regions:
                 sys.exit(1)
             
-            region_name = input("\nNhập tên tỉnh/thành phố (ví dụ: Gia Lai) / Enter province name (e.g., Gia Lai): ")
+            region_name = _prompt("\nNhập tên tỉnh/thành phố (ví dụ: Gia Lai) / Enter province name (e.g., Gia Lai): ", 'VW_REGION')
             
-        points = input("Số lượng điểm Voronoi (mặc định: 100) / Number of Voronoi points (default: 100): ")
+        points = _prompt("Số lượng điểm Voronoi (mặc định: 100) / Number of Voronoi points (default: 100): ", 'VW_POINTS')
         
         try:
             points = int(points) if points.strip() else 100
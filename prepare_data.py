@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chuẩn bị dữ liệu gió: chuyển GeoTIFF sang dạng tile và tạo overview
+(Prepare wind data: convert the GeoTIFF to a tiled layout with overviews)
+
+Tương đương với các lệnh GDAL sau / Equivalent to the following GDAL commands:
+    gdal_translate -of GTiff -co TILED=YES -co BLOCKXSIZE=256 -co BLOCKYSIZE=256 \\
+        -co COMPRESS=DEFLATE -co PREDICTOR=2 VNM_wind-speed_100m.tif VNM_wind-speed_100m_tiled.tif
+    gdaladdo -r average VNM_wind-speed_100m_tiled.tif 2 4 8 16 32
+
+Chạy một lần trước demo.py / Run once before demo.py:
+    python prepare_data.py
+
+Tùy chọn --quantize ghi thêm bản uint8 (tương đương gdal_translate -ot Byte -scale 0 20 0 254),
+sai số khoảng 0.04 m/s, nhỏ hơn độ bất định của mô hình gió
+(The --quantize option also writes a uint8 copy (like gdal_translate -ot Byte -scale 0 20 0 254),
+with about 0.04 m/s error, below the wind model uncertainty)
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import rasterio
+from rasterio.enums import Resampling
+
+# Đường dẫn dữ liệu
+# (Data paths)
+DATA_DIR = Path('data')
+WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m.tif'
+TILED_WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m_tiled.tif'
+QUANTIZED_WIND_FILE = DATA_DIR / 'VNM_wind-speed_100m_u8.tif'
+
+# Giá trị nodata của bản uint8, các giá trị 0-254 dùng cho tốc độ gió
+# (Nodata value of the uint8 copy, codes 0-254 hold wind speed)
+QUANTIZED_NODATA = 255
+
+def create_tiled_raster(src_path, dst_path, block_size=256, overview_levels=(2, 4, 8, 16, 32), max_speed=None):
+    """
+    Ghi bản sao GeoTIFF dạng tile, nén DEFLATE và có overview
+    (Write a tiled, DEFLATE-compressed copy of a GeoTIFF with overviews)
+
+    Parameters:
+    -----------
+    src_path : str or Path
+        File GeoTIFF gốc (Source GeoTIFF file)
+    dst_path : str or Path
+        File GeoTIFF đầu ra (Output GeoTIFF file)
+    block_size : int, optional
+        Kích thước tile theo pixel (Tile size in pixels)
+    overview_levels : tuple, optional
+        Các hệ số thu nhỏ của overview (Overview decimation factors)
+    max_speed : float, optional
+        Nếu có, lượng tử hóa 0..max_speed m/s thành uint8 và lưu hệ số scale vào metadata
+        (If given, quantize 0..max_speed m/s to uint8 and store the scale factor in the metadata)
+    """
+    with rasterio.open(src_path) as src:
+        profile = src.profile.copy()
+        # Dự đoán dấu phẩy động (3) cho dữ liệu float, sai phân ngang (2) cho số nguyên
+        # (Floating-point predictor (3) for float data, horizontal differencing (2) for integers)
+        predictor = 3 if np.dtype(src.dtypes[0]).kind == 'f' else 2
+        profile.update(driver='GTiff', tiled=True, blockxsize=block_size, blockysize=block_size,
+                       compress='deflate', predictor=predictor, interleave='band')
+        if max_speed is not None:
+            scale = max_speed / (QUANTIZED_NODATA - 1)
+            profile.update(dtype='uint8', nodata=QUANTIZED_NODATA, predictor=2)
+
+        # Sao chép theo từng tile để không phải đọc toàn bộ raster vào bộ nhớ
+        # (Copy tile by tile so the whole raster never sits in memory)
+        with rasterio.open(dst_path, 'w', **profile) as dst:
+            for _, window in dst.block_windows(1):
+                data = src.read(window=window, masked=max_speed is not None)
+                if max_speed is not None:
+                    codes = np.clip(np.round(data.filled(0) / scale), 0, QUANTIZED_NODATA - 1)
+                    data = np.where(np.ma.getmaskarray(data), QUANTIZED_NODATA, codes).astype('uint8')
+                dst.write(data, window=window)
+            if max_speed is not None:
+                dst.scales = (scale,) * dst.count
+                dst.offsets = (0.0,) * dst.count
+
+    # Tạo overview bằng phép lấy trung bình (Build overviews with average resampling)
+    levels = [level for level in overview_levels if level < max(profile['width'], profile['height'])]
+    with rasterio.open(dst_path, 'r+') as dst:
+        dst.build_overviews(levels, Resampling.average)
+        dst.update_tags(ns='rio_overview', resampling='average')
+
+    print(f"Đã tạo raster dạng tile với overview {levels}: {dst_path}")
+    print(f"Created tiled raster with overviews {levels}: {dst_path}")
+
+def main():
+    """
+    Hàm chính để chạy từ dòng lệnh
+    (Main function to run from command line)
+    """
+    parser = argparse.ArgumentParser(description='Chuẩn bị dữ liệu gió / Prepare wind data')
+    parser.add_argument('--input', type=str, default=str(WIND_FILE),
+                        help='File GeoTIFF gốc / Source GeoTIFF file')
+    parser.add_argument('--output', type=str, default=str(TILED_WIND_FILE),
+                        help='File GeoTIFF dạng tile / Tiled GeoTIFF file')
+    parser.add_argument('--quantize', action='store_true',
+                        help='Ghi thêm bản uint8 để đọc nhanh hơn / Also write a uint8 copy for faster reads')
+    parser.add_argument('--max-speed', type=float, default=20.0,
+                        help='Tốc độ gió tối đa khi lượng tử hóa (m/s) / Maximum wind speed when quantizing (m/s)')
+    parser.add_argument('--force', action='store_true',
+                        help='Tạo lại kể cả khi file đầu ra còn mới / Rebuild even if the output is up to date')
+    args = parser.parse_args()
+
+    src_path, dst_path = Path(args.input), Path(args.output)
+    if not src_path.exists():
+        print(f"Lỗi: Không tìm thấy file dữ liệu gió: {src_path}")
+        print(f"Error: Wind data file not found: {src_path}")
+        return
+
+    outputs = [(dst_path, None)]
+    if args.quantize:
+        outputs.append((QUANTIZED_WIND_FILE, args.max_speed))
+
+    for output_path, max_speed in outputs:
+        # Bỏ qua nếu file đầu ra mới hơn file gốc (Skip if the output is newer than the source)
+        if not args.force and output_path.exists() and output_path.stat().st_mtime >= src_path.stat().st_mtime:
+            print(f"File đã được chuẩn bị, bỏ qua: {output_path}")
+            print(f"File already prepared, skipping: {output_path}")
+            continue
+
+        create_tiled_raster(src_path, output_path, max_speed=max_speed)
+
+if __name__ == "__main__":
+    main()
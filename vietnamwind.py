@@ -3,8 +3,6 @@ import geopandas as gpd
 import matplotlib.pyplot as plt
 import rasterio
 import rasterio.plot
-import rasterio.mask
-from rasterstats import zonal_stats
 import numpy as np
 import os
 import fiona
@@ -24,6 +22,208 @@ except ImportError:
     def tqdm(iterable, *args, **kwargs):
         return iterable
 
+# exactextract (tùy chọn) tính thống kê vùng trong C++ với một lần đọc raster
+# (Optional exactextract computes zonal statistics in C++ with a single raster pass)
+try:
+    from exactextract import exact_extract
+    EXACTEXTRACT_AVAILABLE = True
+except ImportError:
+    EXACTEXTRACT_AVAILABLE = False
+
+# orjson (tùy chọn) đọc GeoJSON nhanh khi không có pyogrio
+# (Optional orjson reads GeoJSON quickly when pyogrio is not installed)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Các tên "crs" kiểu cũ tương đương WGS84 trong GeoJSON (Legacy GeoJSON "crs" names equivalent to WGS84)
+WGS84_CRS_NAMES = ('urn:ogc:def:crs:OGC:1.3:CRS84', 'urn:ogc:def:crs:EPSG::4326', 'EPSG:4326')
+
+def _read_geojson_orjson(path):
+    """
+    Đọc FeatureCollection GeoJSON bằng orjson và shapely.from_geojson, không qua OGR
+    (Read a GeoJSON FeatureCollection with orjson and shapely.from_geojson, bypassing OGR)
+    
+    Returns None nếu file khai báo "crs" kiểu cũ khác WGS84 hoặc không phải FeatureCollection
+    (Returns None if the file declares a legacy non-WGS84 "crs" member or is not a FeatureCollection)
+    """
+    import shapely
+    
+    collection = orjson.loads(Path(path).read_bytes())
+    crs_name = (collection.get('crs') or {}).get('properties', {}).get('name', 'urn:ogc:def:crs:OGC:1.3:CRS84')
+    if collection.get('type') != 'FeatureCollection' or crs_name not in WGS84_CRS_NAMES:
+        return None
+    
+    features = collection['features']
+    geometries = shapely.from_geojson([orjson.dumps(feature['geometry']) for feature in features])
+    properties = pd.DataFrame([feature.get('properties') or {} for feature in features])
+    # GeoJSON luôn dùng WGS84 (RFC 7946) (GeoJSON is always WGS84 per RFC 7946)
+    return gpd.GeoDataFrame(properties, geometry=geometries, crs='EPSG:4326')
+
+def read_cache_file(path, reader):
+    """
+    Đọc một file bộ đệm; nếu file hỏng (ví dụ ghi dở) thì xóa nó để lần chạy này tạo lại
+    (Read a cache file; if it is corrupt (e.g. a partial write) delete it so this run rebuilds it)
+    
+    Parameters:
+    -----------
+    path : str or Path
+        Đường dẫn file bộ đệm (Path of the cache file)
+    reader : callable
+        Hàm đọc file, ví dụ gpd.read_parquet (Function reading the file, e.g. gpd.read_parquet)
+        
+    Returns:
+    --------
+    Kết quả của reader, hoặc None nếu không có file, thiếu pyarrow hoặc file hỏng
+    (The reader's result, or None if the file is missing, pyarrow is unavailable or the file is corrupt)
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        return reader(path)
+    except ImportError:
+        return None
+    except (OSError, ValueError) as e:
+        # ArrowInvalid là một ValueError (ArrowInvalid is a ValueError)
+        print(f"Bộ đệm hỏng, tạo lại / Corrupt cache, rebuilding: {path} ({e})")
+        path.unlink(missing_ok=True)
+        return None
+
+def write_cache_file(path, writer):
+    """
+    Ghi file bộ đệm qua một file tạm cùng thư mục rồi os.replace, để tiến trình khác không bao giờ
+    đọc phải file ghi dở và lỗi giữa chừng không để lại file hỏng
+    (Write a cache file through a temporary file in the same directory and os.replace, so other processes
+    never read a partial file and a crash midway leaves no corrupt file behind)
+    
+    Parameters:
+    -----------
+    path : str or Path
+        Đường dẫn file bộ đệm (Path of the cache file)
+    writer : callable
+        Hàm ghi nhận đường dẫn file tạm, ví dụ gdf.to_parquet (Function writing to the temporary path, e.g. gdf.to_parquet)
+        
+    Returns:
+    --------
+    bool
+        True nếu đã ghi, False nếu thiếu pyarrow hoặc thư mục không ghi được
+        (True if written, False if pyarrow is unavailable or the directory is not writable)
+    """
+    import tempfile
+    
+    path = Path(path)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.stem}-', suffix=path.suffix)
+        os.close(fd)
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except (ImportError, OSError):
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+        return False
+
+def read_vector_file(path):
+    """
+    Đọc file vector (GeoJSON) bằng pyogrio + Arrow (hoặc orjson nếu không có pyogrio), lưu một bản GeoParquet
+    bên cạnh để lần sau đọc nhanh hơn
+    (Read a vector file (GeoJSON) with pyogrio + Arrow (or orjson without pyogrio), keeping a GeoParquet copy
+    next to it for faster later reads)
+    
+    Parameters:
+    -----------
+    path : str or Path
+        Đường dẫn đến file vector (Path to the vector file)
+        
+    Returns:
+    --------
+    GeoDataFrame
+    """
+    import importlib.util
+    
+    path = Path(path)
+    parquet_path = path.with_suffix('.parquet')
+    has_arrow = importlib.util.find_spec('pyarrow') is not None
+    
+    # Dùng bản GeoParquet nếu nó mới hơn file gốc (Use the GeoParquet copy if it is newer than the source)
+    if has_arrow and parquet_path.exists() and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+        # Bản sao hỏng bị xóa và file gốc được đọc lại (A corrupt copy is dropped and the source re-read)
+        gdf = read_cache_file(parquet_path, gpd.read_parquet)
+        if gdf is not None:
+            return gdf
+    
+    gdf = None
+    if importlib.util.find_spec('pyogrio') is not None:
+        gdf = gpd.read_file(path, engine='pyogrio', use_arrow=has_arrow)
+    elif ORJSON_AVAILABLE and path.suffix.lower() in ('.geojson', '.json'):
+        # Không có pyogrio: đọc GeoJSON thuần bằng orjson thay vì Fiona (No pyogrio: read plain GeoJSON with orjson instead of Fiona)
+        gdf = _read_geojson_orjson(path)
+    if gdf is None:
+        gdf = gpd.read_file(path)
+    
+    if has_arrow:
+        # Thư mục dữ liệu chỉ đọc thì bỏ qua bộ đệm (A read-only data directory just skips the cache)
+        write_cache_file(parquet_path, gdf.to_parquet)
+    return gdf
+
+# Kiểu hiển thị tooltip của mpld3 (mpld3 tooltip style)
+TOOLTIP_CSS = '''
+    .mpld3-tooltip {
+        background-color: white;
+        border: 1px solid black;
+        border-radius: 5px;
+        padding: 5px;
+        font-family: Arial, sans-serif;
+    }
+'''
+
+# Mẫu nhãn tooltip của mỗi ô, phần lân cận chỉ thêm khi có (Tooltip label template per cell, the neighbor line is optional)
+TOOLTIP_TEMPLATE = "Tốc độ gió: {mean} m/s\nWind speed: {mean} m/s"
+NEIGHBOR_TOOLTIP_TEMPLATE = TOOLTIP_TEMPLATE + "\nTB ô lân cận / Neighbors' mean: {neighbor} m/s"
+
+# Trang HTML gồm một ảnh PNG và bản đồ ảnh với một thẻ <area> cho mỗi ô
+# (HTML page made of one PNG image and an image map with one <area> tag per cell)
+IMAGEMAP_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>{css}
+    .mpld3-tooltip {{ position: absolute; display: none; pointer-events: none; white-space: pre-line; }}
+</style>
+</head>
+<body>
+<img src="data:image/png;base64,{png}" usemap="#cells" width="{width}" height="{height}" alt="{title}">
+<map name="cells">
+{areas}
+</map>
+<div class="mpld3-tooltip" id="tooltip"></div>
+<script>
+var tooltip = document.getElementById('tooltip');
+document.querySelectorAll('area').forEach(function (area) {{
+    area.addEventListener('mouseenter', function () {{
+        var d = area.dataset;
+        tooltip.textContent = 'Tốc độ gió / Wind speed: ' + d.mean + ' m/s\\n' +
+            'Độ lệch chuẩn / Std: ' + d.std + ' m/s\\n' +
+            "TB ô lân cận / Neighbors' mean: " + d.neighbor + ' m/s';
+        tooltip.style.display = 'block';
+    }});
+    area.addEventListener('mousemove', function (e) {{
+        tooltip.style.left = (e.pageX + 10) + 'px';
+        tooltip.style.top = (e.pageY + 10) + 'px';
+    }});
+    area.addEventListener('mouseleave', function () {{ tooltip.style.display = 'none'; }});
+}});
+</script>
+</body>
+</html>
+'''
+
 class WindPotentialAnalyzer:
     """
     Một lớp để phân tích tiềm năng gió dựa trên dữ liệu GIS.
@@ -59,15 +259,37 @@ class WindPotentialAnalyzer:
         """
         print(f"Đọc dữ liệu ranh giới từ: {boundary_file}")
         print(f"Reading boundary data from: {boundary_file}")
-        self.catchments = gpd.read_file(boundary_file)
+        self.catchments = read_vector_file(boundary_file)
         
         print(f"Đọc dữ liệu gió từ: {wind_file}")
         print(f"Reading wind data from: {wind_file}")
         self.demdata = rasterio.open(wind_file)
         
+        # Dữ liệu lượng tử hóa (uint8) lưu hệ số scale/offset trong metadata của band
+        # (Quantized (uint8) data stores its scale/offset in the band metadata)
+        if self.demdata.dtypes[0] == 'uint8':
+            scale, offset = self.demdata.scales[0], self.demdata.offsets[0]
+            print(f"Dữ liệu gió đã lượng tử hóa: m/s = giá trị * {scale:.4f} + {offset}")
+            print(f"Quantized wind data: m/s = value * {scale:.4f} + {offset}")
+        
         return self
     
-    def load_provinces(self, province_file):
+    def _wind_values(self, data):
+        """
+        Chuyển giá trị đọc từ raster sang tốc độ gió (m/s) theo scale/offset của band
+        (Convert raw raster values to wind speed (m/s) using the band scale/offset)
+        
+        Parameters:
+        -----------
+        data : numpy.ndarray
+            Giá trị đọc trực tiếp từ raster (Values read directly from the raster)
+        """
+        scale, offset = self.demdata.scales[0], self.demdata.offsets[0]
+        if scale == 1 and offset == 0:
+            return data
+        return data * scale + offset
+    
+    def load_provinces(self, province_file, simplify_tolerance=None):
         """
         Đọc dữ liệu ranh giới các tỉnh/thành phố
         (Read province boundaries data)
@@ -77,10 +299,20 @@ class WindPotentialAnalyzer:
         province_file : str
             Đường dẫn đến file ranh giới các tỉnh dạng geojson
             (Path to the provinces boundary file in geojson format)
+        simplify_tolerance : float, optional
+            Dung sai đơn giản hóa ranh giới theo đơn vị của hệ tọa độ (0.001 độ ≈ 100 m), chỉ nên dùng
+            khi ranh giới chỉ để hiển thị vì nó thay đổi vùng cắt và thống kê. Mặc định None giữ ranh giới gốc.
+            (Boundary simplification tolerance in CRS units (0.001 degrees ≈ 100 m), only meant for
+            display-only boundaries since it changes masks, clips and statistics. The default None keeps the original boundaries.)
         """
         print(f"Đọc dữ liệu ranh giới các tỉnh/thành phố từ: {province_file}")
         print(f"Reading province boundaries data from: {province_file}")
-        self.province_data = gpd.read_file(province_file)
+        self.province_data = read_vector_file(province_file)
+        
+        # Chỉ đơn giản hóa khi được yêu cầu (Only simplify when asked)
+        if simplify_tolerance:
+            self.province_data['geometry'] = self.province_data.geometry.simplify(
+                simplify_tolerance, preserve_topology=True)
         
         # Đảm bảo dữ liệu có cột tên tỉnh/thành phố
         if 'name' not in self.province_data.columns and 'NAME_1' in self.province_data.columns:
@@ -153,6 +385,46 @@ class WindPotentialAnalyzer:
         regions = sorted(self.province_data['name'].tolist())
         return regions
     
+    def _read_display_window(self, region=None, max_pixels=2000):
+        """
+        Đọc tốc độ gió trong phạm vi một vùng để hiển thị, thu nhỏ để cạnh dài nhất không quá max_pixels
+        (Read wind speed within a region's extent for display, decimated so the longest side is at most max_pixels)
+        
+        Parameters:
+        -----------
+        region : GeoDataFrame, optional
+            Vùng cần đọc, các pixel ngoài vùng bị che; mặc định là toàn bộ raster
+            (Region to read, pixels outside it are masked; defaults to the whole raster)
+        max_pixels : int, optional
+            Số pixel tối đa theo cạnh dài nhất (Maximum number of pixels along the longest side)
+            
+        Returns:
+        --------
+        tuple
+            (masked array tốc độ gió, transform) ((masked wind speed array, transform))
+        """
+        from affine import Affine
+        from rasterio import features, windows
+        from rasterio.enums import Resampling
+        
+        src = self.demdata
+        window = windows.Window(0, 0, src.width, src.height)
+        if region is not None:
+            window = windows.from_bounds(*region.total_bounds, transform=src.transform)
+            window = window.round_offsets().round_lengths().intersection(windows.Window(0, 0, src.width, src.height))
+        
+        # Hệ số thu nhỏ nguyên, GDAL tự dùng overview nếu file có (Integer decimation, GDAL uses overviews when present)
+        factor = max(1, int(np.ceil(max(window.width, window.height) / max_pixels)))
+        out_shape = (max(1, int(window.height) // factor), max(1, int(window.width) // factor))
+        data = src.read(1, window=window, out_shape=out_shape, masked=True, resampling=Resampling.average)
+        transform = src.window_transform(window) * Affine.scale(window.width / out_shape[1],
+                                                                 window.height / out_shape[0])
+        
+        if region is not None:
+            outside = features.geometry_mask(region.geometry, out_shape=out_shape, transform=transform)
+            data = np.ma.masked_where(outside | np.ma.getmaskarray(data), data)
+        return self._wind_values(data), transform
+    
     def visualize_wind_data(self, figsize=(12, 10), save_path=None):
         """
         Hiển thị dữ liệu gió và ranh giới
@@ -176,26 +448,12 @@ class WindPotentialAnalyzer:
         # Lấy phạm vi hiển thị từ vùng đã chọn (Get extent from selected region)
         minx, miny, maxx, maxy = display_region.total_bounds
         
-        # Tạo mask cho dữ liệu gió (Create mask for wind data)
-        if self.selected_region is not None and self.selected_region is not self.catchments:
-            mask = None
-            try:
-                # Sử dụng ranh giới của khu vực đã chọn để mask dữ liệu gió
-                shapes = [geom.__geo_interface__ for geom in self.selected_region.geometry]
-                masked_data, masked_transform = rasterio.mask.mask(self.demdata, shapes, crop=True)
-                # Hiển thị dữ liệu gió đã mask
-                # Lưu mappable object để sử dụng cho colorbar
-                show_result = rasterio.plot.show(masked_data[0], transform=masked_transform, ax=ax, cmap='viridis')
-                img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
-            except Exception as e:
-                print(f"Không thể tạo mặt nạ cho dữ liệu gió: {e}")
-                # Hiển thị dữ liệu gió bình thường
-                show_result = rasterio.plot.show(self.demdata, ax=ax, cmap='viridis')
-                img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
-        else:
-            # Hiển thị dữ liệu gió bình thường cho toàn bộ Việt Nam
-            show_result = rasterio.plot.show(self.demdata, ax=ax, cmap='viridis')
-            img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
+        # Chỉ đọc cửa sổ raster của vùng đã chọn, thu nhỏ theo độ phân giải hiển thị
+        # (Read only the selected region's raster window, decimated to display resolution)
+        region = self.selected_region if self.selected_region is not self.catchments else None
+        wind_data, wind_transform = self._read_display_window(region)
+        show_result = rasterio.plot.show(wind_data, transform=wind_transform, ax=ax, cmap='viridis')
+        img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
         
         # Thêm thanh màu chú thích với thông tin tốc độ gió bằng tiếng Việt và tiếng Anh - cải thiện phong cách Apple
         # Tạo không gian riêng cho colorbar - đặt ở bên phải, sát với bản đồ hơn
@@ -280,7 +538,31 @@ class WindPotentialAnalyzer:
             
         return fig, ax
     
-    def create_voronoi_polygons(self, num_points=100, random_state=42):
+    def _voronoi_cache_file(self, boundary, num_points, random_state, backend, cache_dir):
+        """
+        Đường dẫn file GeoParquet lưu các đa giác Voronoi, khóa theo ranh giới và tham số tạo điểm
+        (GeoParquet file path for the Voronoi polygons, keyed by the boundary and seeding parameters)
+        """
+        import hashlib
+        import shapely
+        
+        key = hashlib.blake2b(repr((num_points, random_state, backend)).encode('utf-8'), digest_size=8)
+        for wkb in shapely.to_wkb(np.asarray(boundary.geometry.values)):
+            key.update(wkb)
+        
+        # Backend raster còn phụ thuộc lưới điểm ảnh (The raster backend also depends on the pixel grid)
+        if backend == 'raster':
+            key.update(repr((tuple(self.demdata.transform), self.demdata.shape, str(self.demdata.crs))).encode('utf-8'))
+        return Path(cache_dir) / f'voronoi_{num_points}_{key.hexdigest()}.parquet'
+    
+    def _save_voronoi_cache(self, cache_file):
+        """
+        Ghi các đa giác Voronoi ra GeoParquet nếu có pyarrow (Write the Voronoi polygons to GeoParquet if pyarrow is available)
+        """
+        # Cần pyarrow và thư mục ghi được, ghi nguyên tử (pyarrow and a writable directory are required, written atomically)
+        write_cache_file(cache_file, lambda tmp: self.voronoi_polygons.to_parquet(tmp, compression='zstd'))
+    
+    def create_voronoi_polygons(self, num_points=100, random_state=42, backend='scipy', cache_dir=None):
         """
         Tạo các đa giác Voronoi để phân tích dữ liệu
         (Create Voronoi polygons for data analysis)
@@ -289,16 +571,34 @@ class WindPotentialAnalyzer:
         -----------
         num_points : int, optional
             Số điểm để tạo đa giác Voronoi (Number of points to create Voronoi polygons)
-            Mặc định là 100 điểm, nên giữ dưới 1000 điểm để tăng tốc độ phân tích
-            (Default is 100 points, recommended to keep under 1000 points to improve analysis speed)
+            Mặc định là 100 điểm, nên giữ dưới 1000 điểm để tăng tốc độ phân tích với backend 'scipy'
+            (Default is 100 points, recommended to keep under 1000 points with the 'scipy' backend)
         random_state : int, optional
             Giá trị để tạo các điểm ngẫu nhiên có thể lặp lại (Value for reproducible random points)
+        backend : str, optional
+            'scipy' dựng đa giác từ scipy.spatial.Voronoi rồi cắt theo ranh giới;
+            'raster' gán mỗi pixel của raster gió cho điểm gần nhất rồi chuyển thành đa giác,
+            phù hợp khi số điểm lớn (hàng nghìn điểm)
+            ('scipy' builds polygons with scipy.spatial.Voronoi and clips them to the boundary;
+            'raster' labels each wind raster pixel with its nearest seed and polygonizes the labels,
+            which scales to thousands of points)
+        cache_dir : str or Path, optional
+            Thư mục lưu các đa giác dạng GeoParquet để các lần chạy sau với cùng vùng, số điểm
+            và random_state không phải dựng lại
+            (Directory caching the polygons as GeoParquet so later runs with the same region,
+            point count and random_state skip rebuilding them)
         """
         from scipy.spatial import Voronoi
         
         if self.catchments is None:
             raise ValueError("Chưa tải dữ liệu. Hãy gọi phương thức load_data() trước.")
         
+        if backend not in ('scipy', 'raster'):
+            raise ValueError(f"Backend không hợp lệ: '{backend}'. Chọn 'scipy' hoặc 'raster'.")
+        
+        if backend == 'raster' and self.demdata is None:
+            raise ValueError("Backend 'raster' cần dữ liệu gió. Hãy gọi phương thức load_data() trước.")
+        
         print(f"Tạo {num_points} đa giác Voronoi...")
         print(f"Creating {num_points} Voronoi polygons...")
         
@@ -310,6 +610,17 @@ class WindPotentialAnalyzer:
             print("Cảnh báo: Ranh giới không có hệ tọa độ được xác định. Sử dụng EPSG:4326.")
             print("Warning: Boundary has no coordinate system. Using EPSG:4326.")
             boundary.crs = "EPSG:4326"
+        
+        # Dùng lại các đa giác đã lưu (Reuse cached polygons)
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = self._voronoi_cache_file(boundary, num_points, random_state, backend, cache_dir)
+            cached = read_cache_file(cache_file, gpd.read_parquet)
+            if cached is not None:
+                self.voronoi_polygons = cached
+                print(f"Dùng lại {len(self.voronoi_polygons)} đa giác Voronoi đã lưu: {cache_file}")
+                print(f"Reusing {len(self.voronoi_polygons)} cached Voronoi polygons: {cache_file}")
+                return self
             
         # Tạo bộ đệm âm (buffer nhỏ hơn ranh giới) để tránh các điểm nằm quá gần biên
         buffered_boundary = boundary.copy()
@@ -360,8 +671,10 @@ class WindPotentialAnalyzer:
         # Phương pháp cải tiến: Tạo điểm trong ranh giới
         # Improved method: Create points within the boundary
         
-        # Tạo mask từ ranh giới
-        from shapely.geometry import Point
+        # Cây chỉ mục không gian của ranh giới để lọc điểm theo lô
+        # (Spatial index over the boundary to filter candidate points in bulk)
+        import shapely
+        boundary_tree = shapely.STRtree(buffered_boundary.geometry.values)
         
         # Tạo nhiều điểm hơn số lượng cần thiết để đảm bảo đủ điểm sau khi lọc
         # Create more points than needed to ensure enough points after filtering
@@ -379,14 +692,11 @@ class WindPotentialAnalyzer:
                 np.random.uniform(miny, maxy, num_points * oversample_factor)
             ])
             
-            # Kiểm tra và chỉ giữ lại những điểm nằm trong ranh giới
-            for point in candidate_points:
-                if len(points_within_boundary) >= num_points:
-                    break
-                    
-                point_obj = Point(point[0], point[1])
-                if any(geom.contains(point_obj) for geom in buffered_boundary.geometry):
-                    points_within_boundary.append(point)
+            # Kiểm tra và chỉ giữ lại những điểm nằm trong ranh giới, theo thứ tự đã tạo
+            # (Keep only the points inside the boundary, in the order they were drawn)
+            hits, _ = boundary_tree.query(shapely.points(candidate_points), predicate='within')
+            remaining = num_points - len(points_within_boundary)
+            points_within_boundary.extend(candidate_points[np.unique(hits)][:remaining])
             
             attempts += 1
         
@@ -405,13 +715,9 @@ class WindPotentialAnalyzer:
             grid_points = np.column_stack([xx.ravel(), yy.ravel()])
             
             # Lọc các điểm trong ranh giới
-            for point in grid_points:
-                if len(points_within_boundary) >= num_points:
-                    break
-                    
-                point_obj = Point(point[0], point[1])
-                if any(geom.contains(point_obj) for geom in buffered_boundary.geometry):
-                    points_within_boundary.append(point)
+            hits, _ = boundary_tree.query(shapely.points(grid_points), predicate='within')
+            remaining = num_points - len(points_within_boundary)
+            points_within_boundary.extend(grid_points[np.unique(hits)][:remaining])
         
         # Cắt bớt nếu có quá nhiều điểm
         if len(points_within_boundary) > num_points:
@@ -419,6 +725,15 @@ class WindPotentialAnalyzer:
             
         points = np.array(points_within_boundary)
         
+        # Dựng đa giác trực tiếp trên lưới raster (Build polygons directly on the raster grid)
+        if backend == 'raster':
+            self.voronoi_polygons = self._create_raster_voronoi(points, boundary)
+            if cache_file is not None:
+                self._save_voronoi_cache(cache_file)
+            print(f"Đã tạo {len(self.voronoi_polygons)} đa giác Voronoi để phân tích.")
+            print(f"Created {len(self.voronoi_polygons)} Voronoi polygons for analysis.")
+            return self
+        
         # Thêm các điểm điều khiển ở ngoài ranh giới để tránh các đa giác kéo dài vô hạn
         # Add control points outside the boundary to avoid infinitely extended polygons
         num_control_points = 16
@@ -451,9 +766,6 @@ class WindPotentialAnalyzer:
         
         # Chuyển đổi đa giác Voronoi thành đa giác không gian địa lý
         # (Convert Voronoi polygons to geographic polygons)
-        import shapely.geometry as geometry
-        from shapely.ops import unary_union
-        
         # Tạo từ điển để lưu các đa giác (Create dictionary to store polygons)
         region_polys = {}
         
@@ -465,15 +777,18 @@ class WindPotentialAnalyzer:
         # (bỏ qua các điểm điều khiển)
         num_points_within_boundary = len(points)
         
-        for i, region_idx in enumerate(tqdm(vor.point_region[:num_points_within_boundary], desc="Tạo đa giác | Creating polygons")):
-            region = vor.regions[region_idx]
+        regions = [vor.regions[region_idx] for region_idx in vor.point_region[:num_points_within_boundary]]
+        point_ids = [i for i, region in enumerate(regions) if -1 not in region and len(region) > 0]
+        
+        if point_ids:
+            # Dựng mọi đa giác trong một lần gọi shapely từ mảng đỉnh nối liền
+            # (Build every polygon in one shapely call from the concatenated vertex array)
+            vertex_ids = np.concatenate([regions[i] for i in point_ids])
+            ring_ids = np.repeat(np.arange(len(point_ids)), [len(regions[i]) for i in point_ids])
+            polygons = shapely.polygons(shapely.linearrings(vor.vertices[vertex_ids], indices=ring_ids))
             
-            if -1 not in region and len(region) > 0:
-                # Tạo đa giác từ các điểm của vùng (Create polygon from region points)
-                polygon = geometry.Polygon([vor.vertices[i] for i in region])
-                
-                # Lưu đa giác với chỉ số của điểm (Store polygon with point index)
-                region_polys[i] = polygon
+            # Lưu đa giác với chỉ số của điểm (Store polygon with point index)
+            region_polys = dict(zip(point_ids, polygons))
         
         # Tạo DataFrame với cột geometry (Create DataFrame with geometry column)
         vonorol = pd.DataFrame()
@@ -495,25 +810,33 @@ class WindPotentialAnalyzer:
         # Đảm bảo ranh giới là đa giác đơn nếu có thể
         # (Ensure boundary is a single polygon if possible)
         try:
-            # Tạo một polygon từ toàn bộ ranh giới
-            boundary_union = unary_union(boundary.geometry)
+            # Tách ranh giới thành từng đa giác (đất liền, đảo) và dựng cây chỉ mục không gian,
+            # mỗi ô chỉ được cắt với các phần ranh giới mà nó giao
+            # (Split the boundary into its polygons (mainland, islands) and index them in an STRtree,
+            # so each cell is only clipped against the boundary parts it intersects)
+            boundary_parts = shapely.get_parts(np.asarray(boundary.geometry.values))
+            shapely.prepare(boundary_parts)
+            cells = np.asarray(vonorol.geometry.values)
+            cell_index, part_index = shapely.STRtree(boundary_parts).query(cells, predicate='intersects')
+            
+            # Ô nằm trọn trong một phần ranh giới được giữ nguyên, chỉ cắt các ô cắt ngang biên
+            # (Cells lying fully inside a boundary part are kept as is, only cells crossing the edge are clipped)
+            inside = shapely.contains_properly(boundary_parts[part_index], cells[cell_index])
+            pieces = cells[cell_index].copy()
+            pieces[~inside] = shapely.intersection(cells[cell_index][~inside], boundary_parts[part_index][~inside])
             
-            # Cắt các đa giác Voronoi bằng ranh giới
+            # Gộp các mảnh của cùng một ô (Merge the pieces of each cell)
             clipped_voronoi = []
-            for idx, row in vonorol.iterrows():
-                try:
-                    # Cắt đa giác theo ranh giới
-                    intersection = row.geometry.intersection(boundary_union)
-                    
-                    # Chỉ giữ lại các đa giác có diện tích > 0
-                    if not intersection.is_empty and intersection.area > 0:
-                        clipped_voronoi.append({
-                            'geometry': intersection,
-                            'name': row['name']
-                        })
-                except Exception as e:
-                    print(f"Lỗi khi cắt đa giác {idx}: {e}")
-                    print(f"Error clipping polygon {idx}: {e}")
+            hit_cells, starts = np.unique(cell_index, return_index=True)
+            for cell, cell_pieces in zip(hit_cells, np.split(pieces, starts[1:])):
+                intersection = cell_pieces[0] if len(cell_pieces) == 1 else shapely.union_all(cell_pieces)
+                
+                # Chỉ giữ lại các đa giác có diện tích > 0
+                if not intersection.is_empty and intersection.area > 0:
+                    clipped_voronoi.append({
+                        'geometry': intersection,
+                        'name': vonorol['name'].iloc[cell]
+                    })
             
             # Tạo GeoDataFrame mới từ các đa giác đã cắt
             if clipped_voronoi:
@@ -521,14 +844,14 @@ class WindPotentialAnalyzer:
             else:
                 print("Cảnh báo: Không có đa giác nào sau khi cắt. Sử dụng phương pháp clip thay thế.")
                 print("Warning: No polygons after clipping. Using alternative clip method.")
-                vonorol = gpd.clip(vonorol, boundary.geometry.unary_union)
+                vonorol = gpd.clip(vonorol, boundary)
         except Exception as e:
             print(f"Lỗi khi cắt các đa giác theo ranh giới: {e}. Sử dụng phương pháp clip đơn giản.")
             print(f"Error clipping polygons by boundary: {e}. Using simple clip method.")
             
             # Sử dụng phương pháp clip đơn giản nếu phương pháp phức tạp gặp lỗi
             try:
-                vonorol = gpd.clip(vonorol, boundary.geometry.unary_union)
+                vonorol = gpd.clip(vonorol, boundary)
             except Exception as clip_error:
                 print(f"Lỗi khi sử dụng phương pháp clip đơn giản: {clip_error}")
                 print(f"Error using simple clip method: {clip_error}")
@@ -540,19 +863,184 @@ class WindPotentialAnalyzer:
         print("Cleaning Voronoi polygons...")
         
         # Loại bỏ các geometry rỗng hoặc không hợp lệ
-        valid_idx = []
-        for idx, row in vonorol.iterrows():
-            if row.geometry is not None and not row.geometry.is_empty and row.geometry.is_valid:
-                valid_idx.append(idx)
-        
-        vonorol = vonorol.loc[valid_idx].copy()
+        valid = vonorol.geometry.notna() & ~vonorol.geometry.is_empty & vonorol.geometry.is_valid
+        vonorol = vonorol[valid.to_numpy()].copy()
             
         self.voronoi_polygons = vonorol
+        if cache_file is not None:
+            self._save_voronoi_cache(cache_file)
         print(f"Đã tạo {len(self.voronoi_polygons)} đa giác Voronoi để phân tích.")
         print(f"Created {len(self.voronoi_polygons)} Voronoi polygons for analysis.")
         
         return self
     
+    def _create_raster_voronoi(self, points, boundary):
+        """
+        Tạo đa giác Voronoi bằng cách gán mỗi pixel trong ranh giới cho điểm gần nhất
+        (Create Voronoi polygons by assigning each pixel inside the boundary to its nearest seed)
+        
+        Parameters:
+        -----------
+        points : numpy.ndarray
+            Các điểm hạt giống dạng (N, 2) (Seed points with shape (N, 2))
+        boundary : GeoDataFrame
+            Ranh giới dùng để giới hạn các pixel (Boundary limiting the labelled pixels)
+            
+        Returns:
+        --------
+        GeoDataFrame
+            Các đa giác Voronoi đã nằm trong ranh giới, cột 'name' là chỉ số điểm
+            (Voronoi polygons already inside the boundary, 'name' is the seed index)
+        """
+        from scipy.spatial import cKDTree
+        from rasterio import features, windows
+        from shapely.geometry import shape
+        from shapely.ops import unary_union
+        
+        # Chỉ đọc lưới pixel trong phạm vi ranh giới (Only use the pixel grid within the boundary extent)
+        full_window = windows.Window(0, 0, self.demdata.width, self.demdata.height)
+        window = windows.from_bounds(*boundary.total_bounds, transform=self.demdata.transform)
+        window = window.round_offsets().round_lengths().intersection(full_window)
+        transform = self.demdata.window_transform(window)
+        out_shape = (int(window.height), int(window.width))
+        
+        # Các pixel nằm trong ranh giới (Pixels inside the boundary)
+        inside = features.geometry_mask(boundary.geometry, out_shape=out_shape, transform=transform, invert=True)
+        rows, cols = np.nonzero(inside)
+        xs, ys = transform * (cols + 0.5, rows + 0.5)
+        
+        # Gán nhãn điểm gần nhất cho mỗi pixel, truy vấn song song trên mọi lõi CPU
+        # (Label each pixel with its nearest seed, querying in parallel on all CPU cores)
+        _, nearest = cKDTree(points).query(np.column_stack([xs, ys]), workers=-1)
+        labels = np.zeros(out_shape, dtype='int32')
+        labels[rows, cols] = nearest + 1
+        
+        # Chuyển nhãn thành đa giác (Polygonize the labels)
+        pieces = {}
+        for geom, value in tqdm(features.shapes(labels, mask=labels > 0, transform=transform),
+                                desc="Tạo đa giác | Creating polygons"):
+            pieces.setdefault(int(value) - 1, []).append(shape(geom))
+        
+        records = [{'geometry': parts[0] if len(parts) == 1 else unary_union(parts), 'name': idx}
+                   for idx, parts in sorted(pieces.items())]
+        return gpd.GeoDataFrame(records, geometry='geometry', crs=boundary.crs)
+    
+    def _windowed_zonal_stats(self, min_window_size=1024, jobs=None):
+        """
+        Tính trung bình và độ lệch chuẩn gió bằng cách đọc raster theo các cửa sổ căn theo khối
+        (Compute wind mean and standard deviation by streaming block-aligned raster windows)
+        
+        Parameters:
+        -----------
+        min_window_size : int
+            Kích thước tối thiểu (pixel) của mỗi cửa sổ, gộp nhiều khối GDAL liền kề
+            (Minimum window size in pixels, grouping adjacent GDAL blocks)
+        jobs : int, optional
+            Số luồng xử lý các cửa sổ song song, mặc định min(4, số lõi CPU); GDAL và GEOS nhả GIL
+            (Number of threads processing windows in parallel, defaults to min(4, CPU cores); GDAL and GEOS release the GIL)
+            
+        Returns:
+        --------
+        DataFrame
+            Các cột 'wind_mean' và 'wind_std' theo thứ tự đa giác
+            (Columns 'wind_mean' and 'wind_std' in polygon order)
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from rasterio import features, windows
+        from shapely.geometry import box
+        
+        src = self.demdata
+        geoms = self.voronoi_polygons.geometry.values
+        count = np.zeros(len(geoms))
+        mean = np.zeros(len(geoms))
+        m2 = np.zeros(len(geoms))
+        
+        # Gộp các khối liền kề thành cửa sổ đủ lớn (Group adjacent blocks into large enough windows)
+        block_h, block_w = src.block_shapes[0]
+        step_h = block_h * -(-min_window_size // block_h)
+        step_w = block_w * -(-min_window_size // block_w)
+        
+        # Chỉ duyệt phần raster phủ bởi các đa giác, căn theo lưới khối; bỏ các cửa sổ không chạm đa giác nào
+        # (Only walk the raster extent covered by the polygons, aligned to the block grid; skip windows no polygon touches)
+        extent = windows.from_bounds(*self.voronoi_polygons.total_bounds, transform=src.transform)
+        row_start = max(0, int(extent.row_off) // block_h * block_h)
+        col_start = max(0, int(extent.col_off) // block_w * block_w)
+        row_stop = min(src.height, int(np.ceil(extent.row_off + extent.height)))
+        col_stop = min(src.width, int(np.ceil(extent.col_off + extent.width)))
+        
+        sindex = self.voronoi_polygons.sindex
+        tasks = []
+        for row in range(row_start, row_stop, step_h):
+            for col in range(col_start, col_stop, step_w):
+                window = windows.Window(col, row, min(step_w, src.width - col), min(step_h, src.height - row))
+                candidates = sindex.query(box(*windows.bounds(window, src.transform)))
+                if len(candidates) > 0:
+                    tasks.append((window, candidates))
+        
+        # Mỗi luồng mở file raster riêng vì một dataset GDAL không an toàn khi đọc song song
+        # (Each thread opens its own raster handle since a GDAL dataset is not safe for concurrent reads)
+        local = threading.local()
+        handles = []
+        
+        def window_stats(task):
+            window, candidates = task
+            if not hasattr(local, 'src'):
+                local.src = rasterio.open(src.name)
+                handles.append(local.src)
+            data = local.src.read(1, window=window, masked=True)
+            valid = ~np.ma.getmaskarray(data) & np.isfinite(data.data)
+            
+            # Gán nhãn đa giác cho mọi pixel trong một lần rasterize (nhãn 0 là ngoài đa giác)
+            # (Label every pixel with its polygon in a single rasterize pass, 0 means outside)
+            labels = features.rasterize(((geoms[i], i + 1) for i in candidates), out_shape=data.shape,
+                                        transform=src.window_transform(window), fill=0, dtype='int32')
+            valid &= labels > 0
+            labels = labels[valid] - 1
+            values = data.data[valid].astype('float64')
+            if values.size == 0:
+                return None
+            
+            # Thống kê của cửa sổ cho tất cả đa giác bằng bincount
+            # (Per-window statistics for every polygon with bincount)
+            window_count = np.bincount(labels, minlength=len(geoms)).astype('float64')
+            hit = window_count > 0
+            window_mean = np.zeros(len(geoms))
+            window_mean[hit] = np.bincount(labels, weights=values, minlength=len(geoms))[hit] / window_count[hit]
+            window_m2 = np.bincount(labels, weights=(values - window_mean[labels]) ** 2, minlength=len(geoms))
+            return hit, window_count[hit], window_mean[hit], window_m2[hit]
+        
+        if jobs is None:
+            jobs = min(4, os.cpu_count() or 1)
+        
+        with rasterio.Env(GDAL_CACHEMAX=512), ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            results = executor.map(window_stats, tasks)
+            for result in tqdm(results, total=len(tasks), desc="Phân tích gió | Wind analysis"):
+                if result is None:
+                    continue
+                
+                # Gộp thống kê của cửa sổ vào kết quả tích lũy (Welford/Chan)
+                # (Merge this window's statistics into the running totals)
+                hit, window_count, window_mean, window_m2 = result
+                total = count[hit] + window_count
+                delta = window_mean - mean[hit]
+                mean[hit] += delta * window_count / total
+                m2[hit] += window_m2 + delta ** 2 * count[hit] * window_count / total
+                count[hit] = total
+        
+        for handle in handles:
+            handle.close()
+        
+        empty = count == 0
+        mean[empty] = np.nan
+        with np.errstate(invalid='ignore'):
+            std = np.sqrt(m2 / count)
+        
+        # Áp dụng scale/offset một lần ở cuối thay vì cho từng pixel
+        # (Apply the band scale/offset once at the end instead of per pixel)
+        scale = self.demdata.scales[0]
+        return pd.DataFrame({'wind_mean': self._wind_values(mean), 'wind_std': std * abs(scale)})
+    
     def calculate_wind_statistics(self, wind_file=None):
         """
         Tính toán thống kê gió cho các đa giác Voronoi
@@ -573,21 +1061,15 @@ class WindPotentialAnalyzer:
         print("Tính toán thống kê gió cho các đa giác Voronoi...")
         print("Calculating wind statistics for Voronoi polygons...")
         
-        # Sử dụng tqdm để hiển thị thanh tiến độ
-        # Chia thành các nhóm nhỏ để hiển thị tiến độ
-        batch_size = 50  # số polygon xử lý mỗi lần
-        results = []
-        
-        total_polygons = len(self.voronoi_polygons)
-        for i in tqdm(range(0, total_polygons, batch_size), desc="Phân tích gió | Wind analysis"):
-            batch = self.voronoi_polygons.iloc[i:min(i+batch_size, total_polygons)]
-            # Tính toán thống kê gió cho nhóm đa giác
-            batch_stats = zonal_stats(batch.geometry, self.demdata.name, stats=['mean', 'std'])
-            results.extend(batch_stats)
-        
-        # Chuyển thành DataFrame (Convert to DataFrame)
-        demstats_df = pd.DataFrame(results)
-        demstats_df.rename(columns={'mean': 'wind_mean', 'std': 'wind_std'}, inplace=True)
+        if EXACTEXTRACT_AVAILABLE:
+            # Tính tất cả đa giác trong một lần gọi, trọng số theo diện tích phủ của điểm ảnh
+            # (All polygons in one call, weighted by pixel coverage fraction)
+            demstats_df = exact_extract(self.demdata, self.voronoi_polygons, ['mean', 'stdev'], output='pandas')
+            demstats_df.columns = ['wind_mean', 'wind_std']
+        else:
+            # Đọc raster theo từng cửa sổ thay vì mở lại file cho mỗi đa giác
+            # (Stream the raster window by window instead of re-reading it per polygon)
+            demstats_df = self._windowed_zonal_stats()
         
         # Kết hợp với GeoDataFrame (Combine with GeoDataFrame)
         self.voronoi_polygons = pd.concat([self.voronoi_polygons, demstats_df], axis=1)
@@ -619,19 +1101,8 @@ class WindPotentialAnalyzer:
         print("Lọc các khu vực có tiềm năng gió cao...")
         print("Filtering areas with high wind potential...")
         
-        # Sử dụng tqdm để hiển thị tiến độ khi số lượng đa giác lớn
-        if len(self.voronoi_polygons) > 100:
-            # Tạo list index của các đa giác có tiềm năng cao
-            high_potential_indices = []
-            for idx in tqdm(self.voronoi_polygons.index, desc="Kiểm tra tiềm năng | Checking potential"):
-                row = self.voronoi_polygons.loc[idx]
-                if row.wind_mean > min_wind_speed:
-                    high_potential_indices.append(idx)
-            
-            high_potential = self.voronoi_polygons.loc[high_potential_indices].copy()
-        else:
-            # Đối với số lượng nhỏ, sử dụng phương pháp lọc nhanh hơn
-            high_potential = self.voronoi_polygons[self.voronoi_polygons.wind_mean > min_wind_speed].copy()
+        # So sánh cả cột một lần thay vì đọc từng dòng (Compare the whole column at once instead of row by row)
+        high_potential = self.voronoi_polygons[self.voronoi_polygons['wind_mean'].to_numpy() > min_wind_speed].copy()
         
         region_name = ""
         if self.selected_region is not None and self.selected_region is not self.catchments:
@@ -731,25 +1202,12 @@ class WindPotentialAnalyzer:
         # Lấy phạm vi hiển thị từ vùng đã chọn (Get extent from selected region)
         minx, miny, maxx, maxy = display_region.total_bounds
         
-        # Tạo mask cho dữ liệu gió (Create mask for wind data)
-        if self.selected_region is not None and self.selected_region is not self.catchments:
-            mask = None
-            try:
-                # Sử dụng ranh giới của khu vực đã chọn để mask dữ liệu gió
-                shapes = [geom.__geo_interface__ for geom in self.selected_region.geometry]
-                masked_data, masked_transform = rasterio.mask.mask(self.demdata, shapes, crop=True)
-                # Hiển thị dữ liệu gió đã mask
-                show_result = rasterio.plot.show(masked_data[0], transform=masked_transform, ax=ax, cmap='viridis')
-                img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
-            except Exception as e:
-                print(f"Không thể tạo mặt nạ cho dữ liệu gió: {e}")
-                # Hiển thị dữ liệu gió bình thường
-                show_result = rasterio.plot.show(self.demdata, ax=ax, cmap='viridis')
-                img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
-        else:
-            # Hiển thị dữ liệu gió bình thường cho toàn bộ Việt Nam
-            show_result = rasterio.plot.show(self.demdata, ax=ax, cmap='viridis')
-            img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
+        # Chỉ đọc cửa sổ raster của vùng đã chọn, thu nhỏ theo độ phân giải hiển thị
+        # (Read only the selected region's raster window, decimated to display resolution)
+        region = self.selected_region if self.selected_region is not self.catchments else None
+        wind_data, wind_transform = self._read_display_window(region)
+        show_result = rasterio.plot.show(wind_data, transform=wind_transform, ax=ax, cmap='viridis')
+        img = show_result.get_images()[0]  # Lấy đối tượng AxesImage từ kết quả
         
         # Thêm thanh màu chú thích với thông tin tốc độ gió bằng tiếng Việt và tiếng Anh - cải thiện phong cách Apple
         # Tạo không gian riêng cho colorbar - đặt ở bên phải, sát với bản đồ hơn
@@ -771,24 +1229,21 @@ class WindPotentialAnalyzer:
         high_potential.plot(ax=ax, color='#FFCC00', edgecolor='#FF9900', alpha=0.6, linewidth=1.5)
         
         # Thêm nhãn cho các khu vực tiềm năng cao (Add labels for high potential areas)
-        for idx, row in high_potential.iterrows():
-            # Kiểm tra geometry có tồn tại không trước khi truy cập thuộc tính centroid
-            if row.geometry is not None:
-                try:
-                    centroid = row.geometry.centroid
-                    avg_speed = row['wind_mean']
-                    ax.text(centroid.x, centroid.y, f"{avg_speed:.1f}", 
-                            ha='center', va='center', 
-                            fontsize=9, 
-                            fontweight='bold',
-                            color='#333333',
-                            bbox=dict(facecolor='white', 
-                                     alpha=0.9, 
-                                     boxstyle='round,pad=0.3',
-                                     edgecolor='none'))
-                except Exception as e:
-                    print(f"Lỗi khi xử lý geometry tại index {idx}: {e}")
-                    print(f"Error processing geometry at index {idx}: {e}")
+        # Tính tâm của mọi ô có geometry trong một lần gọi (Compute the centroid of every cell with a geometry in one call)
+        import shapely
+        labelled = high_potential[high_potential.geometry.notna()]
+        centroids = shapely.centroid(np.asarray(labelled.geometry.values))
+        for x, y, avg_speed in zip(shapely.get_x(centroids).tolist(), shapely.get_y(centroids).tolist(),
+                                   labelled['wind_mean'].tolist()):
+            ax.text(x, y, f"{avg_speed:.1f}", 
+                    ha='center', va='center', 
+                    fontsize=9, 
+                    fontweight='bold',
+                    color='#333333',
+                    bbox=dict(facecolor='white', 
+                             alpha=0.9, 
+                             boxstyle='round,pad=0.3',
+                             edgecolor='none'))
         
         # Thiết lập phạm vi hiển thị (Set display extent)
         buffer = (maxx - minx) * 0.05  # Tạo đệm 5% (Create a 5% buffer)
@@ -997,7 +1452,386 @@ class WindPotentialAnalyzer:
         
         return self
     
-    def create_interactive_visualization(self, min_wind_speed=5.0, figsize=(12, 10), save_path=None, html_output=None):
+    def to_soa(self, polygons=None, return_index=False):
+        """
+        Chuyển các ô Voronoi sang dạng mảng liên tục: một mảng đỉnh float32 và mảng chỉ số bắt đầu (kiểu CSR)
+        (Convert Voronoi cells to contiguous arrays: one float32 vertex array plus CSR-style start offsets)
+        
+        Parameters:
+        -----------
+        polygons : GeoDataFrame, optional
+            Các đa giác cần chuyển, mặc định là các ô Voronoi (Polygons to convert, defaults to the Voronoi cells)
+        return_index : bool, optional
+            Trả thêm chỉ số dòng gốc của từng đa giác con (Also return the source row of each polygon part)
+            
+        Returns:
+        --------
+        tuple
+            (vertices_xy, offsets) với đa giác i là vertices_xy[offsets[i]:offsets[i + 1]],
+            thêm mảng chỉ số dòng gốc nếu return_index=True
+            ((vertices_xy, offsets) where polygon i is vertices_xy[offsets[i]:offsets[i + 1]],
+            plus the source row indices if return_index=True)
+        """
+        import shapely
+        
+        if polygons is None:
+            polygons = self.voronoi_polygons
+        if polygons is None:
+            raise ValueError("Chưa có đa giác Voronoi. Hãy gọi create_voronoi_polygons() trước.")
+        
+        # Tách MultiPolygon thành từng phần và chỉ giữ các đa giác không rỗng
+        # (Split MultiPolygons into parts and keep only non-empty polygons)
+        parts, row_index = shapely.get_parts(np.asarray(polygons.geometry.values), return_index=True)
+        keep = (shapely.get_type_id(parts) == 3) & ~shapely.is_empty(parts)
+        parts, row_index = parts[keep], row_index[keep]
+        
+        # Lấy tọa độ mọi vành ngoài trong một lần gọi (Fetch every exterior ring's coordinates in one call)
+        coords, ring_index = shapely.get_coordinates(shapely.get_exterior_ring(parts), return_index=True)
+        offsets = np.zeros(len(parts) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(ring_index, minlength=len(parts)), out=offsets[1:])
+        vertices_xy = np.ascontiguousarray(coords, dtype=np.float32)
+        
+        if return_index:
+            return vertices_xy, offsets, row_index
+        return vertices_xy, offsets
+    
+    def neighbor_wind_means(self):
+        """
+        Tính tốc độ gió trung bình của các ô Voronoi kề nhau cho từng ô
+        (Compute the mean wind speed of each Voronoi cell's adjacent cells)
+        
+        Returns:
+        --------
+        numpy.ndarray
+            Trung bình của các ô lân cận theo thứ tự dòng của voronoi_polygons, NaN nếu ô không có lân cận
+            (Neighbors' mean in voronoi_polygons row order, NaN for cells without neighbors)
+        """
+        import shapely
+        
+        if self.voronoi_polygons is None or 'wind_mean' not in self.voronoi_polygons:
+            raise ValueError("Chưa có thống kê gió. Hãy gọi calculate_wind_statistics() trước.")
+        
+        # Dựng đồ thị kề một lần bằng cây chỉ mục không gian: các ô Voronoi kề nhau dùng chung cạnh
+        # (Build the adjacency graph once with a spatial index: adjacent Voronoi cells share an edge)
+        geoms = np.asarray(self.voronoi_polygons.geometry.values)
+        left, right = shapely.STRtree(geoms).query(geoms, predicate='intersects')
+        pairs = left != right
+        left, right = left[pairs], right[pairs]
+        
+        # Cộng dồn tốc độ gió của các ô lân cận theo từng ô (Sum the neighbors' wind speed per cell)
+        wind = self.voronoi_polygons['wind_mean'].to_numpy(dtype=float)
+        valid = ~np.isnan(wind[right])
+        sums = np.bincount(left[valid], weights=wind[right][valid], minlength=len(geoms))
+        counts = np.bincount(left[valid], minlength=len(geoms))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return sums / counts
+    
+    @staticmethod
+    def _tooltip_labels(wind, neighbor_wind=None):
+        """
+        Tạo nhãn tooltip cho từng ô từ mảng tốc độ gió
+        (Build one tooltip label per cell from an array of wind speeds)
+        
+        Parameters:
+        -----------
+        wind : numpy.ndarray
+            Tốc độ gió trung bình của các ô (Mean wind speed of the cells)
+        neighbor_wind : numpy.ndarray, optional
+            Tốc độ gió trung bình của các ô lân cận (Mean wind speed of the neighboring cells)
+        """
+        # Làm tròn cả mảng một lần rồi định dạng trên số Python thuần
+        # (Round the whole array once, then format plain Python floats)
+        if neighbor_wind is None:
+            return [TOOLTIP_TEMPLATE.format(mean=w) for w in np.round(wind, 2).tolist()]
+        return [NEIGHBOR_TOOLTIP_TEMPLATE.format(mean=w, neighbor=n)
+                for w, n in zip(np.round(wind, 2).tolist(), np.round(neighbor_wind, 2).tolist())]
+    
+    @staticmethod
+    def _save_html(html, html_output, compress=False):
+        """
+        Ghi HTML ra file, kèm bản nén .html.gz để máy chủ web gửi trực tiếp
+        (Write the HTML to a file, plus a compressed .html.gz copy for web servers to send as is)
+        
+        Parameters:
+        -----------
+        html : str
+            Mã HTML (HTML markup)
+        html_output : str or Path
+            Đường dẫn file HTML (Path of the HTML file)
+        compress : bool, optional
+            Ghi thêm bản .html.gz bên cạnh (Also write a .html.gz copy next to it)
+        """
+        import gzip
+        
+        data = html.encode('utf-8')
+        Path(html_output).write_bytes(data)
+        print(f"Đã lưu file HTML tương tác tại: {html_output}")
+        print(f"Interactive HTML file saved at: {html_output}")
+        if compress:
+            gzip_output = Path(html_output).with_name(Path(html_output).name + '.gz')
+            gzip_output.write_bytes(gzip.compress(data, compresslevel=6))
+            print(f"Đã lưu bản nén tại: {gzip_output} ({len(data) / 1e6:.1f} MB -> {gzip_output.stat().st_size / 1e6:.1f} MB)")
+            print(f"Compressed copy saved at: {gzip_output} ({len(data) / 1e6:.1f} MB -> {gzip_output.stat().st_size / 1e6:.1f} MB)")
+    
+    def _map_title(self):
+        """
+        Tiêu đề song ngữ của bản đồ tương tác theo vùng đã chọn
+        (Bilingual interactive map title for the selected region)
+        """
+        if self.selected_region is not None and self.selected_region is not self.catchments:
+            region_name = self.selected_region['name'].values[0]
+            return f'Bản đồ tương tác tốc độ gió và khu vực tiềm năng tại {region_name}\nInteractive Wind Speed & Potential Areas Map in {region_name}'
+        return 'Bản đồ tương tác tốc độ gió và khu vực tiềm năng tại Việt Nam\nInteractive Wind Speed & Potential Areas Map in Vietnam'
+    
+    def _cell_collection(self, cells, cmap, norm, min_wind_speed):
+        """
+        Tạo một PolyCollection cho mọi ô Voronoi, màu theo tốc độ gió, viền cam cho ô vượt ngưỡng
+        (Build one PolyCollection for all Voronoi cells, colored by wind speed, orange outline above the threshold)
+        
+        Parameters:
+        -----------
+        cells : GeoDataFrame
+            Các ô Voronoi có cột 'wind_mean' (Voronoi cells with a 'wind_mean' column)
+        cmap, norm : Colormap, Normalize
+            Bảng màu và chuẩn hóa tốc độ gió (Colormap and wind speed normalization)
+        min_wind_speed : float
+            Ngưỡng tốc độ gió của khu vực tiềm năng (Wind speed threshold for potential areas)
+            
+        Returns:
+        --------
+        tuple
+            (collection, vertices_xy, offsets, row_index) như trong to_soa() ((collection, vertices_xy, offsets, row_index) as in to_soa())
+        """
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import to_rgba
+        
+        # MultiPolygon được tách thành từng phần, mỗi phần mang thống kê của ô gốc
+        # (MultiPolygons are exploded so each part carries its cell's statistics)
+        vertices_xy, offsets, row_index = self.to_soa(cells, return_index=True)
+        wind = cells['wind_mean'].to_numpy()[row_index]
+        
+        # Cắt mảng đỉnh liên tục theo chỉ số bắt đầu, không cần truy cập shapely cho từng đa giác
+        # (Slice the contiguous vertex array by offsets, no per-polygon shapely access)
+        verts = np.split(vertices_xy, offsets[1:-1])
+        
+        # Độ trong suốt gắn sẵn vào từng màu để viền 'none' vẫn trong suốt trong mpld3
+        # (Alpha is baked into each color so 'none' edges stay transparent in mpld3)
+        facecolors = cmap(norm(wind), alpha=0.7)
+        edgecolors = np.zeros((len(wind), 4))
+        edgecolors[wind >= min_wind_speed] = to_rgba('orange', alpha=0.7)
+        collection = PolyCollection(verts, facecolors=facecolors, edgecolors=edgecolors)
+        return collection, vertices_xy, offsets, row_index
+    
+    def _create_imagemap_visualization(self, min_wind_speed, figsize, save_path, html_output, simplify_tolerance,
+                                       compress_html=False, dpi=150):
+        """
+        Vẽ các ô thành một ảnh PNG tĩnh kèm bản đồ ảnh HTML (<map>/<area>) để hiện tooltip khi di chuột,
+        kích thước trang tăng theo số đỉnh nhưng trình duyệt chỉ vẽ một ảnh
+        (Render the cells to one static PNG plus an HTML image map (<map>/<area>) for hover tooltips;
+        the page grows with the vertex count but the browser only paints one image)
+        
+        Parameters:
+        -----------
+        min_wind_speed : float
+            Ngưỡng tốc độ gió của khu vực tiềm năng (Wind speed threshold for potential areas)
+        figsize : tuple
+            Kích thước của biểu đồ (Size of the figure)
+        save_path : str, optional
+            Đường dẫn để lưu hình ảnh (PNG) (Path to save the image (PNG))
+        html_output : str or Path, optional
+            Đường dẫn để lưu file HTML (Path to save the HTML file)
+        simplify_tolerance : float
+            Dung sai đơn giản hóa đa giác (Polygon simplification tolerance)
+        compress_html : bool, optional
+            Ghi thêm bản .html.gz (Also write a .html.gz copy)
+        dpi : int, optional
+            Độ phân giải của ảnh trong trang (Resolution of the embedded image)
+            
+        Returns:
+        --------
+        html : str
+            Mã HTML của bản đồ
+        """
+        import base64
+        import io
+        from html import escape
+        from matplotlib.colors import Normalize
+        from matplotlib.cm import ScalarMappable
+        
+        cells = self.voronoi_polygons
+        if simplify_tolerance:
+            cells = cells.set_geometry(cells.geometry.simplify(simplify_tolerance, preserve_topology=True))
+        display_region = self.selected_region if self.selected_region is not None else self.catchments
+        minx, miny, maxx, maxy = display_region.total_bounds
+        
+        cmap = plt.cm.viridis
+        norm = Normalize(vmin=cells['wind_mean'].min(), vmax=cells['wind_mean'].max())
+        title = self._map_title()
+        
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        display_region.boundary.plot(ax=ax, color='red', linewidth=1.5)
+        collection, vertices_xy, offsets, row_index = self._cell_collection(cells, cmap, norm, min_wind_speed)
+        ax.add_collection(collection)
+        
+        buffer = (maxx - minx) * 0.05  # Tạo đệm 5% (Create a 5% buffer)
+        ax.set_xlim(minx - buffer, maxx + buffer)
+        ax.set_ylim(miny - buffer, maxy + buffer)
+        cbar = fig.colorbar(ScalarMappable(cmap=cmap, norm=norm), ax=ax, shrink=0.8, pad=0.01)
+        cbar.set_label('Tốc độ gió (m/s) | Wind Speed (m/s)', fontsize=12)
+        ax.set_title(title, fontsize=14)
+        ax.set_xlabel('Kinh độ | Longitude', fontsize=10)
+        ax.set_ylabel('Vĩ độ | Latitude', fontsize=10)
+        
+        # Vẽ một lần ở dpi cố định để tọa độ pixel khớp với ảnh đã lưu
+        # (Draw once at a fixed dpi so pixel coordinates match the saved image)
+        fig.canvas.draw()
+        width, height = fig.canvas.get_width_height()
+        pixels = ax.transData.transform(vertices_xy.astype(float))
+        pixels[:, 1] = height - pixels[:, 1]
+        pixels = np.round(pixels).astype(int)
+        
+        png = io.BytesIO()
+        fig.savefig(png, format='png', dpi=dpi)
+        if save_path:
+            fig.savefig(save_path, dpi=150, bbox_inches='tight')
+            print(f"Đã lưu biểu đồ tại: {save_path}")
+            print(f"Figure saved at: {save_path}")
+        plt.close(fig)  # Đóng hình để giải phóng bộ nhớ
+        
+        # Một thẻ <area> cho mỗi đa giác, thống kê làm tròn cả mảng một lần
+        # (One <area> tag per polygon, statistics rounded once for the whole array)
+        stats = zip(np.round(cells['wind_mean'].to_numpy()[row_index], 2).tolist(),
+                    np.round(cells['wind_std'].to_numpy()[row_index], 2).tolist(),
+                    np.round(self.neighbor_wind_means()[row_index], 2).tolist())
+        areas = '\n'.join(
+            f'<area shape="poly" coords="{",".join(map(str, ring.ravel().tolist()))}" '
+            f'data-mean="{mean}" data-std="{std}" data-neighbor="{neighbor}">'
+            for ring, (mean, std, neighbor) in zip(np.split(pixels, offsets[1:-1]), stats)
+        )
+        
+        html = IMAGEMAP_TEMPLATE.format(
+            title=escape(title.replace('\n', ' | ')), css=TOOLTIP_CSS, width=width, height=height,
+            png=base64.b64encode(png.getvalue()).decode('ascii'), areas=areas
+        )
+        if html_output:
+            self._save_html(html, html_output, compress_html)
+        return html
+    
+    def _create_folium_visualization(self, min_wind_speed, html_output, simplify_tolerance, compress_html=False,
+                                     max_inline_polygons=1000):
+        """
+        Tạo bản đồ web Leaflet (folium) cho các ô Voronoi, tooltip hiển thị thống kê gió
+        (Create a Leaflet (folium) web map of the Voronoi cells with wind statistics tooltips)
+        
+        Parameters:
+        -----------
+        min_wind_speed : float
+            Ngưỡng tốc độ gió của khu vực tiềm năng, các ô vượt ngưỡng có viền cam
+            (Wind speed threshold for potential areas, cells above it get an orange outline)
+        html_output : str or Path, optional
+            Đường dẫn để lưu file HTML (Path to save the HTML file)
+        simplify_tolerance : float
+            Dung sai đơn giản hóa đa giác (Polygon simplification tolerance)
+        compress_html : bool, optional
+            Ghi thêm bản .html.gz (Also write a .html.gz copy)
+        max_inline_polygons : int, optional
+            Nếu nhiều ô hơn, GeoJSON được ghi ra file riêng cạnh HTML và tải bằng fetch()
+            (Above this many cells, the GeoJSON is written to a file next to the HTML and loaded with fetch())
+            
+        Returns:
+        --------
+        html : str
+            Mã HTML của bản đồ
+        """
+        try:
+            import folium
+            import branca.colormap
+            from branca.element import MacroElement
+            from jinja2 import Template
+        except ImportError:
+            print("Thư viện folium không được cài đặt. Vui lòng cài đặt bằng lệnh: pip install folium")
+            print("folium library is not installed. Please install it using: pip install folium")
+            return None
+        from matplotlib.colors import Normalize
+        
+        has_geometry = self.voronoi_polygons.geometry.notna()
+        cells = self.voronoi_polygons.loc[has_geometry, ['geometry', 'wind_mean', 'wind_std']]
+        cells['neighbor_mean'] = self.neighbor_wind_means()[has_geometry.to_numpy()]
+        cells = cells.to_crs("EPSG:4326")
+        if simplify_tolerance:
+            cells['geometry'] = cells.geometry.simplify(simplify_tolerance, preserve_topology=True)
+        
+        # Tính sẵn màu và nhãn cho từng ô để trình duyệt chỉ việc đọc thuộc tính
+        # (Precompute each cell's color and label so the browser only reads properties)
+        wind = cells['wind_mean'].to_numpy()
+        norm = Normalize(vmin=np.nanmin(wind), vmax=np.nanmax(wind))
+        rgb = np.round(plt.cm.viridis(norm(wind))[:, :3] * 255).astype(int)
+        # Ô không có dữ liệu tô trắng như interactive_map, không để viridis trả về màu đen
+        # (Cells without data are filled white as in interactive_map instead of viridis' black)
+        rgb[~np.isfinite(wind)] = 255
+        cells['fill'] = [f'#{r:02x}{g:02x}{b:02x}' for r, g, b in rgb]
+        cells['high'] = wind >= min_wind_speed
+        cells['wind_mean'] = cells['wind_mean'].round(2)
+        cells['wind_std'] = cells['wind_std'].round(2)
+        cells['neighbor_mean'] = cells['neighbor_mean'].round(2)
+        
+        minx, miny, maxx, maxy = cells.total_bounds
+        m = folium.Map(location=[(miny + maxy) / 2, (minx + maxx) / 2], tiles='cartodbpositron')
+        m.fit_bounds([[miny, minx], [maxy, maxx]])
+        
+        # Chú thích màu (Color legend)
+        legend = branca.colormap.LinearColormap(
+            [plt.cm.viridis(x) for x in np.linspace(0, 1, 8)], vmin=norm.vmin, vmax=norm.vmax,
+            caption='Tốc độ gió (m/s) | Wind Speed (m/s)'
+        )
+        legend.add_to(m)
+        
+        style = ("{fillColor: f.properties.fill, fillOpacity: 0.7, "
+                 "color: f.properties.high ? 'orange' : f.properties.fill, weight: f.properties.high ? 1.5 : 0.5}")
+        
+        if html_output is not None and len(cells) > max_inline_polygons:
+            # Ghi GeoJSON ra file riêng, trình duyệt tải sau khi trang đã hiển thị
+            # (Write the GeoJSON to a separate file, loaded by the browser after the page shows)
+            geojson_path = Path(html_output).with_suffix('.geojson')
+            geojson_path.write_text(cells.to_json(), encoding='utf-8')
+            loader = MacroElement()
+            loader._template = Template(
+                "{% macro script(this, kwargs) %}"
+                f"fetch('{geojson_path.name}').then(r => r.json()).then(data => L.geoJSON(data, {{"
+                f"style: f => ({style}), "
+                "onEachFeature: (f, layer) => layer.bindTooltip("
+                "'Tốc độ gió / Wind speed: ' + f.properties.wind_mean + ' m/s<br>"
+                "Độ lệch chuẩn / Std: ' + f.properties.wind_std + ' m/s<br>"
+                "TB ô lân cận / Neighbors\\' mean: ' + f.properties.neighbor_mean + ' m/s')"
+                f"}}).addTo({m.get_name()}));"
+                "{% endmacro %}"
+            )
+            m.add_child(loader)
+            print(f"Đã ghi GeoJSON riêng (cần mở qua máy chủ HTTP): {geojson_path}")
+            print(f"Wrote separate GeoJSON (serve over HTTP to view): {geojson_path}")
+        else:
+            folium.GeoJson(
+                cells.to_json(),
+                style_function=lambda f: {
+                    'fillColor': f['properties']['fill'], 'fillOpacity': 0.7,
+                    'color': 'orange' if f['properties']['high'] else f['properties']['fill'],
+                    'weight': 1.5 if f['properties']['high'] else 0.5,
+                },
+                tooltip=folium.GeoJsonTooltip(
+                    fields=['wind_mean', 'wind_std', 'neighbor_mean'],
+                    aliases=['Tốc độ gió / Wind speed (m/s)', 'Độ lệch chuẩn / Std (m/s)',
+                             "TB ô lân cận / Neighbors' mean (m/s)"]
+                ),
+            ).add_to(m)
+        
+        html = m.get_root().render()
+        if html_output:
+            self._save_html(html, html_output, compress_html)
+        return html
+    
+    def create_interactive_visualization(self, min_wind_speed=5.0, figsize=(12, 10), save_path=None, html_output=None,
+                                         max_vector_polygons=500, simplify_tolerance=0.005, backend='mpld3',
+                                         compress_html=False):
         """
         Tạo biểu đồ tương tác (HTML) cho phép hover chuột để xem thông tin tốc độ gió
         (Create interactive plot (HTML) allowing mouse hover to view wind speed information)
@@ -1010,26 +1844,45 @@ class WindPotentialAnalyzer:
         figsize : tuple, optional
             Kích thước của biểu đồ (Size of the figure)
         save_path : str, optional
-            Đường dẫn để lưu hình ảnh (PNG) (Path to save the image (PNG))
+            Đường dẫn để lưu thêm ảnh PNG tĩnh (150 dpi), None để bỏ qua
+            (Path to also save a static PNG (150 dpi), None to skip it)
         html_output : str, optional
             Đường dẫn để lưu file HTML tương tác (Path to save interactive HTML file)
+        max_vector_polygons : int, optional
+            Số đa giác tối đa được vẽ dạng vector (SVG) bằng mpld3. Nếu nhiều hơn, dùng backend 'imagemap'.
+            (Maximum number of polygons drawn as vector (SVG) paths with mpld3. Above this, the 'imagemap' backend is used.)
+        simplify_tolerance : float, optional
+            Dung sai đơn giản hóa các đa giác khi vẽ, theo đơn vị của hệ tọa độ (0.005 độ ≈ 500 m).
+            Chỉ áp dụng cho bản vẽ, dữ liệu phân tích giữ nguyên. Đặt None hoặc 0 để vẽ đa giác gốc.
+            (Simplification tolerance for drawn polygons in CRS units (0.005 degrees ≈ 500 m).
+            Only the drawing is affected, the analysis data is unchanged. Set None or 0 to draw the original polygons.)
+        backend : str, optional
+            'mpld3' tạo biểu đồ matplotlib có tooltip; 'folium' tạo bản đồ web Leaflet,
+            trình duyệt chỉ vẽ các ô trong khung nhìn nên phù hợp với số ô lớn
+            ('mpld3' builds a matplotlib figure with tooltips; 'folium' builds a Leaflet web map,
+            which only paints the cells in view and so scales to many cells);
+            'imagemap' tạo một ảnh PNG kèm bản đồ ảnh HTML, không cần mpld3
+            ('imagemap' builds one PNG with an HTML image map, without mpld3)
+        compress_html : bool, optional
+            Ghi thêm bản .html.gz cạnh file HTML để phục vụ qua web (Content-Encoding: gzip)
+            (Also write a .html.gz copy next to the HTML file for web serving (Content-Encoding: gzip))
             
         Returns:
         --------
         html : str
             Mã HTML của biểu đồ tương tác
         """
-        try:
-            import mpld3
-            from mpld3 import plugins
-        except ImportError:
-            print("Thư viện mpld3 không được cài đặt. Vui lòng cài đặt bằng lệnh: pip install mpld3")
-            print("mpld3 library is not installed. Please install it using: pip install mpld3")
-            return None
-            
+        import shapely
+        
+        if backend not in ('mpld3', 'folium', 'imagemap'):
+            raise ValueError(f"Backend không hợp lệ: '{backend}'. Chọn 'mpld3', 'folium' hoặc 'imagemap'.")
+        
         if self.voronoi_polygons is None or 'wind_mean' not in self.voronoi_polygons.columns:
             raise ValueError("Chưa tính toán thống kê gió. Hãy gọi phương thức calculate_wind_statistics() trước.")
         
+        if backend == 'folium':
+            return self._create_folium_visualization(min_wind_speed, html_output, simplify_tolerance, compress_html)
+        
         # Lọc ra các khu vực có tiềm năng cao (Filter high potential areas)
         high_potential = self.filter_high_potential_areas(min_wind_speed)
         if high_potential.empty:
@@ -1040,14 +1893,32 @@ class WindPotentialAnalyzer:
         # Loại bỏ các đa giác có geometry là None
         print("Kiểm tra và làm sạch dữ liệu...")
         print("Checking and cleaning data...")
-        high_potential = high_potential[high_potential.geometry.notna()].copy()
+        # Chỉ đọc phía sau nên không cần sao chép (Only read from here on, so no copy is needed)
+        high_potential = high_potential.iloc[~shapely.is_missing(high_potential.geometry.values)]
         if high_potential.empty:
             print(f"Sau khi làm sạch dữ liệu, không còn khu vực nào có tốc độ gió >= {min_wind_speed} m/s")
             print(f"After cleaning data, no areas left with wind speed >= {min_wind_speed} m/s")
             return None
             
-        # Làm sạch voronoi_polygons
-        self.voronoi_polygons = self.voronoi_polygons[self.voronoi_polygons.geometry.notna()].copy()
+        # Làm sạch voronoi_polygons, chỉ tạo bảng mới khi thực sự có hình học rỗng
+        # (Clean voronoi_polygons, only building a new frame when geometries are actually missing)
+        missing = shapely.is_missing(self.voronoi_polygons.geometry.values)
+        if missing.any():
+            self.voronoi_polygons = self.voronoi_polygons.iloc[~missing].copy()
+        
+        # Quá nhiều đa giác cho SVG: vẽ thành một ảnh PNG kèm bản đồ ảnh
+        # (Too many polygons for SVG: render one PNG with an image map)
+        if backend == 'imagemap' or len(self.voronoi_polygons) > max_vector_polygons:
+            return self._create_imagemap_visualization(min_wind_speed, figsize, save_path, html_output,
+                                                       simplify_tolerance, compress_html)
+        
+        try:
+            import mpld3
+            from mpld3 import plugins
+        except ImportError:
+            print("Thư viện mpld3 không được cài đặt. Vui lòng cài đặt bằng lệnh: pip install mpld3")
+            print("mpld3 library is not installed. Please install it using: pip install mpld3")
+            return None
         
         fig, ax = plt.subplots(figsize=figsize)
         
@@ -1057,8 +1928,15 @@ class WindPotentialAnalyzer:
         # Lấy phạm vi hiển thị từ vùng đã chọn (Get extent from selected region)
         minx, miny, maxx, maxy = display_region.total_bounds
         
+        # Đơn giản hóa hình học chỉ để vẽ, giảm số đỉnh được ghi vào HTML
+        # (Simplify geometries for drawing only, reducing the vertices written to the HTML)
+        def simplified(gdf):
+            if not simplify_tolerance:
+                return gdf
+            return gdf.set_geometry(gdf.geometry.simplify(simplify_tolerance, preserve_topology=True))
+        
         # Hiển thị ranh giới (Display boundaries)
-        display_region.boundary.plot(ax=ax, color='red', linewidth=1.5)
+        simplified(display_region).boundary.plot(ax=ax, color='red', linewidth=1.5)
         
         # Tạo dữ liệu cho các đa giác tương tác
         # Hiển thị tất cả các đa giác voronoi với màu sắc tùy thuộc vào tốc độ gió
@@ -1073,45 +1951,25 @@ class WindPotentialAnalyzer:
         norm = Normalize(vmin=wind_min, vmax=wind_max)
         cmap = cm.viridis
         
-        # Vẽ từng đa giác với màu sắc phụ thuộc vào tốc độ gió
-        # và thêm thông tin khi hover
         print("Tạo bản đồ tương tác...")
         print("Creating interactive map...")
-        for idx, row in self.voronoi_polygons.iterrows():
-            # Kiểm tra geometry có hợp lệ không
-            if row.geometry is None or not hasattr(row.geometry, 'exterior') or row.geometry.exterior is None:
-                continue
-                
-            try:
-                color = cmap(norm(row['wind_mean']))
-                # Vẽ đa giác
-                poly = ax.fill(*row.geometry.exterior.xy, alpha=0.7, color=color, 
-                              edgecolor='none' if row['wind_mean'] < min_wind_speed else 'orange')
-                
-                # Chuẩn bị thông tin cho tooltip
-                wind_speed = round(row['wind_mean'], 2)
-                tooltip_text = f"Tốc độ gió: {wind_speed} m/s\nWind speed: {wind_speed} m/s"
-                
-                # Thêm tooltip
-                plugins.connect(fig, plugins.PointHTMLTooltip(
-                    poly[0], [tooltip_text],
-                    voffset=10, hoffset=10, css='''
-                        .mpld3-tooltip {
-                            background-color: white;
-                            border: 1px solid black;
-                            border-radius: 5px;
-                            padding: 5px;
-                            font-family: Arial, sans-serif;
-                        }
-                    '''
-                ))
-            except Exception as e:
-                print(f"Lỗi khi vẽ đa giác tại index {idx}: {e}")
-                print(f"Error drawing polygon at index {idx}: {e}")
-            
+        collection, _, _, row_index = self._cell_collection(simplified(self.voronoi_polygons), cmap, norm,
+                                                            min_wind_speed)
+        ax.add_collection(collection)
+        wind = self.voronoi_polygons['wind_mean'].to_numpy()[row_index]
+        neighbor_wind = self.neighbor_wind_means()[row_index]
+        
+        # Một tooltip cho cả tập đa giác, mỗi đa giác một nhãn
+        # (One tooltip plugin for the whole collection, one label per polygon)
+        tooltips = self._tooltip_labels(wind, neighbor_wind)
+        plugins.connect(fig, plugins.PointHTMLTooltip(
+            collection, tooltips,
+            voffset=10, hoffset=10, css=TOOLTIP_CSS
+        ))
+        
         # Đánh dấu các khu vực tiềm năng cao
         try:
-            high_potential.plot(ax=ax, color='yellow', edgecolor='orange', alpha=0.4)
+            simplified(high_potential).plot(ax=ax, color='yellow', edgecolor='orange', alpha=0.4)
         except Exception as e:
             print(f"Lỗi khi vẽ khu vực tiềm năng cao: {e}")
             print(f"Error plotting high potential areas: {e}")
@@ -1128,13 +1986,7 @@ class WindPotentialAnalyzer:
         cbar.set_label('Tốc độ gió (m/s) | Wind Speed (m/s)', fontsize=12)
         
         # Thêm tiêu đề (Add title)
-        if self.selected_region is not None and self.selected_region is not self.catchments:
-            region_name = self.selected_region['name'].values[0]
-            title = f'Bản đồ tương tác tốc độ gió và khu vực tiềm năng tại {region_name}\nInteractive Wind Speed & Potential Areas Map in {region_name}'
-        else:
-            title = f'Bản đồ tương tác tốc độ gió và khu vực tiềm năng tại Việt Nam\nInteractive Wind Speed & Potential Areas Map in Vietnam'
-        
-        ax.set_title(title, fontsize=14)
+        ax.set_title(self._map_title(), fontsize=14)
         
         # Thêm nhãn tọa độ (Add coordinate labels)
         ax.set_xlabel('Kinh độ | Longitude', fontsize=10)
@@ -1152,9 +2004,10 @@ class WindPotentialAnalyzer:
                 "Di chuyển chuột lên các vùng để xem tốc độ gió\nHover over areas to see wind speed", 
                 fontsize=10, bbox=dict(facecolor='white', alpha=0.7))
         
-        # Lưu hình ảnh PNG nếu cần
+        # Lưu hình ảnh PNG nếu cần, 150 dpi đủ cho ảnh xem trước
+        # (Save the PNG only when asked, 150 dpi is enough for a preview image)
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=150, bbox_inches='tight')
             print(f"Đã lưu biểu đồ tại: {save_path}")
             print(f"Figure saved at: {save_path}")
         
@@ -1167,10 +2020,7 @@ class WindPotentialAnalyzer:
             
             # Lưu file HTML nếu cần
             if html_output:
-                with open(html_output, 'w', encoding='utf-8') as f:
-                    f.write(html)
-                print(f"Đã lưu file HTML tương tác tại: {html_output}")
-                print(f"Interactive HTML file saved at: {html_output}")
+                self._save_html(html, html_output, compress_html)
         except Exception as e:
             print(f"Lỗi khi tạo HTML tương tác: {e}")
             print(f"Error creating interactive HTML: {e}")
@@ -1206,6 +2056,9 @@ def parse_args():
     parser.add_argument('--points', type=int, default=100,
                         help='Số điểm để tạo đa giác Voronoi (mặc định: 100) / Number of points to create Voronoi polygons (default: 100)')
     
+    parser.add_argument('--voronoi-backend', type=str, default='scipy', choices=['scipy', 'raster'],
+                        help="Cách tạo đa giác Voronoi: 'scipy' hoặc 'raster' (nhanh hơn khi có hàng nghìn điểm) / Voronoi construction method: 'scipy' or 'raster' (faster for thousands of points)")
+    
     parser.add_argument('--min-speed', type=float, default=6.0,
                         help='Tốc độ gió tối thiểu để một khu vực được coi là có tiềm năng cao (mặc định: 6.0 m/s) / Minimum wind speed for high potential areas (default: 6.0 m/s)')
     
@@ -1215,56 +2068,46 @@ def parse_args():
     parser.add_argument('--no-plots', action='store_true',
                         help='Không tạo biểu đồ (mặc định: False) / Do not create plots (default: False)')
     
+    parser.add_argument('--gzip-html', action='store_true',
+                        help='Ghi thêm bản .html.gz của bản đồ tương tác / Also write a .html.gz copy of the interactive map')
+    
+    parser.add_argument('--static', action='store_true',
+                        help='Lưu thêm ảnh PNG tĩnh (150 dpi) của bản đồ tương tác / Also save a static PNG (150 dpi) of the interactive map')
+    
+    parser.add_argument('--all-regions', action='store_true',
+                        help='Phân tích song song tất cả tỉnh/thành phố (cần --provinces) / Analyze every province/city in parallel (requires --provinces)')
+    
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Số tiến trình song song cho --all-regions (mặc định: một nửa số lõi CPU) / Number of parallel processes for --all-regions (default: half the CPU cores)')
+    
     parser.add_argument('--list-regions', action='store_true',
                         help='Liệt kê các tỉnh/thành phố có sẵn và thoát / List available provinces/cities and exit')
     
     return parser.parse_args()
 
-def main():
-    """
-    Hàm chính để chạy phân tích tiềm năng gió
-    (Main function to run wind potential analysis)
+def run_analysis(analyzer, args, region=None):
     """
-    args = parse_args()
-    
-    # Tạo thư mục đầu ra nếu chưa tồn tại (Create output directory if it doesn't exist)
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Tạo đối tượng phân tích tiềm năng gió (Create wind potential analyzer object)
-    analyzer = WindPotentialAnalyzer()
-    
-    # Đọc dữ liệu (Read data)
-    analyzer.load_data(args.boundary, args.wind)
-    
-    # Đọc dữ liệu tỉnh/thành phố nếu có (Read province data if provided)
-    if args.provinces:
-        analyzer.load_provinces(args.provinces)
-        
-        # Liệt kê các tỉnh/thành phố và thoát nếu chỉ định
-        if args.list_regions:
-            regions = analyzer.list_available_regions()
-            print("\nCác tỉnh/thành phố có sẵn để phân tích / Available provinces/cities for analysis:")
-            for region in regions:
-                print(f"  - {region}")
-            return
-    
-    # Chọn vùng cụ thể nếu có (Select specific region if provided)
-    if args.region:
-        if not args.provinces:
-            print("Lỗi: Cần cung cấp file ranh giới tỉnh/thành phố (--provinces) khi chọn vùng cụ thể.")
-            print("Error: Need to provide provinces boundary file (--provinces) when selecting a specific region.")
-            return
-        analyzer.select_region(args.region)
+    Chạy toàn bộ các bước phân tích cho vùng đã chọn trong analyzer
+    (Run every analysis step for the region selected in the analyzer)
     
+    Parameters:
+    -----------
+    analyzer : WindPotentialAnalyzer
+        Đối tượng phân tích đã tải dữ liệu và chọn vùng (Analyzer with data loaded and region selected)
+    args : argparse.Namespace
+        Tham số dòng lệnh (Command line arguments)
+    region : str, optional
+        Tên tỉnh/thành phố, dùng trong tên file đầu ra (Province/city name, used in output file names)
+    """
     # Tạo biểu đồ dữ liệu gió và ranh giới (Create wind data and boundary plot)
     if not args.no_plots:
-        region_suffix = f"_{args.region.lower().replace(' ', '_')}" if args.region else ""
-        wind_data_plot_path = output_dir / f"{args.prefix}{region_suffix}_data.png"
+        region_suffix = f"_{region.lower().replace(' ', '_')}" if region else ""
+        wind_data_plot_path = Path(args.output) / f"{args.prefix}{region_suffix}_data.png"
         analyzer.visualize_wind_data(save_path=wind_data_plot_path)
     
     # Tạo các đa giác Voronoi (Create Voronoi polygons)
-    analyzer.create_voronoi_polygons(num_points=args.points)
+    analyzer.create_voronoi_polygons(num_points=args.points, backend=args.voronoi_backend,
+                                     cache_dir=Path(args.output) / '.cache')
     
     # Tính toán thống kê gió (Calculate wind statistics)
     analyzer.calculate_wind_statistics()
@@ -1278,8 +2121,8 @@ def main():
     
     # Tạo biểu đồ các khu vực có tiềm năng cao (Create high potential areas plot)
     if not args.no_plots:
-        region_suffix = f"_{args.region.lower().replace(' ', '_')}" if args.region else ""
-        high_potential_plot_path = output_dir / f"{args.prefix}{region_suffix}_high_potential_{args.min_speed}ms.png"
+        region_suffix = f"_{region.lower().replace(' ', '_')}" if region else ""
+        high_potential_plot_path = Path(args.output) / f"{args.prefix}{region_suffix}_high_potential_{args.min_speed}ms.png"
         analyzer.visualize_high_potential_areas(
             min_wind_speed=args.min_speed,
             save_path=high_potential_plot_path
@@ -1294,13 +2137,114 @@ def main():
     
     # Tạo biểu đồ tương tác (HTML) cho phép hover chuột để xem thông tin tốc độ gió
     if not args.no_plots:
-        region_suffix = f"_{args.region.lower().replace(' ', '_')}" if args.region else ""
-        interactive_html_path = output_dir / f"{args.prefix}{region_suffix}_interactive.html"
+        region_suffix = f"_{region.lower().replace(' ', '_')}" if region else ""
+        interactive_html_path = Path(args.output) / f"{args.prefix}{region_suffix}_interactive.html"
         analyzer.create_interactive_visualization(
             min_wind_speed=args.min_speed,
-            save_path=None,
-            html_output=interactive_html_path
+            save_path=interactive_html_path.with_suffix('.png') if args.static else None,
+            html_output=interactive_html_path,
+            compress_html=args.gzip_html
         )
+
+# Đối tượng phân tích của mỗi tiến trình con, chỉ đọc dữ liệu một lần
+# (Per-worker analyzer, data is read only once per process)
+_worker_analyzer = None
+
+def _init_region_worker(boundary_file, wind_file, province_file):
+    """
+    Khởi tạo tiến trình con: đọc dữ liệu một lần và dùng một luồng GDAL
+    (Initialize a worker process: read the data once and use a single GDAL thread)
+    """
+    global _worker_analyzer
+    os.environ['GDAL_NUM_THREADS'] = '1'
+    _worker_analyzer = WindPotentialAnalyzer()
+    _worker_analyzer.load_data(boundary_file, wind_file)
+    _worker_analyzer.load_provinces(province_file)
+
+def _analyze_region_job(region, args):
+    """
+    Phân tích một tỉnh/thành phố trong tiến trình con
+    (Analyze one province/city inside a worker process)
+    """
+    _worker_analyzer.selected_region = None
+    _worker_analyzer.voronoi_polygons = None
+    _worker_analyzer.select_region(region)
+    run_analysis(_worker_analyzer, args, region)
+    plt.close('all')
+    return region
+
+def analyze_all_regions(regions, args):
+    """
+    Phân tích song song tất cả tỉnh/thành phố, mỗi tiến trình đọc dữ liệu một lần
+    (Analyze every province/city in parallel, each process reads the data once)
+    
+    Parameters:
+    -----------
+    regions : list of str
+        Tên các tỉnh/thành phố (Province/city names)
+    args : argparse.Namespace
+        Tham số dòng lệnh (Command line arguments)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    jobs = args.jobs or max(1, (os.cpu_count() or 2) // 2)
+    print(f"\n=== Phân tích {len(regions)} tỉnh/thành phố với {jobs} tiến trình / Analyzing {len(regions)} provinces with {jobs} processes ===\n")
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_region_worker,
+                             initargs=(args.boundary, args.wind, args.provinces)) as executor:
+        completed = list(executor.map(_analyze_region_job, regions, [args] * len(regions)))
+    
+    print(f"\nĐã phân tích xong {len(completed)} tỉnh/thành phố / Finished analyzing {len(completed)} provinces")
+    return completed
+
+def main():
+    """
+    Hàm chính để chạy phân tích tiềm năng gió
+    (Main function to run wind potential analysis)
+    """
+    args = parse_args()
+    
+    # Tạo thư mục đầu ra nếu chưa tồn tại (Create output directory if it doesn't exist)
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Tạo đối tượng phân tích tiềm năng gió (Create wind potential analyzer object)
+    analyzer = WindPotentialAnalyzer()
+    
+    # Đọc dữ liệu (Read data)
+    analyzer.load_data(args.boundary, args.wind)
+    
+    # Đọc dữ liệu tỉnh/thành phố nếu có (Read province data if provided)
+    if args.provinces:
+        analyzer.load_provinces(args.provinces)
+        
+        # Liệt kê các tỉnh/thành phố và thoát nếu chỉ định
+        if args.list_regions:
+            regions = analyzer.list_available_regions()
+            print("\nCác tỉnh/thành phố có sẵn để phân tích / Available provinces/cities for analysis:")
+            for region in regions:
+                print(f"  - {region}")
+            return
+    
+    # Phân tích song song tất cả tỉnh/thành phố (Analyze every province/city in parallel)
+    if args.all_regions:
+        if not args.provinces:
+            print("Lỗi: Cần cung cấp file ranh giới tỉnh/thành phố (--provinces) khi dùng --all-regions.")
+            print("Error: Need to provide provinces boundary file (--provinces) when using --all-regions.")
+            return
+        analyze_all_regions(analyzer.list_available_regions(), args)
+        print(f"Kết quả đã được lưu vào thư mục: {args.output} / Results saved to directory: {args.output}")
+        return
+    
+    # Chọn vùng cụ thể nếu có (Select specific region if provided)
+    if args.region:
+        if not args.provinces:
+            print("Lỗi: Cần cung cấp file ranh giới tỉnh/thành phố (--provinces) khi chọn vùng cụ thể.")
+            print("Error: Need to provide provinces boundary file (--provinces) when selecting a specific region.")
+            return
+        analyzer.select_region(args.region)
+    
+    run_analysis(analyzer, args, args.region)
     
     print("\nPhân tích tiềm năng gió đã hoàn tất! / Wind potential analysis completed!")
     print(f"Kết quả đã được lưu vào thư mục: {args.output} / Results saved to directory: {args.output}")